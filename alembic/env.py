@@ -14,9 +14,10 @@ from alembic import context
 from src.core.database import Base
 from src.core.config import settings
 
-from src.modules.catalogo.infrastructure.models import ProductModel
+from src.modules.catalogo.infrastructure.models import ProductModel, SEARCH_VECTOR_COLUMN, SEARCH_VECTOR_INDEX
 from src.modules.pedidos.infrastructure.models import OrderModel, OrderItemModel
 from src.modules.usuarios.infrastructure.models import UserModel, RoleModel, PermissionModel
+from src.core.events.outbox import OutboxEventModel
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -31,6 +32,13 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Excluye de autogenerate los objetos gestionados solo por migración."""
+    if reflected and compare_to is None and name in (SEARCH_VECTOR_COLUMN, SEARCH_VECTOR_INDEX):
+        return False
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -56,6 +64,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -63,7 +72,7 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=target_metadata, include_object=include_object)
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,32 @@
+"""Add keyset pagination indexes
+
+Revision ID: c4e9a7b2d1f0
+Revises: 8b3f2c1d4e5a
+Create Date: 2026-10-16 23:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e9a7b2d1f0'
+down_revision: Union[str, None] = '8b3f2c1d4e5a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_products_created_at_product_id', 'products', ['created_at', 'product_id'], unique=False)
+    op.create_index('ix_orders_created_at_order_id', 'orders', ['created_at', 'order_id'], unique=False)
+    op.create_index(
+        'ix_orders_customer_created_at_order_id', 'orders', ['customer_id', 'created_at', 'order_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_orders_customer_created_at_order_id', table_name='orders')
+    op.drop_index('ix_orders_created_at_order_id', table_name='orders')
+    op.drop_index('ix_products_created_at_product_id', table_name='products')
@@ -0,0 +1,51 @@
+"""Add product full-text search vector and GIN index
+
+Revision ID: d7a1e5c3b9f2
+Revises: c4e9a7b2d1f0
+Create Date: 2026-10-17 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a1e5c3b9f2'
+down_revision: Union[str, None] = 'c4e9a7b2d1f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Todo el vector con el diccionario de la consulta (websearch_to_tsquery('spanish', ...)):
+# con otro diccionario en el SKU, el stemming o las stopwords de la consulta podrían
+# impedir que sus lexemas coincidieran.
+# El peso A prioriza coincidencias en SKU y nombre sobre la descripción (B).
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('spanish', coalesce(sku, '')), 'A') || "
+    "setweight(to_tsvector('spanish', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('spanish', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # Columna generada STORED: PostgreSQL la recalcula en cada INSERT/UPDATE
+    op.add_column(
+        'products',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True
+        )
+    )
+    op.create_index(
+        'ix_products_search_vector', 'products', ['search_vector'], unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_products_search_vector', table_name='products', postgresql_using='gin')
+    op.drop_column('products', 'search_vector')
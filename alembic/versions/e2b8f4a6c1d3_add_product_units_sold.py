@@ -0,0 +1,40 @@
+"""Add units_sold to products for autocomplete popularity
+
+Revision ID: e2b8f4a6c1d3
+Revises: d7a1e5c3b9f2
+Create Date: 2026-10-17 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b8f4a6c1d3'
+down_revision: Union[str, None] = 'd7a1e5c3b9f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('products', sa.Column('units_sold', sa.Integer(), nullable=False, server_default='0'))
+    # Popularidad histórica: unidades de pedidos no cancelados
+    op.execute(
+        """
+        UPDATE products SET units_sold = sold.quantity
+        FROM (
+            SELECT oi.product_id, SUM(oi.quantity) AS quantity
+            FROM order_items oi
+            JOIN orders o ON o.order_id = oi.order_id
+            WHERE o.status <> 'cancelled'
+            GROUP BY oi.product_id
+        ) AS sold
+        WHERE products.product_id = sold.product_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('products', 'units_sold')
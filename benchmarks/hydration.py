@@ -0,0 +1,125 @@
+"""
+Benchmark: hidratación de 10k filas (validada vs. de confianza).
+
+Compara el mapeo anterior (constructores con validación y __post_init__)
+con `hydrate` para productos y órdenes, sobre modelos ORM ya cargados en
+memoria: mide solo el mapeo, no la consulta.
+
+Uso:
+    python -m benchmarks.hydration [filas] [repeticiones]
+"""
+import sys
+import timeit
+import uuid
+from datetime import datetime
+
+from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.domain.value_objects import SKU, Price, Stock
+from src.modules.catalogo.infrastructure.mappers import ProductMapper
+from src.modules.catalogo.infrastructure.models import ProductModel
+from src.modules.pedidos.domain.entities import Order, OrderItem
+from src.modules.pedidos.domain.value_objects import Address, CustomerInfo, OrderStatus, Quantity
+from src.modules.pedidos.infrastructure.models import OrderItemModel, OrderModel, OrderStatusEnum
+from src.modules.pedidos.infrastructure.repositories import SQLAlchemyOrderRepository
+
+
+def product_rows(count: int):
+    now = datetime.utcnow()
+    return [
+        ProductModel(
+            product_id=uuid.uuid4(), sku=f"BENCH-{i:08d}", name=f"Producto de prueba {i}",
+            description="Descripción del producto de prueba", price_amount=19.99, price_currency="USD",
+            stock_quantity=100, is_active=True, created_at=now, updated_at=now, version=1
+        )
+        for i in range(count)
+    ]
+
+
+def order_rows(count: int):
+    now = datetime.utcnow()
+    rows = []
+    for i in range(count):
+        order = OrderModel(
+            order_id=uuid.uuid4(), customer_id=f"CUST-{i}", customer_name="Cliente de prueba",
+            customer_email="cliente@example.com", customer_phone="3001234567",
+            shipping_street="Calle 123 # 45-67", shipping_city="Medellin", shipping_state="Antioquia",
+            shipping_postal_code="050010", shipping_country="Colombia", status=OrderStatusEnum.pending,
+            total_amount=59.97, created_at=now, updated_at=now, confirmed_at=None, cancelled_at=None, version=1
+        )
+        order.items = [
+            OrderItemModel(product_id=uuid.uuid4(), product_name="Producto", quantity=3, unit_price=19.99)
+        ]
+        rows.append(order)
+    return rows
+
+
+def validated_product(model: ProductModel) -> Product:
+    """Mapeo anterior: reconstruye y revalida cada VO."""
+    return Product(
+        product_id=model.product_id,
+        sku=SKU(value=model.sku),
+        name=model.name,
+        description=model.description,
+        price=Price(amount=model.price_amount, currency=model.price_currency),
+        stock=Stock(quantity=model.stock_quantity),
+        is_active=model.is_active,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+        version=model.version
+    )
+
+
+def validated_order(model: OrderModel) -> Order:
+    """Mapeo anterior: revalida VOs y ejecuta Order.__post_init__ (total + evento)."""
+    return Order(
+        order_id=model.order_id,
+        customer_info=CustomerInfo(
+            customer_id=model.customer_id, name=model.customer_name,
+            email=model.customer_email, phone=model.customer_phone
+        ),
+        items=[
+            OrderItem(
+                product_id=item.product_id, product_name=item.product_name,
+                quantity=Quantity(value=item.quantity), unit_price=item.unit_price
+            )
+            for item in model.items
+        ],
+        shipping_address=Address(
+            street=model.shipping_street, city=model.shipping_city, state=model.shipping_state,
+            postal_code=model.shipping_postal_code, country=model.shipping_country
+        ),
+        status=OrderStatus(model.status.value),
+        total_amount=model.total_amount,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+        confirmed_at=model.confirmed_at,
+        cancelled_at=model.cancelled_at,
+        version=model.version
+    )
+
+
+def best_of(func, rows, repeat: int) -> float:
+    return min(timeit.repeat(lambda: [func(row) for row in rows], number=1, repeat=repeat))
+
+
+def main(count: int = 10_000, repeat: int = 5) -> None:
+    products = product_rows(count)
+    orders = order_rows(count)
+    order_repository = SQLAlchemyOrderRepository(session=None)
+
+    cases = [
+        ("Product", validated_product, ProductMapper.to_domain, products),
+        ("Order", validated_order, order_repository._to_domain, orders),
+    ]
+    print(f"{count} filas, mejor de {repeat} repeticiones")
+    for name, before, after, rows in cases:
+        validated = best_of(before, rows, repeat)
+        trusted = best_of(after, rows, repeat)
+        print(
+            f"{name:<8} validado {validated * 1000:8.2f} ms | "
+            f"confianza {trusted * 1000:8.2f} ms | x{validated / trusted:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
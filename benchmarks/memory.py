@@ -0,0 +1,95 @@
+"""
+Benchmark: memoria de las entidades y value objects del dominio.
+
+Compara las dataclasses con __slots__ del dominio con equivalentes sin
+slots (mismos campos, generadas con `dataclasses.make_dataclass`). Mide con
+tracemalloc los bytes que ocupan N productos y N órdenes con sus value
+objects anidados; los valores de los campos (strings, UUIDs, fechas) se
+crean antes de medir y se comparten, así que solo cuentan los objetos.
+
+Uso:
+    python -m benchmarks.memory [objetos]
+"""
+import dataclasses
+import sys
+import tracemalloc
+import uuid
+from datetime import datetime
+from typing import Callable, Dict
+
+from src.core.hydration import hydrator
+from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.domain.value_objects import SKU, Price, Stock
+from src.modules.pedidos.domain.entities import Order, OrderItem
+from src.modules.pedidos.domain.value_objects import Address, CustomerInfo, OrderStatus, Quantity
+
+
+_unslotted: Dict[type, type] = {}
+
+
+def unslotted(cls: type) -> Callable:
+    """Constructor de una dataclass con los mismos campos que `cls` pero con __dict__."""
+    if cls not in _unslotted:
+        _unslotted[cls] = dataclasses.make_dataclass(
+            f"Unslotted{cls.__name__}", [f.name for f in dataclasses.fields(cls)]
+        )
+    return _unslotted[cls]
+
+
+def build_products(values, make: Callable[[type], Callable]):
+    product, sku, price, stock = make(Product), make(SKU), make(Price), make(Stock)
+    return [
+        product(
+            product_id=product_id, sku=sku(value=code), name=name, description="",
+            price=price(amount=19.99, currency="USD"), stock=stock(quantity=100), is_active=True, created_at=now, updated_at=now, version=1
+        )
+        for product_id, code, name, now in values
+    ]
+
+
+def build_orders(values, make: Callable[[type], Callable]):
+    order, item, quantity = make(Order), make(OrderItem), make(Quantity)
+    customer, address = make(CustomerInfo), make(Address)
+    return [
+        order(
+            order_id=order_id,
+            customer_info=customer(customer_id=customer_id, name="Cliente", email="c@example.com", phone="3001234567"),
+            items=[item(product_id=product_id, product_name="Producto", quantity=quantity(value=3), unit_price=19.99)],
+            shipping_address=address(
+                street="Calle 123 # 45-67", city="Medellin", state="Antioquia", postal_code="050010", country="Colombia"
+            ),
+            status=OrderStatus.PENDING, total_amount=59.97, created_at=now, updated_at=now,
+            confirmed_at=None, cancelled_at=None, version=1, domain_events=[]
+        )
+        for order_id, customer_id, product_id, now in values
+    ]
+
+
+def measure(build: Callable, values, make: Callable[[type], Callable]) -> int:
+    """Bytes asignados (y retenidos) al construir los objetos."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build(values, make)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return after - before
+
+
+def main(count: int = 10_000) -> None:
+    now = datetime.utcnow()
+    products = [(uuid.uuid4(), f"BENCH-{i:08d}", f"Producto {i}", now) for i in range(count)]
+    orders = [(uuid.uuid4(), f"CUST-{i}", uuid.uuid4(), now) for i in range(count)]
+
+    print(f"{count} objetos raíz (con sus value objects anidados)")
+    for name, build, values in (("Product", build_products, products), ("Order", build_orders, orders)):
+        plain = measure(build, values, unslotted)
+        slotted = measure(build, values, hydrator)
+        print(
+            f"{name:<8} sin slots {plain / count:7.1f} B/obj | "
+            f"con slots {slotted / count:7.1f} B/obj | -{(1 - slotted / plain) * 100:.0f}%"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,155 @@
+"""
+Caché en memoria del proceso con desalojo LRU y expiración por TTL.
+
+Pensada para lecturas calientes (p. ej. el detalle de producto): cada worker
+tiene su propia copia, por lo que el TTL acota cuánto puede tardar en verse
+un cambio hecho desde otro proceso. Dentro del proceso, las escrituras
+invalidan las entradas afectadas al hacer commit.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+# Marca para las búsquedas sin resultado (caché negativa)
+MISSING = object()
+
+
+class TTLCache:
+    """
+    Caché LRU acotada con TTL por entrada.
+
+    - Al superar `max_size` se desaloja la entrada menos usada recientemente
+    - Las entradas caducan a los `ttl_seconds` (o `negative_ttl_seconds` si
+      registran una búsqueda sin resultado)
+    """
+
+    def __init__(self, name: str, max_size: int, ttl_seconds: float, negative_ttl_seconds: float = 0):
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Busca una entrada vigente.
+
+        Returns:
+            (encontrada, valor). El valor es MISSING si la entrada registra
+            que el elemento no existe.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        if value is MISSING:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        return True, value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Guarda un valor (o MISSING para una búsqueda sin resultado)."""
+        ttl = self.negative_ttl_seconds if value is MISSING else self.ttl_seconds
+        if ttl <= 0 or self.max_size <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Elimina las entradas indicadas."""
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Vacía la caché."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Retorna los contadores y la ocupación de la caché."""
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "negative_ttl_seconds": self.negative_ttl_seconds,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+# Registro de cachés por nombre (para el endpoint de métricas)
+_registry: Dict[str, TTLCache] = {}
+
+
+def create_cache(name: str, max_size: int, ttl_seconds: float, negative_ttl_seconds: float = 0) -> TTLCache:
+    """Crea una caché y la registra por nombre."""
+    cache = _registry[name] = TTLCache(name, max_size, ttl_seconds, negative_ttl_seconds)
+    return cache
+
+
+def get_cache(name: str) -> Optional[TTLCache]:
+    """Retorna la caché registrada con el nombre dado."""
+    return _registry.get(name)
+
+
+def snapshot_all() -> Dict[str, Dict[str, Any]]:
+    """Retorna la foto de todas las cachés registradas."""
+    return {name: cache.snapshot() for name, cache in _registry.items()}
+
+
+# ==================== Invalidación al hacer commit ====================
+
+def invalidate_on_commit(session, cache: TTLCache, keys: Iterable[Hashable]) -> None:
+    """
+    Invalida las claves ahora y de nuevo cuando la transacción haga commit.
+
+    La segunda invalidación descarta lo que otro request haya cacheado con
+    el valor anterior mientras esta transacción seguía abierta.
+    """
+    keys = list(keys)
+    cache.invalidate(*keys)
+    session.info.setdefault("cache_invalidations", []).append((cache, keys))
+
+
+@event.listens_for(Session, "after_commit")
+def _on_after_commit(session: Session) -> None:
+    for cache, keys in session.info.pop("cache_invalidations", []):
+        cache.invalidate(*keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_after_rollback(session: Session) -> None:
+    session.info.pop("cache_invalidations", None)
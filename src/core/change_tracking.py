@@ -0,0 +1,106 @@
+"""
+Seguimiento de cambios (dirty tracking) de entidades.
+
+Las entidades hidratadas desde la base de datos registran qué campos se
+reasignan. Al actualizarlas, el repositorio escribe solo las columnas de esos
+campos: un cambio de estado de una orden no reescribe las columnas del
+cliente ni de la dirección. En PostgreSQL eso reduce el WAL y, si no se toca
+ninguna columna indexada, permite actualizaciones HOT.
+
+Los cambios se detectan por asignación del campo (los value objects son
+inmutables y se reemplazan); las mutaciones en sitio de una lista no se
+detectan. Las entidades creadas con su constructor no registran cambios:
+para ellas se escriben todas las columnas.
+
+    @dataclass(slots=True)
+    class Product(ChangeTracking):
+        ...
+
+    changed_fields(product)  # frozenset({"price", "updated_at"})
+"""
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+
+# Entidad sin cambios (compartido: una entidad limpia no reserva memoria extra)
+_CLEAN: FrozenSet[str] = frozenset()
+
+# Slots de cada clase (incluidos los heredados), para copiarlas
+_slot_names: Dict[type, Tuple[str, ...]] = {}
+
+
+class ChangeTracking:
+    """
+    Base de las entidades con seguimiento de cambios.
+
+    Solo añade un slot: None mientras no se rastrea (entidad nueva) y el
+    conjunto de campos asignados desde la carga en caso contrario.
+    """
+    __slots__ = ("_changes",)
+
+    def __new__(cls, *args: Any, **kwargs: Any):
+        entity = object.__new__(cls)
+        _set_changes(entity, None)
+        return entity
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        changes = self._changes
+        if changes is not None and name not in changes:
+            _set_changes(self, changes | {name})
+
+    def __copy__(self):
+        """Copia los slots sin pasar por `__setattr__` (la copia no hereda cambios falsos)."""
+        cls = type(self)
+        names = _slot_names.get(cls)
+        if names is None:
+            names = _slot_names[cls] = tuple(
+                name for klass in cls.__mro__ for name in klass.__dict__.get("__slots__", ())
+            )
+        clone = object.__new__(cls)
+        for name in names:
+            try:
+                object.__setattr__(clone, name, getattr(self, name))
+            except AttributeError:
+                pass  # Slot sin valor
+        return clone
+
+
+_set_changes = ChangeTracking._changes.__set__
+
+
+def mark_clean(entity: ChangeTracking) -> None:
+    """Empieza (o reinicia) el registro: a partir de aquí la entidad no tiene cambios."""
+    _set_changes(entity, _CLEAN)
+
+
+def changed_fields(entity: ChangeTracking) -> Optional[FrozenSet[str]]:
+    """
+    Campos asignados desde la carga (o desde el último `mark_clean`).
+
+    Retorna None si la entidad no se rastrea (no se sabe qué cambió).
+    """
+    return getattr(entity, "_changes", None)
+
+
+def changed_values(
+    entity: ChangeTracking,
+    values: Dict[str, Any],
+    columns_by_field: Dict[str, Iterable[str]]
+) -> Dict[str, Any]:
+    """
+    Reduce `values` (columna -> valor, todas las columnas editables) a las
+    columnas de los campos modificados. Si la entidad no se rastrea retorna `values`.
+
+    Args:
+        entity: Entidad a persistir
+        values: Valores de todas las columnas editables
+        columns_by_field: Columnas en las que se guarda cada campo de la entidad
+    """
+    fields = changed_fields(entity)
+    if fields is None:
+        return values
+    return {
+        column: values[column]
+        for field in fields
+        for column in columns_by_field.get(field, ())
+    }
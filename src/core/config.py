@@ -2,6 +2,7 @@
 Configuración de la aplicación usando pydantic-settings.
 """
 import os
+from typing import List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -24,6 +25,37 @@ class Settings(BaseSettings):
     # DATABASE_URL can still be provided directly to override everything
     database_url: str = Field(default_factory=lambda: os.getenv("DATABASE_URL", ""))
     
+    # Pool de conexiones
+    db_pool_size: int = Field(default_factory=lambda: int(os.getenv("DB_POOL_SIZE", "5")))
+    db_max_overflow: int = Field(default_factory=lambda: int(os.getenv("DB_MAX_OVERFLOW", "10")))
+    db_pool_timeout: float = Field(default_factory=lambda: float(os.getenv("DB_POOL_TIMEOUT", "30")))
+    db_pool_recycle: int = Field(default_factory=lambda: int(os.getenv("DB_POOL_RECYCLE", "1800")))
+    db_pool_pre_ping: bool = Field(default_factory=lambda: os.getenv("DB_POOL_PRE_PING", "True").lower() == "true")
+    
+    # Réplicas de lectura (URLs separadas por comas; vacío = todo va al primario)
+    database_replica_urls: str = Field(default_factory=lambda: os.getenv("DATABASE_REPLICA_URLS", ""))
+    db_replica_strategy: str = Field(default_factory=lambda: os.getenv("DB_REPLICA_STRATEGY", "round_robin"))
+    # Segundos tras una escritura en los que las lecturas del mismo cliente van al primario (0 = desactivado)
+    read_your_writes_seconds: float = Field(default_factory=lambda: float(os.getenv("READ_YOUR_WRITES_SECONDS", "0")))
+    
+    # Caché de productos en memoria (LRU + TTL, por proceso)
+    product_cache_enabled: bool = Field(default_factory=lambda: os.getenv("PRODUCT_CACHE_ENABLED", "True").lower() == "true")
+    product_cache_size: int = Field(default_factory=lambda: int(os.getenv("PRODUCT_CACHE_SIZE", "10000")))
+    product_cache_ttl: float = Field(default_factory=lambda: float(os.getenv("PRODUCT_CACHE_TTL", "30")))
+    product_cache_negative_ttl: float = Field(default_factory=lambda: float(os.getenv("PRODUCT_CACHE_NEGATIVE_TTL", "5")))
+    
+    # Índice de autocompletado de productos en memoria (por proceso, se carga al arrancar)
+    product_autocomplete_enabled: bool = Field(default_factory=lambda: os.getenv("PRODUCT_AUTOCOMPLETE_ENABLED", "True").lower() == "true")
+    
+    # Índice de búsqueda de productos en memoria (por proceso, se carga al arrancar)
+    product_search_index_enabled: bool = Field(default_factory=lambda: os.getenv("PRODUCT_SEARCH_INDEX_ENABLED", "False").lower() == "true")
+    product_search_index_batch_size: int = Field(default_factory=lambda: int(os.getenv("PRODUCT_SEARCH_INDEX_BATCH_SIZE", "1000")))
+    
+    # Importación masiva de productos: registros válidos por lote (una consulta de SKUs y una escritura por lote)
+    product_import_batch_size: int = Field(default_factory=lambda: int(os.getenv("PRODUCT_IMPORT_BATCH_SIZE", "1000")))
+    # Exportación del catálogo: filas por lote leído del cursor del servidor (y por bloque enviado)
+    product_export_batch_size: int = Field(default_factory=lambda: int(os.getenv("PRODUCT_EXPORT_BATCH_SIZE", "1000")))
+    
     # Security
     secret_key: str = Field(default_factory=lambda: os.getenv("SECRET_KEY", "your-super-secret-key-for-dev-only"))
     algorithm: str = "HS256"
@@ -35,7 +67,28 @@ class Settings(BaseSettings):
     
     # API
     api_v1_prefix: str = "/api/v1"
-    
+
+    # Concurrencia optimista (reintentos ante conflictos de versión)
+    concurrency_retry_attempts: int = Field(default_factory=lambda: int(os.getenv("CONCURRENCY_RETRY_ATTEMPTS", "3")))
+    concurrency_retry_base_delay: float = Field(default_factory=lambda: float(os.getenv("CONCURRENCY_RETRY_BASE_DELAY", "0.01")))
+    concurrency_retry_max_delay: float = Field(default_factory=lambda: float(os.getenv("CONCURRENCY_RETRY_MAX_DELAY", "0.2")))
+
+    # Bus de eventos (inline | background) y política con la cola llena (block | drop | spill)
+    event_bus_mode: str = Field(default_factory=lambda: os.getenv("EVENT_BUS_MODE", "background"))
+    event_bus_queue_size: int = Field(default_factory=lambda: int(os.getenv("EVENT_BUS_QUEUE_SIZE", "1000")))
+    event_bus_workers: int = Field(default_factory=lambda: int(os.getenv("EVENT_BUS_WORKERS", "4")))
+    event_bus_handler_timeout: float = Field(default_factory=lambda: float(os.getenv("EVENT_BUS_HANDLER_TIMEOUT", "5")))
+    event_bus_overflow: str = Field(default_factory=lambda: os.getenv("EVENT_BUS_OVERFLOW", "block"))
+    event_bus_spill_path: str = Field(default_factory=lambda: os.getenv("EVENT_BUS_SPILL_PATH", "logs/event_spill.jsonl"))
+
+    # Outbox transaccional (relay que entrega los eventos persistidos)
+    outbox_relay_enabled: bool = Field(default_factory=lambda: os.getenv("OUTBOX_RELAY_ENABLED", "True").lower() == "true")
+    outbox_batch_size: int = Field(default_factory=lambda: int(os.getenv("OUTBOX_BATCH_SIZE", "100")))
+    outbox_poll_interval: float = Field(default_factory=lambda: float(os.getenv("OUTBOX_POLL_INTERVAL", "1")))
+    outbox_lease_seconds: float = Field(default_factory=lambda: float(os.getenv("OUTBOX_LEASE_SECONDS", "60")))
+    outbox_retry_backoff: float = Field(default_factory=lambda: float(os.getenv("OUTBOX_RETRY_BACKOFF", "1")))
+    outbox_retry_max_backoff: float = Field(default_factory=lambda: float(os.getenv("OUTBOX_RETRY_MAX_BACKOFF", "300")))
+
     @property
     def get_database_url(self) -> str:
         """
@@ -46,6 +99,11 @@ class Settings(BaseSettings):
             return self.database_url
             
         return f"postgresql://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
+    
+    @property
+    def get_replica_urls(self) -> List[str]:
+        """Retorna la lista de URLs de réplicas de lectura configuradas."""
+        return [url.strip() for url in self.database_replica_urls.split(",") if url.strip()]
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -2,7 +2,51 @@
 Contenedor de Inyección de Dependencias (DI).
 Patrón Composition Root para gestionar dependencias.
 """
-from typing import Callable, Dict, Any
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_db_session, get_read_session
+
+
+class Lifetime(str, Enum):
+    """
+    Ciclo de vida de un servicio registrado.
+
+    - SINGLETON: una única instancia por proceso (casos de uso sin estado, facades)
+    - SCOPED: una instancia por request (sesiones, repositorios, gateways)
+    - TRANSIENT: una instancia nueva en cada resolve
+    """
+    SINGLETON = "singleton"
+    SCOPED = "scoped"
+    TRANSIENT = "transient"
+
+
+# Instancias del scope activo (una por request/tarea)
+_current_scope: ContextVar[Optional[Dict[str, Any]]] = ContextVar("di_scope", default=None)
+
+
+class ScopedProxy:
+    """
+    Referencia a un servicio SCOPED que se resuelve en cada acceso.
+
+    Permite que un singleton (p. ej. un caso de uso) dependa de un servicio
+    por request: el proxy delega en la instancia del scope activo.
+    """
+
+    def __init__(self, container: "DIContainer", name: str):
+        self._container = container
+        self._name = name
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._container.resolve(self._name), attribute)
+
+    def __repr__(self) -> str:
+        return f"<ScopedProxy '{self._name}'>"
 
 
 class DIContainer:
@@ -10,26 +54,97 @@ class DIContainer:
     Contenedor simple de DI para gestionar dependencias.
     Cada módulo registrará sus propias dependencias.
     """
-    
+
     def __init__(self):
         self._services: Dict[str, Callable] = {}
-    
-    def register(self, name: str, factory: Callable):
+        self._lifetimes: Dict[str, Lifetime] = {}
+        self._singletons: Dict[str, Any] = {}
+
+    def register(self, name: str, factory: Callable, lifetime: Lifetime = Lifetime.TRANSIENT):
         """Registra una factory para crear instancias de servicios."""
         self._services[name] = factory
-    
+        self._lifetimes[name] = lifetime
+        self._singletons.pop(name, None)
+
     def resolve(self, name: str) -> Any:
-        """Resuelve y retorna una instancia del servicio."""
+        """Resuelve y retorna una instancia del servicio según su ciclo de vida."""
+        scope = _current_scope.get()
+        if scope is not None and name in scope:
+            return scope[name]
+
         if name not in self._services:
             raise ValueError(f"Servicio '{name}' no registrado en el contenedor DI")
-        
-        factory = self._services[name]
-        return factory()
-    
+
+        lifetime = self._lifetimes[name]
+
+        if lifetime == Lifetime.SINGLETON:
+            if name not in self._singletons:
+                self._singletons[name] = self._services[name]()
+            return self._singletons[name]
+
+        if lifetime == Lifetime.SCOPED:
+            if scope is None:
+                raise RuntimeError(f"Servicio '{name}' requiere un scope activo (request)")
+            if name not in scope:
+                scope[name] = self._services[name]()
+            return scope[name]
+
+        return self._services[name]()
+
+    def proxy(self, name: str) -> ScopedProxy:
+        """Retorna una referencia perezosa a un servicio SCOPED."""
+        return ScopedProxy(self, name)
+
+    def build(self):
+        """
+        Resuelve el grafo de singletons una sola vez (al arrancar la aplicación).
+
+        Los singletons solo deben depender de otros singletons o de proxies
+        a servicios SCOPED, nunca de instancias por request.
+        """
+        for name, lifetime in self._lifetimes.items():
+            if lifetime == Lifetime.SINGLETON:
+                self.resolve(name)
+
+    @contextmanager
+    def scope(self, **instances: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Abre un scope (request) con instancias iniciales, p. ej. la sesión de BD.
+
+        El scope vive en un ContextVar: cada tarea asyncio ve únicamente el suyo.
+        """
+        scope = dict(instances)
+        token = _current_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            scope.clear()
+            try:
+                _current_scope.reset(token)
+            except ValueError:
+                # El teardown de FastAPI puede ejecutarse en otro contexto
+                _current_scope.set(None)
+
     def clear(self):
         """Limpia todas las dependencias registradas."""
         self._services.clear()
+        self._lifetimes.clear()
+        self._singletons.clear()
 
 
 # Singleton del contenedor
 container = DIContainer()
+
+
+async def request_scope(
+    session: AsyncSession = Depends(get_db_session),
+    read_session: AsyncSession = Depends(get_read_session)
+):
+    """
+    Dependency que abre el scope de DI del request.
+
+    Las sesiones son perezosas (LazySession): registrar ambas no toma
+    conexiones del pool hasta que un repositorio las usa.
+    """
+    with container.scope(db_session=session, read_session=read_session) as scope:
+        yield scope
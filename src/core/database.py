@@ -2,31 +2,284 @@
 Configuración de la base de datos con SQLAlchemy.
 Motor y sesión compartidos por todos los módulos.
 """
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+import itertools
+import time
+from threading import Lock
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import DeclarativeBase, Session
 from src.core.config import settings
+from src.core.pool_metrics import InstrumentedAsyncQueuePool, instrument_engine
+
+
+def engine_options(url: str, name: str) -> dict:
+    """
+    Construye las opciones de create_async_engine a partir de Settings.
+
+    SQLite (tests/desarrollo) usa su propio pool, por lo que las opciones
+    de dimensionamiento solo se aplican a servidores como PostgreSQL.
+    """
+    options = {
+        "echo": settings.debug,
+        "future": True,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+    if not url.startswith("sqlite"):
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_logging_name=name,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+
+    return options
+
+
+def to_async_url(url: str) -> str:
+    """Convierte una URL de PostgreSQL al driver async (asyncpg)."""
+    return url.replace("postgresql://", "postgresql+asyncpg://")
+
+
+def create_session_factory(bind: AsyncEngine) -> async_sessionmaker:
+    """Crea una factory de sesiones con la configuración común de la aplicación."""
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False
+    )
 
 
 # Convertir URL de PostgreSQL a async
-async_database_url = settings.get_database_url.replace(
-    "postgresql://", "postgresql+asyncpg://"
-)
+async_database_url = to_async_url(settings.get_database_url)
 
 # Motor de base de datos (Singleton)
 engine = create_async_engine(
     async_database_url,
-    echo=settings.debug,
-    future=True
+    **engine_options(async_database_url, "primary")
 )
 
+# Métricas del pool alimentadas por eventos de SQLAlchemy
+pool_metrics = instrument_engine(engine, "primary")
+
 # Factory de sesiones
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False
-)
+AsyncSessionLocal = create_session_factory(engine)
+
+
+# ==================== Réplicas de lectura ====================
+
+class ReplicaRouter:
+    """
+    Selecciona la réplica de lectura para cada sesión.
+
+    Estrategias:
+    - round_robin: reparte las sesiones de forma cíclica
+    - least_connections: elige la réplica con menos conexiones prestadas
+    """
+
+    ROUND_ROBIN = "round_robin"
+    LEAST_CONNECTIONS = "least_connections"
+
+    def __init__(self, engines: List[AsyncEngine], strategy: str = ROUND_ROBIN):
+        if strategy not in (self.ROUND_ROBIN, self.LEAST_CONNECTIONS):
+            raise ValueError(f"Estrategia de réplicas desconocida: '{strategy}'")
+
+        self.engines = engines
+        self.strategy = strategy
+        self._session_factories = [create_session_factory(e) for e in engines]
+        self._counter = itertools.count()
+        self._in_use = [0] * len(engines)
+
+        # Conteo propio de conexiones prestadas: funciona con cualquier pool
+        # (incluido NullPool, el pool por defecto de SQLite en archivo)
+        for index, replica in enumerate(engines):
+            event.listen(replica.sync_engine, "checkout", self._on_checkout(index))
+            event.listen(replica.sync_engine, "checkin", self._on_checkin(index))
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.engines)
+
+    def select(self) -> async_sessionmaker:
+        """Retorna la factory de sesiones de la réplica elegida."""
+        if self.strategy == self.LEAST_CONNECTIONS:
+            index = min(range(len(self.engines)), key=lambda i: self._in_use[i])
+        else:
+            index = next(self._counter) % len(self.engines)
+
+        return self._session_factories[index]
+
+    def _on_checkout(self, index: int):
+        def listener(dbapi_connection, connection_record, connection_proxy) -> None:
+            self._in_use[index] += 1
+        return listener
+
+    def _on_checkin(self, index: int):
+        def listener(dbapi_connection, connection_record) -> None:
+            self._in_use[index] = max(0, self._in_use[index] - 1)
+        return listener
+
+
+class ReadYourWritesTracker:
+    """
+    Recuerda qué clientes escribieron recientemente.
+
+    Durante la ventana configurada, las lecturas de ese cliente se envían al
+    primario para que vea sus propias escrituras pese al retraso de replicación.
+    """
+
+    MAX_TRACKED_CLIENTS = 10_000
+
+    def __init__(self, window_seconds: float):
+        self.window_seconds = window_seconds
+        self._expirations: Dict[str, float] = {}
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.window_seconds > 0
+
+    def mark(self, client_key: Optional[str]) -> None:
+        """Registra una escritura del cliente."""
+        if not self.enabled or not client_key:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if len(self._expirations) >= self.MAX_TRACKED_CLIENTS:
+                self._expirations = {k: v for k, v in self._expirations.items() if v > now}
+            self._expirations[client_key] = now + self.window_seconds
+
+    def is_recent(self, client_key: Optional[str]) -> bool:
+        """Indica si el cliente escribió dentro de la ventana."""
+        if not self.enabled or not client_key:
+            return False
+
+        expiration = self._expirations.get(client_key)
+        return expiration is not None and expiration > time.monotonic()
+
+
+replica_engines: List[AsyncEngine] = []
+for index, replica_url in enumerate(settings.get_replica_urls):
+    replica_async_url = to_async_url(replica_url)
+    replica_engine = create_async_engine(
+        replica_async_url,
+        **engine_options(replica_async_url, f"replica-{index}")
+    )
+    instrument_engine(replica_engine, f"replica-{index}")
+    replica_engines.append(replica_engine)
+
+replica_router = ReplicaRouter(replica_engines, settings.db_replica_strategy)
+read_your_writes = ReadYourWritesTracker(settings.read_your_writes_seconds)
+
+
+# ==================== Detección de escrituras ====================
+
+def session_has_writes(session) -> bool:
+    """Indica si la sesión emitió algún INSERT/UPDATE/DELETE."""
+    return bool(session.info.get("has_writes"))
+
+
+def mark_session_writes(session) -> None:
+    """Marca la sesión como escrita (para escrituras que no pasan por SQLAlchemy, p. ej. COPY)."""
+    session.info["has_writes"] = True
+    read_your_writes.mark(session.info.get("client_key"))
+
+
+@event.listens_for(Session, "after_flush")
+def _on_after_flush(session: Session, flush_context) -> None:
+    """Escrituras vía unit of work del ORM (add/flush)."""
+    mark_session_writes(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_orm_execute(orm_execute_state) -> None:
+    """Escrituras vía sentencias explícitas (update()/insert()/delete())."""
+    if orm_execute_state.is_update or orm_execute_state.is_insert or orm_execute_state.is_delete:
+        mark_session_writes(orm_execute_state.session)
+
+
+# ==================== Sesión perezosa ====================
+
+class LazySession:
+    """
+    Proxy perezoso sobre AsyncSession.
+
+    - La sesión (y por tanto la conexión del pool) solo se crea en el primer uso:
+      un handler que falla validando la entrada nunca toca el pool.
+    - Al finalizar solo hace commit si hubo escrituras; si no, simplemente cierra.
+    - Con `release_after_read=True`, mientras la sesión no haya escrito, cada
+      lectura devuelve la conexión al pool en cuanto termina (los resultados de
+      AsyncSession.execute ya vienen materializados en memoria).
+    """
+
+    _READ_METHODS = frozenset({"execute", "scalar", "scalars", "get"})
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        info: Optional[Dict[str, Any]] = None,
+        release_after_read: bool = False
+    ):
+        self._session_factory = session_factory
+        self._info = info or {}
+        self._release_after_read = release_after_read
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def started(self) -> bool:
+        """Indica si la sesión real llegó a crearse."""
+        return self._session is not None
+
+    def _ensure_session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+            self._session.info.update(self._info)
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._ensure_session(), name)
+        if self._release_after_read and name in self._READ_METHODS:
+            return self._releasing(attribute)
+        return attribute
+
+    def _releasing(self, method):
+        async def wrapper(*args, **kwargs):
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                if not session_has_writes(self._session):
+                    await self._session.close()
+        return wrapper
+
+    async def finalize(self, error: bool = False) -> None:
+        """Cierra la sesión: rollback si hubo error, commit solo si hubo escrituras."""
+        if self._session is None:
+            return
+
+        try:
+            if error:
+                await self._session.rollback()
+            elif session_has_writes(self._session):
+                await self._session.commit()
+        finally:
+            await self._session.close()
+            self._session = None
+
+
+def client_key(request: Request) -> Optional[str]:
+    """Identifica al cliente para la ventana de read-your-writes."""
+    explicit = request.headers.get("X-Client-Id")
+    if explicit:
+        return explicit
+    return request.client.host if request.client else None
 
 
 from datetime import datetime
@@ -50,17 +303,38 @@ class Base(DeclarativeBase):
     pass
 
 
-async def get_db_session() -> AsyncSession:
+async def get_db_session(request: Request) -> AsyncSession:
     """
     Dependency para obtener una sesión de base de datos.
     Uso en FastAPI: Depends(get_db_session)
+    
+    La conexión se toma del pool solo al primer uso y el commit se omite
+    cuando el request no escribió nada (ver LazySession).
     """
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+    session = LazySession(AsyncSessionLocal, info={"client_key": client_key(request)})
+    try:
+        yield session
+    except Exception:
+        await session.finalize(error=True)
+        raise
+    else:
+        await session.finalize()
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency para obtener una sesión de solo lectura.
+
+    Usa una réplica si hay réplicas configuradas y el cliente no escribió
+    recientemente (read-your-writes); en caso contrario usa el primario.
+    Uso en FastAPI: Depends(get_read_session)
+    """
+    session_factory = AsyncSessionLocal
+    if replica_router.has_replicas and not read_your_writes.is_recent(client_key(request)):
+        session_factory = replica_router.select()
+
+    session = LazySession(session_factory, release_after_read=True)
+    try:
+        yield session
+    finally:
+        await session.finalize(error=True)
@@ -0,0 +1,73 @@
+"""
+ETags fuertes derivados de la columna `version`.
+
+Cada escritura incrementa la versión de la fila, así que `(id, versión)`
+identifica de forma exacta el estado de la entidad: dos respuestas con el
+mismo ETag tienen el mismo contenido. Con eso se resuelven:
+
+- GET condicional (`If-None-Match`): si el ETag del cliente sigue vigente se
+  responde 304 consultando solo la versión, sin leer la fila completa
+- Escrituras optimistas (`If-Match`): si la entidad cambió desde que el
+  cliente la leyó se responde 412 en lugar de sobrescribirla
+
+Para el cliente el ETag es opaco. Aquí normalmente tampoco se interpreta: se
+compara el valor recibido con el que corresponde a la versión actual. La
+excepción es `if_match_versions`, que extrae las versiones de If-Match para
+llevar la condición al WHERE de un UPDATE sin leer antes la entidad.
+"""
+from typing import List, Optional
+from uuid import UUID
+
+
+ETAG_HEADER = "ETag"
+
+# Prefijo de los ETags débiles (RFC 9110, sección 8.8.3)
+_WEAK_PREFIX = "W/"
+
+
+def make_etag(entity_id: UUID, version: int) -> str:
+    """ETag fuerte de una entidad en una versión concreta."""
+    return f'"{entity_id}-{version}"'
+
+
+def _parse(header: str) -> List[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def etag_matches(header: str, etag: str, weak: bool = True) -> bool:
+    """
+    Indica si el ETag actual satisface la cabecera condicional recibida.
+
+    Args:
+        header: Valor de If-None-Match o If-Match (lista separada por comas o "*")
+        etag: ETag actual de la entidad
+        weak: Comparación débil (If-None-Match) o fuerte (If-Match), en la
+            que un ETag débil nunca coincide
+    """
+    for tag in _parse(header):
+        if tag == "*":
+            return True
+        if tag.startswith(_WEAK_PREFIX):
+            if not weak:
+                continue
+            tag = tag[len(_WEAK_PREFIX):]
+        if tag == etag:
+            return True
+    return False
+
+
+def if_match_versions(header: str, entity_id: UUID) -> Optional[List[int]]:
+    """
+    Versiones de la entidad que satisfacen una cabecera If-Match (comparación fuerte).
+
+    Retorna None si la cabecera admite cualquier versión ("*") y una lista
+    (vacía si ningún ETag corresponde a la entidad) en caso contrario.
+    """
+    prefix = f'"{entity_id}-'
+    versions = []
+    for tag in _parse(header):
+        if tag == "*":
+            return None
+        if tag.startswith(prefix) and tag.endswith('"') and tag[len(prefix):-1].isdigit():
+            versions.append(int(tag[len(prefix):-1]))
+    return versions
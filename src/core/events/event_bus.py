@@ -1,13 +1,17 @@
 """
 Infraestructura base para Eventos de Dominio.
 """
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Dict, List, Type, Callable, Coroutine, Any
+from pathlib import Path
+from typing import Dict, List, Optional, Type, Callable, Coroutine, Any, get_type_hints
 import uuid
 import asyncio
+import json
 from loguru import logger
 
+from src.core.config import settings
+
 
 @dataclass(kw_only=True)
 class DomainEvent:
@@ -15,15 +19,80 @@ class DomainEvent:
     event_id: uuid.UUID = field(default_factory=uuid.uuid4)
     occurred_on: datetime = field(default_factory=datetime.utcnow)
 
+    # Registro de tipos de evento por nombre (para serializar/deserializar)
+    _registry = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        DomainEvent._registry[cls.__name__] = cls
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa el evento a un diccionario compatible con JSON."""
+        data = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, uuid.UUID):
+                value = str(value)
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            data[f.name] = value
+        return {"type": type(self).__name__, "data": data}
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "DomainEvent":
+        """Reconstruye un evento serializado con `to_dict`."""
+        event_type = DomainEvent._registry.get(payload["type"])
+        if event_type is None:
+            raise ValueError(f"Tipo de evento desconocido: '{payload['type']}'")
+
+        hints = get_type_hints(event_type)
+        data = {}
+        for name, value in payload["data"].items():
+            if hints.get(name) is uuid.UUID and value is not None:
+                value = uuid.UUID(value)
+            elif hints.get(name) is datetime and value is not None:
+                value = datetime.fromisoformat(value)
+            data[name] = value
+        return event_type(**data)
 
 
 class EventBus:
     """
-    Bus de eventos interno (In-memory) para comunicación desacoplada 
+    Bus de eventos interno (In-memory) para comunicación desacoplada
     entre módulos del monolito.
+
+    Modos de despacho (settings.event_bus_mode):
+    - inline: publish espera a que terminen todos los handlers
+    - background: publish encola el evento en una cola acotada y un pool de
+      workers lo despacha; el caso de uso no espera a los suscriptores
+
+    Cada handler se ejecuta aislado: su error o timeout se registra sin
+    afectar al resto de handlers ni al publicador.
+
+    Política con la cola llena (settings.event_bus_overflow):
+    - block: publish espera a que haya espacio (backpressure)
+    - drop: el evento se descarta
+    - spill: el evento se escribe en disco (JSON lines) y se reencola al arrancar
     """
-    
+
+    INLINE = "inline"
+    BACKGROUND = "background"
+
+    BLOCK = "block"
+    DROP = "drop"
+    SPILL = "spill"
+
     _subscribers: Dict[Type[DomainEvent], List[Callable[[Any], Coroutine[Any, Any, None]]]] = {}
+    _queue: Optional[asyncio.Queue] = None
+    _workers: List[asyncio.Task] = []
+    _stats: Dict[str, int] = {
+        "published": 0,
+        "processed": 0,
+        "handler_errors": 0,
+        "handler_timeouts": 0,
+        "dropped": 0,
+        "spilled": 0,
+    }
 
     @classmethod
     def subscribe(cls, event_type: Type[DomainEvent], handler: Callable[[Any], Coroutine[Any, Any, None]]):
@@ -33,16 +102,190 @@ class EventBus:
         cls._subscribers[event_type].append(handler)
         logger.debug(f"Suscrito handler {handler.__name__} al evento {event_type.__name__}")
 
+    @classmethod
+    def is_running(cls) -> bool:
+        """Indica si los workers de despacho en segundo plano están activos."""
+        return cls._queue is not None and bool(cls._workers)
+
     @classmethod
     async def publish(cls, events: List[DomainEvent]):
-        """Publica una lista de eventos a todos los suscriptores interesados."""
+        """
+        Publica una lista de eventos a todos los suscriptores interesados.
+
+        En modo background (con los workers arrancados) solo encola; si los
+        workers no están activos (p. ej. tests sin lifespan) despacha inline.
+        """
         for event in events:
-            event_type = type(event)
-            if event_type in cls._subscribers:
-                handlers = cls._subscribers[event_type]
-                # Ejecutar handlers de forma asíncrona
-                tasks = [handler(event) for handler in handlers]
-                await asyncio.gather(*tasks)
-                logger.info(f"Evento {event_type.__name__} publicado a {len(handlers)} handlers")
+            cls._stats["published"] += 1
+            if settings.event_bus_mode == cls.BACKGROUND and cls.is_running():
+                await cls._enqueue(event)
             else:
-                logger.debug(f"Saliendo sin publicar: No hay suscriptores para {event_type.__name__}")
+                await cls.dispatch(event)
+
+    @classmethod
+    async def start(cls, workers: Optional[int] = None, queue_size: Optional[int] = None):
+        """Crea la cola acotada y arranca el pool de workers."""
+        if cls.is_running():
+            return
+
+        cls._queue = asyncio.Queue(maxsize=queue_size or settings.event_bus_queue_size)
+        worker_count = workers or settings.event_bus_workers
+        cls._workers = [
+            asyncio.create_task(cls._worker(), name=f"event-bus-worker-{i}")
+            for i in range(worker_count)
+        ]
+        logger.info(f"EventBus en segundo plano: {worker_count} workers, cola de {cls._queue.maxsize}")
+
+        await cls._replay_spilled()
+
+    @classmethod
+    async def stop(cls, timeout: Optional[float] = None):
+        """
+        Detiene los workers tras drenar la cola.
+
+        Si la cola no se drena en `timeout` segundos, los eventos pendientes
+        se escriben en disco para no perderlos.
+        """
+        if cls._queue is None:
+            return
+
+        try:
+            await asyncio.wait_for(cls._queue.join(), timeout=timeout or settings.event_bus_handler_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("EventBus: la cola no se drenó a tiempo; se vuelcan los eventos pendientes")
+
+        for worker in cls._workers:
+            worker.cancel()
+        await asyncio.gather(*cls._workers, return_exceptions=True)
+
+        pending = []
+        while not cls._queue.empty():
+            pending.append(cls._queue.get_nowait())
+        for event in pending:
+            cls._spill(event)
+
+        cls._queue = None
+        cls._workers = []
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Retorna contadores del bus y el estado de la cola."""
+        return {
+            "mode": settings.event_bus_mode,
+            "running": cls.is_running(),
+            "workers": len(cls._workers),
+            "queue_size": cls._queue.qsize() if cls._queue is not None else 0,
+            "queue_capacity": cls._queue.maxsize if cls._queue is not None else settings.event_bus_queue_size,
+            "overflow_policy": settings.event_bus_overflow,
+            **cls._stats,
+        }
+
+    # Despacho
+
+    @classmethod
+    async def _enqueue(cls, event: DomainEvent):
+        policy = settings.event_bus_overflow
+        if policy == cls.BLOCK:
+            await cls._queue.put(event)
+            return
+
+        try:
+            cls._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            if policy == cls.SPILL:
+                cls._spill(event)
+            else:
+                cls._stats["dropped"] += 1
+                logger.warning(f"EventBus: cola llena, se descarta {type(event).__name__} {event.event_id}")
+
+    @classmethod
+    async def _worker(cls):
+        while True:
+            event = await cls._queue.get()
+            try:
+                await cls.dispatch(event)
+            finally:
+                cls._queue.task_done()
+
+    @classmethod
+    async def dispatch(cls, event: DomainEvent) -> bool:
+        """
+        Entrega un evento a sus handlers y espera a que terminen (sin cola).
+
+        Returns:
+            True si todos los handlers terminaron sin error ni timeout (el
+            outbox solo marca como entregados los eventos que lo cumplen)
+        """
+        event_type = type(event)
+        handlers = cls._subscribers.get(event_type)
+        if not handlers:
+            logger.debug(f"Saliendo sin publicar: No hay suscriptores para {event_type.__name__}")
+            return True
+
+        # Ejecutar handlers de forma asíncrona y aislada
+        results = await asyncio.gather(*(cls._run_handler(handler, event) for handler in handlers))
+        cls._stats["processed"] += 1
+        logger.info(f"Evento {event_type.__name__} publicado a {len(handlers)} handlers")
+        return all(results)
+
+    @classmethod
+    async def _run_handler(cls, handler: Callable[[Any], Coroutine[Any, Any, None]], event: DomainEvent) -> bool:
+        try:
+            await asyncio.wait_for(handler(event), timeout=settings.event_bus_handler_timeout)
+            return True
+        except asyncio.TimeoutError:
+            cls._stats["handler_timeouts"] += 1
+            logger.error(f"Handler {handler.__name__} excedió el timeout con {type(event).__name__}")
+        except Exception as e:
+            cls._stats["handler_errors"] += 1
+            logger.error(f"Handler {handler.__name__} falló con {type(event).__name__}: {e}")
+        return False
+
+    # Desborde a disco
+
+    @classmethod
+    def _spill(cls, event: DomainEvent):
+        path = Path(settings.event_bus_spill_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as spill_file:
+            spill_file.write(json.dumps(event.to_dict()) + "\n")
+        cls._stats["spilled"] += 1
+        logger.warning(f"EventBus: {type(event).__name__} {event.event_id} desbordado a {path}")
+
+    @classmethod
+    async def _replay_spilled(cls):
+        """
+        Reencola los eventos desbordados a disco en una ejecución anterior.
+
+        El archivo se renombra a `.replay` mientras se reencola y se borra solo
+        cuando todas sus líneas están en la cola. Si el proceso cae (o se
+        cancela) antes, el `.replay` se retoma en el siguiente arranque: los
+        eventos se entregan al menos una vez.
+        """
+        path = Path(settings.event_bus_spill_path)
+        processing = path.with_suffix(path.suffix + ".replay")
+
+        if processing.exists():
+            await cls._replay_file(processing)
+        if path.exists():
+            path.replace(processing)
+            await cls._replay_file(processing)
+
+    @classmethod
+    async def _replay_file(cls, processing: Path):
+        """Reencola las líneas de un archivo `.replay` y lo borra al terminar."""
+        replayed = 0
+        with processing.open(encoding="utf-8") as replay_file:
+            for line in replay_file:
+                if not line.strip():
+                    continue
+                try:
+                    event = DomainEvent.from_dict(json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.error(f"EventBus: evento desbordado ilegible, se descarta: {e}")
+                    continue
+                await cls._enqueue(event)
+                replayed += 1
+
+        processing.unlink()
+        logger.info(f"EventBus: {replayed} eventos desbordados reencolados desde {processing}")
@@ -0,0 +1,297 @@
+"""
+Outbox transaccional para eventos de dominio.
+
+Los eventos se guardan en la tabla `outbox` dentro de la misma transacción que
+el agregado que los produce: si la transacción hace rollback, el evento nunca
+existió; si hace commit, el evento queda persistido aunque el proceso caiga.
+
+Un relay en segundo plano reclama lotes de eventos pendientes con
+`FOR UPDATE SKIP LOCKED` (varias instancias pueden trabajar en paralelo sin
+pisarse) y los arrienda durante `outbox_lease_seconds`. Los despacha al
+EventBus fuera de esa transacción, sin retener bloqueos mientras corren los
+handlers, y marca como entregados solo los eventos cuyos handlers terminaron
+todos sin error. Los demás se reintentan con backoff exponencial; si el relay
+cae a mitad de lote, el arriendo vence y otro ciclo los retoma.
+La entrega es "al menos una vez": los handlers deben ser idempotentes.
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from loguru import logger
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Uuid, event, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.database import AsyncSessionLocal, Base
+from src.core.events.event_bus import DomainEvent, EventBus
+
+
+class OutboxEventModel(Base):
+    """
+    Modelo de base de datos para un evento pendiente de entrega.
+
+    El id autoincremental da el orden de entrega y sirve como marca de
+    agua (high-water mark) del relay.
+    """
+    __tablename__ = "outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_id = Column(Uuid, nullable=False, unique=True)
+    event_type = Column(String(255), nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    delivered_at = Column(DateTime, nullable=True)
+    # Entregas fallidas y momento a partir del cual se puede reclamar de nuevo
+    # (fin del backoff o del arriendo del relay que lo tiene en curso)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    next_attempt_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_outbox_pending", "delivered_at", "id"),
+    )
+
+    def __repr__(self):
+        return f"<OutboxEventModel(id={self.id}, event_type='{self.event_type}')>"
+
+
+class EventOutbox(ABC):
+    """
+    Puerto para registrar eventos de dominio a publicar.
+
+    Los casos de uso dependen de esta abstracción en lugar de publicar
+    directamente en el EventBus.
+    """
+
+    @abstractmethod
+    async def add(self, events: List[DomainEvent]) -> None:
+        """Registra los eventos en la transacción en curso."""
+        pass
+
+
+class SQLAlchemyEventOutbox(EventOutbox):
+    """Outbox sobre la misma sesión (y transacción) que los repositorios."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, events: List[DomainEvent]) -> None:
+        if not events:
+            return
+
+        for domain_event in events:
+            serialized = domain_event.to_dict()
+            self.session.add(OutboxEventModel(
+                event_id=domain_event.event_id,
+                event_type=serialized["type"],
+                payload=serialized["data"],
+                created_at=domain_event.occurred_on
+            ))
+
+        await self.session.flush()
+        self.session.info["outbox_pending"] = True
+
+
+# Señal para despertar al relay en cuanto una transacción con eventos hace commit
+_relay_wakeup = asyncio.Event()
+
+
+@event.listens_for(Session, "after_commit")
+def _on_after_commit(session: Session) -> None:
+    if session.info.pop("outbox_pending", False):
+        _relay_wakeup.set()
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_after_rollback(session: Session) -> None:
+    session.info.pop("outbox_pending", None)
+
+
+class OutboxRelay:
+    """
+    Relay que entrega los eventos del outbox al EventBus.
+
+    Cada ciclo reclama hasta `batch_size` eventos pendientes en orden de id,
+    los despacha y marca los entregados con un único UPDATE; los que fallan
+    quedan pendientes con su intento contabilizado. Si el lote llega lleno
+    vuelve a consultar de inmediato; si no, espera a la señal de commit o a
+    `poll_interval`.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        batch_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        lease_seconds: Optional[float] = None
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.outbox_batch_size
+        self.poll_interval = poll_interval or settings.outbox_poll_interval
+        self.lease_seconds = lease_seconds or settings.outbox_lease_seconds
+        self.high_water_mark = 0
+        self.delivered = 0
+        self.retried = 0
+        self.batches = 0
+        self.failures = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def poll_once(self) -> int:
+        """Procesa un lote de eventos pendientes. Retorna cuántos entregó."""
+        rows = await self._claim()
+        if not rows:
+            return 0
+
+        delivered, failed = [], []
+        for row in rows:
+            try:
+                domain_event = DomainEvent.from_dict({"type": row.event_type, "data": row.payload})
+            except (ValueError, TypeError) as e:
+                logger.error(f"Outbox: evento {row.id} ilegible, se marca como entregado: {e}")
+                delivered.append(row.id)
+                continue
+            if await EventBus.dispatch(domain_event):
+                delivered.append(row.id)
+            else:
+                failed.append(row)
+
+        await self._settle(delivered, failed)
+
+        if delivered:
+            self.high_water_mark = max(self.high_water_mark, max(delivered))
+        self.delivered += len(delivered)
+        self.retried += len(failed)
+        self.batches += 1
+        logger.debug(
+            f"Outbox: entregados {len(delivered)} eventos, {len(failed)} para reintentar "
+            f"(hasta id {self.high_water_mark})"
+        )
+        return len(delivered)
+
+    async def _claim(self) -> Sequence[Any]:
+        """
+        Reclama un lote en una transacción corta: lo bloquea (SKIP LOCKED) solo
+        para arrendarlo, de modo que otros relays lo ignoren hasta que venza.
+        """
+        now = datetime.utcnow()
+        async with self.session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    select(
+                        OutboxEventModel.id,
+                        OutboxEventModel.event_type,
+                        OutboxEventModel.payload,
+                        OutboxEventModel.attempts
+                    )
+                    .where(
+                        OutboxEventModel.delivered_at.is_(None),
+                        or_(OutboxEventModel.next_attempt_at.is_(None), OutboxEventModel.next_attempt_at <= now)
+                    )
+                    .order_by(OutboxEventModel.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                rows = result.all()
+                if rows:
+                    await session.execute(
+                        update(OutboxEventModel)
+                        .where(OutboxEventModel.id.in_([row.id for row in rows]))
+                        .values(next_attempt_at=now + timedelta(seconds=self.lease_seconds))
+                        .execution_options(synchronize_session=False)
+                    )
+        return rows
+
+    async def _settle(self, delivered: List[int], failed: Sequence[Any]) -> None:
+        """Marca los entregados en bloque y reprograma los fallidos con backoff exponencial."""
+        now = datetime.utcnow()
+        async with self.session_factory() as session:
+            async with session.begin():
+                if delivered:
+                    await session.execute(
+                        update(OutboxEventModel)
+                        .where(OutboxEventModel.id.in_(delivered))
+                        .values(delivered_at=now)
+                        .execution_options(synchronize_session=False)
+                    )
+                for row in failed:
+                    attempts = row.attempts + 1
+                    await session.execute(
+                        update(OutboxEventModel)
+                        .where(OutboxEventModel.id == row.id)
+                        .values(attempts=attempts, next_attempt_at=now + timedelta(seconds=self._backoff(attempts)))
+                        .execution_options(synchronize_session=False)
+                    )
+                    logger.warning(f"Outbox: evento {row.id} no entregado (intento {attempts}), se reintentará")
+
+    @staticmethod
+    def _backoff(attempts: int) -> float:
+        """Segundos de espera tras `attempts` intentos fallidos (exponencial, acotado)."""
+        return min(settings.outbox_retry_backoff * 2 ** (attempts - 1), settings.outbox_retry_max_backoff)
+
+    async def run(self) -> None:
+        """Bucle del relay hasta que se cancele la tarea."""
+        while True:
+            # Limpiar antes de consultar: un commit durante el lote no se pierde
+            _relay_wakeup.clear()
+            try:
+                delivered = await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                logger.error(f"Outbox: error en el relay: {e}")
+                delivered = 0
+
+            if delivered < self.batch_size:
+                try:
+                    await asyncio.wait_for(_relay_wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        """Arranca el relay como tarea de fondo."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        """Detiene el relay."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def snapshot(self, session: AsyncSession) -> Dict[str, Any]:
+        """
+        Retorna las métricas del relay.
+
+        `latest_id - high_water_mark` aproxima el atraso en número de eventos;
+        `oldest_pending_age_seconds` lo expresa en tiempo.
+        """
+        result = await session.execute(
+            select(
+                func.max(OutboxEventModel.id),
+                func.count(OutboxEventModel.id).filter(OutboxEventModel.delivered_at.is_(None)),
+                func.min(OutboxEventModel.created_at).filter(OutboxEventModel.delivered_at.is_(None))
+            )
+        )
+        latest_id, pending, oldest_pending = result.one()
+        oldest_age = (datetime.utcnow() - oldest_pending).total_seconds() if oldest_pending else 0.0
+
+        return {
+            "running": self._task is not None,
+            "batch_size": self.batch_size,
+            "high_water_mark": self.high_water_mark,
+            "latest_id": latest_id or 0,
+            "pending": pending,
+            "oldest_pending_age_seconds": round(oldest_age, 3),
+            "delivered": self.delivered,
+            "retried": self.retried,
+            "batches": self.batches,
+            "failures": self.failures,
+        }
+
+
+# Relay del proceso (arrancado desde el lifespan de la aplicación)
+outbox_relay = OutboxRelay(AsyncSessionLocal)
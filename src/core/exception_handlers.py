@@ -5,7 +5,7 @@ Centraliza el manejo de excepciones de toda la aplicación.
 import logging
 from typing import Union
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError as PydanticValidationError
 
@@ -15,8 +15,13 @@ from src.core.exceptions import (
     BusinessRuleViolation,
     NotFoundError,
     InfrastructureError,
-    AuthorizationError
+    AuthorizationError,
+    ConcurrencyError,
+    PreconditionFailedError,
+    NotModifiedError,
+    InvalidStateTransitionError
 )
+from src.core.etag import ETAG_HEADER
 
 # Logger centralizado
 logger = logging.getLogger(__name__)
@@ -200,6 +205,102 @@ async def authorization_error_handler(
     )
 
 
+async def concurrency_error_handler(
+    request: Request,
+    exc: ConcurrencyError
+) -> JSONResponse:
+    """
+    Handler para conflictos de concurrencia optimista.
+    
+    Solo llega aquí cuando se agotaron los reintentos del caso de uso.
+    """
+    logger.warning(
+        f"Concurrency conflict: {exc.message}",
+        extra={
+            "error_code": exc.code,
+            "context": exc.context,
+            "path": request.url.path
+        }
+    )
+    
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content=ErrorResponse.create(
+            error_type="ConcurrencyError",
+            message=exc.message,
+            code=exc.code,
+            status_code=409,
+            context=exc.context
+        )
+    )
+
+
+async def invalid_state_transition_handler(
+    request: Request,
+    exc: InvalidStateTransitionError
+) -> JSONResponse:
+    """
+    Handler para transiciones de estado que chocan con el estado actual de la entidad.
+    """
+    logger.info(
+        f"Invalid state transition: {exc.message}",
+        extra={
+            "error_code": exc.code,
+            "context": exc.context,
+            "path": request.url.path
+        }
+    )
+    
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content=ErrorResponse.create(
+            error_type="InvalidStateTransitionError",
+            message=exc.message,
+            code=exc.code,
+            status_code=409,
+            context=exc.context
+        )
+    )
+
+
+async def precondition_failed_error_handler(
+    request: Request,
+    exc: PreconditionFailedError
+) -> JSONResponse:
+    """
+    Handler para escrituras condicionales (If-Match) sobre una versión desactualizada.
+    """
+    logger.info(
+        f"Precondition failed: {exc.message}",
+        extra={
+            "error_code": exc.code,
+            "context": exc.context,
+            "path": request.url.path
+        }
+    )
+    
+    return JSONResponse(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        content=ErrorResponse.create(
+            error_type="PreconditionFailedError",
+            message=exc.message,
+            code=exc.code,
+            status_code=412,
+            context=exc.context
+        )
+    )
+
+
+async def not_modified_handler(
+    request: Request,
+    exc: NotModifiedError
+) -> Response:
+    """
+    Handler para GET condicionales cuyo ETag sigue vigente: 304 sin cuerpo.
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: exc.etag})
+
+
 async def domain_error_handler(
     request: Request,
     exc: DomainError
@@ -290,10 +391,14 @@ def register_exception_handlers(app):
     """
     # Domain exceptions (orden específico a genérico)
     app.add_exception_handler(ValidationError, validation_error_handler)
+    app.add_exception_handler(InvalidStateTransitionError, invalid_state_transition_handler)
     app.add_exception_handler(BusinessRuleViolation, business_rule_violation_handler)
     app.add_exception_handler(NotFoundError, not_found_error_handler)
     app.add_exception_handler(InfrastructureError, infrastructure_error_handler)
     app.add_exception_handler(AuthorizationError, authorization_error_handler)
+    app.add_exception_handler(ConcurrencyError, concurrency_error_handler)
+    app.add_exception_handler(PreconditionFailedError, precondition_failed_error_handler)
+    app.add_exception_handler(NotModifiedError, not_modified_handler)
     app.add_exception_handler(DomainError, domain_error_handler)
     
     # FastAPI/Pydantic exceptions
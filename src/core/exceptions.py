@@ -2,7 +2,7 @@
 Excepciones base del dominio con soporte para encadenamiento.
 Estas excepciones son compartidas por todos los módulos.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 from datetime import datetime
 
 
@@ -149,6 +149,46 @@ class AuthorizationError(DomainError):
     pass
 
 
+class PreconditionFailedError(DomainError):
+    """
+    Excepción cuando no se cumple la precondición de una escritura condicional.
+    
+    Ejemplos:
+    - PUT/PATCH con If-Match cuyo ETag ya no corresponde a la versión actual
+    """
+    
+    def __init__(
+        self,
+        entity_name: str,
+        entity_id: str,
+        **kwargs
+    ):
+        self.entity_name = entity_name
+        self.entity_id = entity_id
+        
+        message = f"{entity_name} '{entity_id}' fue modificado desde que se leyó (If-Match no coincide)"
+        context = kwargs.pop('context', {})
+        context.update({
+            'entity_type': entity_name,
+            'entity_id': entity_id
+        })
+        
+        super().__init__(message, context=context, **kwargs)
+
+
+class NotModifiedError(DomainError):
+    """
+    Señal de que el cliente ya tiene la versión actual de la entidad.
+    
+    No es un fallo: se traduce en una respuesta 304 sin cuerpo con el ETag
+    vigente (GET condicional con If-None-Match).
+    """
+    
+    def __init__(self, etag: str, **kwargs):
+        self.etag = etag
+        super().__init__("La entidad no ha cambiado", context={'etag': etag}, **kwargs)
+
+
 class ConcurrencyError(DomainError):
     """
     Excepción para conflictos de concurrencia optimista.
@@ -190,3 +230,48 @@ class ConcurrencyError(DomainError):
         
         super().__init__(message, context=context, **kwargs)
 
+
+class InvalidStateTransitionError(BusinessRuleViolation):
+    """
+    Excepción cuando una entidad no está en un estado desde el que se permita la transición.
+    
+    Se traduce en 409: el cambio choca con el estado actual, que puede venir
+    de otra petición que se adelantó (dos PATCH que intentan la misma
+    transición: el segundo ya no encuentra el estado de origen).
+    
+    Ejemplos:
+    - Enviar una orden que otra petición ya marcó como enviada
+    - Entregar una orden que sigue pendiente
+    """
+    
+    def __init__(
+        self,
+        entity_name: str,
+        entity_id: str,
+        current_state: str,
+        target_state: str,
+        allowed_from: Iterable[str],
+        **kwargs
+    ):
+        self.entity_name = entity_name
+        self.entity_id = entity_id
+        self.current_state = current_state
+        self.target_state = target_state
+        self.allowed_from = sorted(allowed_from)
+        
+        message = (
+            f"No se puede pasar {entity_name} '{entity_id}' a '{target_state}': "
+            f"su estado actual es '{current_state}' y la transición requiere "
+            f"{' o '.join(repr(state) for state in self.allowed_from)}"
+        )
+        
+        context = kwargs.pop('context', {})
+        context.update({
+            'entity_type': entity_name,
+            'entity_id': entity_id,
+            'current_state': current_state,
+            'target_state': target_state,
+            'allowed_from': self.allowed_from
+        })
+        
+        super().__init__(message, context=context, **kwargs)
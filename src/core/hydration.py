@@ -0,0 +1,95 @@
+"""
+Hidratación de entidades y value objects desde datos de confianza.
+
+Al leer de la base de datos, los valores ya pasaron las validaciones del
+dominio cuando se escribieron. Reconstruirlos con su constructor repite
+esas validaciones (p. ej. el chequeo carácter a carácter del SKU) y, peor,
+los efectos de creación de `__post_init__` (Order registra un
+OrderCreatedEvent nuevo con uuid4 y utcnow en cada carga).
+
+`hydrator(cls)` genera (una vez por clase) una función que crea la
+instancia sin llamar a `__init__` ni a `__post_init__`: asigna los campos
+directamente y aplica los valores por defecto de los que no se indiquen.
+Solo debe usarse en los mappers de infraestructura, nunca con datos que
+vengan del cliente. Las entidades con seguimiento de cambios
+(ChangeTracking) salen hidratadas sin cambios y empiezan a registrarlos.
+
+    _hydrate_product = hydrator(Product)
+    product = _hydrate_product(product_id=..., sku=..., ...)
+"""
+import dataclasses
+from typing import Any, Callable, Dict, Type, TypeVar
+
+from src.core.change_tracking import ChangeTracking, mark_clean
+
+
+T = TypeVar("T")
+
+# Marca de "sin valor" para los campos con default_factory
+_FACTORY = object()
+
+# Hidratador compilado por clase
+_hydrators: Dict[type, Callable[..., Any]] = {}
+
+
+def hydrator(cls: Type[T]) -> Callable[..., T]:
+    """
+    Retorna la función que construye instancias de la dataclass `cls` sin validar.
+
+    Acepta los campos como argumentos con nombre, igual que el constructor.
+    Funciona también con dataclasses congeladas (frozen) o con __slots__.
+    """
+    function = _hydrators.get(cls)
+    if function is None:
+        function = _hydrators[cls] = _compile(cls)
+    return function
+
+
+def hydrate(cls: Type[T], **values: Any) -> T:
+    """Atajo de `hydrator(cls)(**values)` para usos puntuales."""
+    return hydrator(cls)(**values)
+
+
+def _compile(cls: type) -> Callable[..., Any]:
+    """
+    Genera una función específica para `cls`, igual que hace `dataclasses`
+    con `__init__`: un parámetro por campo y una asignación por campo, sin
+    iterar los campos en cada llamada.
+
+    Sin __slots__ se escribe directamente en `__dict__`; con __slots__ se
+    usa el descriptor de cada slot. Ambas vías ignoran el `__setattr__` de
+    las dataclasses congeladas.
+    """
+    namespace: Dict[str, Any] = {"cls": cls, "_new": object.__new__, "_FACTORY": _FACTORY}
+    names = [f.name for f in dataclasses.fields(cls)]
+    params, factories = [], []
+    for f in dataclasses.fields(cls):
+        if f.default is not dataclasses.MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            params.append(f"{f.name}=_default_{f.name}")
+        elif f.default_factory is not dataclasses.MISSING:
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            params.append(f"{f.name}=_FACTORY")
+            factories.append(f"    if {f.name} is _FACTORY: {f.name} = _factory_{f.name}()")
+        else:
+            params.append(f.name)
+
+    if "__slots__" in cls.__dict__:
+        namespace.update({f"_set_{name}": cls.__dict__[name].__set__ for name in names})
+        assignments = [f"    _set_{name}(obj, {name})" for name in names]
+    else:
+        assignments = ["    obj.__dict__.update({" + ", ".join(f"{name!r}: {name}" for name in names) + "})"]
+
+    if issubclass(cls, ChangeTracking):
+        namespace["_mark_clean"] = mark_clean
+        assignments.append("    _mark_clean(obj)")
+
+    source = "\n".join([
+        f"def hydrate(*, {', '.join(params)}):",
+        *factories,
+        "    obj = _new(cls)",
+        *assignments,
+        "    return obj",
+    ])
+    exec(source, namespace)
+    return namespace["hydrate"]
@@ -0,0 +1,57 @@
+"""
+Router de métricas operativas de la aplicación.
+Expone el estado interno de la infraestructura compartida (pool de conexiones, ...).
+"""
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import snapshot_all as cache_snapshot_all
+from src.core.database import get_db_session
+from src.core.events.event_bus import EventBus
+from src.core.events.outbox import outbox_relay
+from src.core.pool_metrics import snapshot_all
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/db-pool",
+    summary="Métricas del pool de conexiones",
+    description="Conexiones prestadas vs. ociosas, uso de overflow y tiempo de espera en el checkout"
+)
+async def db_pool_metrics():
+    """Retorna las métricas de todos los pools de conexiones registrados."""
+    return snapshot_all()
+
+
+@router.get(
+    "/cache",
+    summary="Métricas de las cachés en memoria",
+    description="Aciertos, fallos, desalojos LRU, expiraciones e invalidaciones por caché"
+)
+async def cache_metrics():
+    """Retorna los contadores de todas las cachés registradas."""
+    return cache_snapshot_all()
+
+
+@router.get(
+    "/event-bus",
+    summary="Métricas del bus de eventos",
+    description="Modo de despacho, ocupación de la cola, errores/timeouts de handlers y eventos descartados o desbordados"
+)
+async def event_bus_metrics():
+    """Retorna los contadores del bus de eventos."""
+    return EventBus.stats()
+
+
+@router.get(
+    "/outbox",
+    summary="Métricas del outbox transaccional",
+    description="Marca de agua del relay, eventos pendientes y antigüedad del más viejo"
+)
+async def outbox_metrics(session: Annotated[AsyncSession, Depends(get_db_session)]):
+    """Retorna el estado del relay del outbox."""
+    return await outbox_relay.snapshot(session)
@@ -0,0 +1,89 @@
+"""
+Paginación por cursor (keyset) sobre (created_at, id).
+
+A diferencia de OFFSET/LIMIT, cada página continúa exactamente donde terminó
+la anterior con `WHERE (created_at, id) > (:created_at, :id)`, que un índice
+compuesto resuelve sin recorrer las filas ya leídas: la página 10.000 cuesta
+lo mismo que la primera. El cursor es opaco para el cliente.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_
+
+from src.core.exceptions import ValidationError
+
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Cabecera con el cursor de la página siguiente en los listados que retornan una lista
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class Page(Generic[T]):
+    """Una página de resultados y el cursor para pedir la siguiente (None si es la última)."""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(created_at: datetime, entity_id: UUID) -> str:
+    """Codifica la posición (created_at, id) del último elemento como token opaco."""
+    payload = json.dumps({"c": created_at.isoformat(), "i": str(entity_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decodifica un token generado por `encode_cursor`.
+
+    Raises:
+        ValidationError: Si el cursor está mal formado
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), UUID(payload["i"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValidationError("Cursor de paginación inválido", field="cursor")
+
+
+def clamp_page_size(limit: int) -> int:
+    """Limita el tamaño de página al rango permitido."""
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def keyset_paginate(stmt: Select, created_column, id_column, cursor: Optional[str], limit: int) -> Select:
+    """
+    Aplica el filtro keyset, el orden determinista y el límite a una consulta.
+
+    Pide un elemento extra para saber si existe una página siguiente.
+    """
+    if cursor:
+        created_at, entity_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(created_column, id_column) > (created_at, entity_id))
+
+    return stmt.order_by(created_column, id_column).limit(limit + 1)
+
+
+def set_next_cursor_header(response, page: Page) -> None:
+    """Expone el cursor de la página siguiente en la cabecera de la respuesta."""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+
+
+def build_page(items: List[T], limit: int, key: Callable[[T], Tuple[datetime, UUID]]) -> Page[T]:
+    """Recorta el elemento extra y calcula el cursor de la siguiente página."""
+    if len(items) <= limit:
+        return Page(items=items)
+
+    items = items[:limit]
+    return Page(items=items, next_cursor=encode_cursor(*key(items[-1])))
@@ -0,0 +1,160 @@
+"""
+Métricas del pool de conexiones.
+
+Los contadores se alimentan de los eventos de pool de SQLAlchemy
+(connect, checkout, checkin, invalidate) y el tiempo de espera en el checkout
+se mide con un pool instrumentado. Permite detectar el agotamiento del pool
+bajo carga: conexiones prestadas vs. ociosas, uso de overflow y esperas.
+"""
+import time
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolMetrics:
+    """
+    Acumulador de métricas de un pool de conexiones.
+
+    Los eventos de pool se disparan desde el hilo/greenlet del driver,
+    por lo que las actualizaciones se protegen con un lock.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._engine = None
+        self._lock = Lock()
+        self.connections_created = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.peak_checked_out = 0
+        self._checked_out = 0
+        self._wait_count = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def instrument(self, engine: AsyncEngine) -> "PoolMetrics":
+        """Registra los listeners de eventos sobre el pool del motor."""
+        target = engine.sync_engine
+        self._engine = target
+
+        event.listen(target, "connect", self._on_connect)
+        event.listen(target, "checkout", self._on_checkout)
+        event.listen(target, "checkin", self._on_checkin)
+        event.listen(target, "invalidate", self._on_invalidate)
+        return self
+
+    # Listeners de eventos
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connections_created += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self._checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self._checked_out)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.checkins += 1
+            self._checked_out = max(0, self._checked_out - 1)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    # Registro desde el pool instrumentado
+
+    def record_wait(self, seconds: float) -> None:
+        """Registra el tiempo que tardó un checkout en obtener conexión."""
+        with self._lock:
+            self._wait_count += 1
+            self._wait_total += seconds
+            self._wait_max = max(self._wait_max, seconds)
+
+    def record_timeout(self) -> None:
+        """Registra un checkout que agotó pool_timeout."""
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Retorna una foto de las métricas actuales del pool."""
+        pool = self._engine.pool if self._engine is not None else None
+        size = pool.size() if hasattr(pool, "size") else None
+        checked_out = pool.checkedout() if hasattr(pool, "checkedout") else self._checked_out
+        idle = pool.checkedin() if hasattr(pool, "checkedin") else None
+        overflow = pool.overflow() if hasattr(pool, "overflow") else None
+
+        with self._lock:
+            average_wait = self._wait_total / self._wait_count if self._wait_count else 0.0
+            return {
+                "pool_class": type(pool).__name__ if pool is not None else None,
+                "pool_size": size,
+                "max_overflow": getattr(pool, "_max_overflow", None),
+                "checked_out": checked_out,
+                "idle": idle,
+                "overflow": max(overflow, 0) if overflow is not None else None,
+                "peak_checked_out": self.peak_checked_out,
+                "connections_created": self.connections_created,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "checkout_wait_ms": {
+                    "count": self._wait_count,
+                    "avg": round(average_wait * 1000, 3),
+                    "max": round(self._wait_max * 1000, 3),
+                },
+            }
+
+
+# Registro de métricas por nombre de pool ("primary", réplicas...)
+_registry: Dict[str, PoolMetrics] = {}
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> PoolMetrics:
+    """Crea (o reutiliza) las métricas de un motor y las registra por nombre."""
+    metrics = _registry.get(name)
+    if metrics is None:
+        metrics = _registry[name] = PoolMetrics(name)
+    return metrics.instrument(engine)
+
+
+def get_pool_metrics(name: str) -> Optional[PoolMetrics]:
+    """Retorna las métricas registradas con el nombre dado."""
+    return _registry.get(name)
+
+
+def snapshot_all() -> Dict[str, Dict[str, Any]]:
+    """Retorna la foto de todos los pools registrados."""
+    return {name: metrics.snapshot() for name, metrics in _registry.items()}
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Pool asyncio que mide el tiempo de espera de cada checkout.
+
+    El nombre del pool (`pool_logging_name`) se conserva cuando SQLAlchemy
+    recrea el pool, por lo que se usa para localizar sus métricas.
+    """
+
+    def _do_get(self):
+        metrics = _registry.get(self._orig_logging_name)
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            if metrics is not None:
+                metrics.record_timeout()
+            raise
+        finally:
+            if metrics is not None:
+                metrics.record_wait(time.perf_counter() - started)
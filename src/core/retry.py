@@ -0,0 +1,98 @@
+"""
+Política de reintentos para conflictos de concurrencia optimista.
+
+Cuando dos peticiones editan la misma entidad, la segunda en escribir recibe
+un ConcurrencyError. En lugar de devolver el error al cliente, el caso de uso
+se vuelve a ejecutar (releyendo la versión actual) tras una espera con jitter.
+"""
+import asyncio
+import random
+from dataclasses import dataclass
+from functools import wraps
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+from loguru import logger
+
+from src.core.config import settings
+from src.core.exceptions import ConcurrencyError
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Política de reintentos con backoff exponencial y "full jitter".
+
+    Atributos:
+        max_attempts: Número total de intentos (incluye el primero)
+        base_delay: Espera base en segundos antes del primer reintento
+        max_delay: Tope de espera en segundos para un reintento
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.01
+    max_delay: float = 0.2
+
+    @classmethod
+    def from_settings(cls) -> "RetryPolicy":
+        """Construye la política a partir de la configuración de la aplicación."""
+        return cls(
+            max_attempts=settings.concurrency_retry_attempts,
+            base_delay=settings.concurrency_retry_base_delay,
+            max_delay=settings.concurrency_retry_max_delay
+        )
+
+    def compute_delay(self, attempt: int) -> float:
+        """
+        Calcula la espera antes del reintento número `attempt` (1, 2, ...).
+
+        El jitter reparte los reintentos en el tiempo para que las peticiones
+        que chocaron no vuelvan a chocar entre sí.
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+def retry_on_conflict(
+    policy: Optional[RetryPolicy] = None,
+    retry_on: Tuple[Type[Exception], ...] = (ConcurrencyError,)
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Decorador que re-ejecuta una corrutina cuando falla por conflicto de versión.
+
+    Solo debe aplicarse a casos de uso idempotentes respecto a su lectura:
+    cada intento vuelve a cargar el agregado y recalcula los cambios.
+
+    Args:
+        policy: Política a usar. Si es None se lee de settings en cada llamada.
+        retry_on: Excepciones que disparan un reintento
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            active_policy = policy or RetryPolicy.from_settings()
+            attempt = 1
+
+            while True:
+                try:
+                    return await func(*args, **kwargs)
+                except retry_on as e:
+                    if attempt >= active_policy.max_attempts:
+                        logger.warning(
+                            f"Conflicto de concurrencia en {func.__qualname__} "
+                            f"tras {attempt} intento(s): {e}"
+                        )
+                        raise
+
+                    delay = active_policy.compute_delay(attempt)
+                    logger.debug(
+                        f"Conflicto de concurrencia en {func.__qualname__}, "
+                        f"reintento {attempt} en {delay:.3f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    attempt += 1
+
+        return wrapper
+
+    return decorator
@@ -2,15 +2,42 @@
 Punto de entrada de la aplicación FastAPI.
 Monta los routers de todos los módulos.
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from src.core.config import settings
+from src.core.container import container
+from src.core.database import AsyncSessionLocal
+from src.core.events.event_bus import EventBus
+from src.core.events.outbox import outbox_relay
 from src.core.exception_handlers import register_exception_handlers
 from src.core.logging import setup_logging
+from src.core.metrics import router as metrics_router
+from src.modules.catalogo.api.dependencies import register_catalogo_dependencies
 from src.modules.catalogo.api.router import router as catalogo_router
+from src.modules.catalogo.infrastructure.autocomplete_index import load_autocomplete_index
+from src.modules.catalogo.infrastructure.indexed_repository import load_search_index
+from src.modules.pedidos.api.dependencies import register_pedidos_dependencies
 from src.modules.pedidos.api.router import router as pedidos_router
 from src.modules.usuarios.api.router import router as usuarios_router
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Arranca y detiene la infraestructura de fondo (bus de eventos, relay del outbox e índices en memoria)."""
+    if settings.product_autocomplete_enabled:
+        await load_autocomplete_index(AsyncSessionLocal)
+    if settings.product_search_index_enabled:
+        await load_search_index(AsyncSessionLocal, batch_size=settings.product_search_index_batch_size)
+    if settings.event_bus_mode == EventBus.BACKGROUND:
+        await EventBus.start()
+    if settings.outbox_relay_enabled:
+        outbox_relay.start()
+    yield
+    await outbox_relay.stop()
+    await EventBus.stop()
+
+
 def create_app() -> FastAPI:
     """Factory para crear la aplicación FastAPI."""
     setup_logging()
@@ -19,11 +46,17 @@ def create_app() -> FastAPI:
     from src.modules.pedidos.application.events.handlers import register_order_handlers
     register_order_handlers()
     
+    # Registrar el grafo de dependencias y construir los singletons una sola vez
+    register_catalogo_dependencies(container)
+    register_pedidos_dependencies(container)
+    container.build()
+    
     app = FastAPI(
         title=settings.app_name,
         debug=settings.debug,
         version="1.0.0",
-        description="API con manejo centralizado de excepciones"
+        description="API con manejo centralizado de excepciones",
+        lifespan=lifespan
     )
     
     # Registrar exception handlers globales
@@ -50,6 +83,13 @@ def create_app() -> FastAPI:
         tags=["Usuarios"]
     )
     
+    # Métricas operativas (pool de conexiones, ...)
+    app.include_router(
+        metrics_router,
+        prefix="/metrics",
+        tags=["Métricas"]
+    )
+    
     @app.get("/")
     async def root():
         return {
@@ -1,14 +1,25 @@
 """
 Funciones de Inyección de Dependencias para el módulo de Catálogo.
-Usa Singleton para repositorios y Facade como punto de entrada.
+Usa un registro de repositorios por request y Facade como punto de entrada.
+
+El grafo se registra en el contenedor DI y se resuelve una sola vez al
+arrancar: los casos de uso y la Facade son singletons sin estado que acceden
+al repositorio del request a través de un proxy SCOPED.
 """
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Annotated, Any, Dict, Optional
+
 from fastapi import Depends
-from typing import Annotated
 
-from src.core.database import get_db_session
+from src.core.config import settings
+
+from src.core.container import DIContainer, Lifetime, container, request_scope
+from src.core.unit_of_work import IUnitOfWork, SQLAlchemyUnitOfWork
 from src.modules.catalogo.infrastructure.repository_manager import RepositoryManager
+from src.modules.catalogo.infrastructure.queries import SQLAlchemyProductQueries
+from src.modules.catalogo.infrastructure.cached_queries import CachedProductQueries
 from src.modules.catalogo.application.facade import CatalogoFacade
+from src.modules.catalogo.application.queries import ProductQueries
+from src.modules.catalogo.domain.repositories import ProductRepository
 
 # Casos de Uso
 from src.modules.catalogo.application.features.create_product.use_case import CreateProductUseCase
@@ -17,51 +28,137 @@ from src.modules.catalogo.application.features.reserve_stock.use_case import Res
 from src.modules.catalogo.application.features.get_product.use_case import GetProductUseCase
 from src.modules.catalogo.application.features.update_product.use_case import UpdateProductUseCase
 from src.modules.catalogo.application.features.delete_product.use_case import DeleteProductUseCase
+from src.modules.catalogo.application.features.search_products.use_case import SearchProductsUseCase
+from src.modules.catalogo.application.features.autocomplete_products.use_case import AutocompleteProductsUseCase
+from src.modules.catalogo.application.features.import_products.use_case import ImportProductsUseCase
+from src.modules.catalogo.application.features.export_products.use_case import ExportProductsUseCase
 
 
-# ==================== Singleton Repository Manager ====================
+# ==================== Repository Manager ====================
 
 def get_repository_manager() -> RepositoryManager:
     """
-    Obtiene la instancia Singleton del gestor de repositorios.
+    Obtiene el gestor de repositorios con alcance de request.
     
     Returns:
-        Instancia única del RepositoryManager
+        RepositoryManager (sin estado; el registro vive en el contexto de la tarea)
     """
     return RepositoryManager()
 
 
+# ==================== Registro en el contenedor DI ====================
+
+def register_catalogo_dependencies(di: DIContainer = container):
+    """
+    Registra el grafo de dependencias del módulo Catálogo.
+    
+    - SCOPED: repositorios sobre la sesión del request (primario o lectura),
+      consultas (lado de lectura de CQRS) sobre la sesión de lectura y la
+      unidad de trabajo de la sesión del primario
+    - SINGLETON: Facades (y sus casos de uso) enlazadas a los repositorios vía proxy
+    """
+    di.register(
+        "product_repository",
+        lambda: get_repository_manager().get_product_repository(di.resolve("db_session")),
+        Lifetime.SCOPED
+    )
+    di.register(
+        "product_read_repository",
+        lambda: get_repository_manager().get_product_repository(di.resolve("read_session")),
+        Lifetime.SCOPED
+    )
+    di.register(
+        "product_queries",
+        lambda: _build_queries(di.resolve("read_session")),
+        Lifetime.SCOPED
+    )
+    di.register(
+        "catalogo_unit_of_work",
+        lambda: SQLAlchemyUnitOfWork(di.resolve("db_session")),
+        Lifetime.SCOPED
+    )
+    di.register(
+        "catalogo_facade",
+        lambda: _build_facade(
+            di.proxy("product_repository"), di.proxy("product_queries"), di.proxy("catalogo_unit_of_work")
+        ),
+        Lifetime.SINGLETON
+    )
+    di.register(
+        "catalogo_read_facade",
+        lambda: _build_facade(di.proxy("product_read_repository"), di.proxy("product_queries")),
+        Lifetime.SINGLETON
+    )
+
+
 # ==================== Facade ====================
 
 async def get_catalogo_facade(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
-    repo_manager: Annotated[RepositoryManager, Depends(get_repository_manager)]
+    scope: Annotated[Dict[str, Any], Depends(request_scope)]
 ) -> CatalogoFacade:
     """
     Inyecta la Facade del módulo Catálogo.
     
-    Esta función:
-    1. Obtiene el repositorio desde el Singleton
-    2. Crea instancias de los casos de uso
-    3. Construye y retorna la Facade
+    La Facade se construye una sola vez; `request_scope` enlaza la sesión
+    del request para que el repositorio se resuelva por request.
     
     Args:
-        session: Sesión de base de datos (inyectada por FastAPI)
-        repo_manager: Gestor Singleton de repositorios
+        scope: Scope de DI del request (inyectado por FastAPI)
         
     Returns:
         Instancia configurada de CatalogoFacade
     """
-    # Obtener repositorio desde el Singleton
-    product_repository = repo_manager.get_product_repository(session)
+    return container.resolve("catalogo_facade")
+
+
+async def get_catalogo_read_facade(
+    scope: Annotated[Dict[str, Any], Depends(request_scope)]
+) -> CatalogoFacade:
+    """
+    Inyecta la Facade del módulo Catálogo para endpoints de solo lectura.
+    
+    Usa una sesión de réplica (si hay réplicas configuradas), liberando
+    conexiones del primario para escrituras y checkout.
     
-    # Crear casos de uso con el repositorio
+    Args:
+        scope: Scope de DI del request (inyectado por FastAPI)
+        
+    Returns:
+        Instancia configurada de CatalogoFacade
+    """
+    return container.resolve("catalogo_read_facade")
+
+
+def _build_queries(session) -> ProductQueries:
+    """Consultas del catálogo, con la caché del detalle si la caché de productos está activa."""
+    queries = SQLAlchemyProductQueries(session)
+    if settings.product_cache_enabled:
+        queries = CachedProductQueries(queries)
+    return queries
+
+
+def _build_facade(
+    product_repository: ProductRepository,
+    product_queries: ProductQueries,
+    unit_of_work: Optional[IUnitOfWork] = None
+) -> CatalogoFacade:
+    """
+    Crea los casos de uso sobre el repositorio (y las consultas) y construye la Facade.
+
+    La unidad de trabajo solo la usa la importación (commit por lote); la Facade
+    de lectura no la recibe.
+    """
+    # Crear casos de uso: las lecturas puras usan el lado de consultas
     create_product_uc = CreateProductUseCase(product_repository)
-    list_products_uc = ListProductsUseCase(product_repository)
+    list_products_uc = ListProductsUseCase(product_queries)
     reserve_stock_uc = ReserveStockUseCase(product_repository)
-    get_product_uc = GetProductUseCase(product_repository)
+    get_product_uc = GetProductUseCase(product_queries)
     update_product_uc = UpdateProductUseCase(product_repository)
     delete_product_uc = DeleteProductUseCase(product_repository)
+    search_products_uc = SearchProductsUseCase(product_repository)
+    autocomplete_products_uc = AutocompleteProductsUseCase(product_repository)
+    import_products_uc = ImportProductsUseCase(product_repository, settings.product_import_batch_size, unit_of_work)
+    export_products_uc = ExportProductsUseCase(product_queries, settings.product_export_batch_size)
     
     # Construir y retornar la Facade
     return CatalogoFacade(
@@ -70,6 +167,9 @@ async def get_catalogo_facade(
         reserve_stock_use_case=reserve_stock_uc,
         get_product_use_case=get_product_uc,
         update_product_use_case=update_product_uc,
-        delete_product_use_case=delete_product_uc
+        delete_product_use_case=delete_product_uc,
+        search_products_use_case=search_products_uc,
+        autocomplete_products_use_case=autocomplete_products_uc,
+        import_products_use_case=import_products_uc,
+        export_products_use_case=export_products_uc
     )
-
@@ -16,12 +16,15 @@ from src.modules.catalogo.domain.entities import Product
 class ProductDTOMapper:
     """
     Mapper estático para convertir entre DTOs y entidades de dominio.
+    
+    Las respuestas se crean con `model_construct`: los datos vienen de
+    entidades ya validadas por el dominio.
     """
     
     @staticmethod
     def domain_to_response(product: Product) -> CreateProductResponse:
         """Convierte una entidad Product a CreateProductResponse."""
-        return CreateProductResponse(
+        return CreateProductResponse.model_construct(
             product_id=product.product_id,
             sku=str(product.sku),
             name=product.name,
@@ -36,7 +39,7 @@ class ProductDTOMapper:
     @staticmethod
     def domain_to_get_response(product: Product) -> GetProductResponse:
         """Convierte una entidad Product a GetProductResponse."""
-        return GetProductResponse(
+        return GetProductResponse.model_construct(
             product_id=product.product_id,
             sku=str(product.sku),
             name=product.name,
@@ -46,13 +49,14 @@ class ProductDTOMapper:
             stock=product.stock.quantity,
             is_active=product.is_active,
             created_at=product.created_at,
-            updated_at=product.updated_at
+            updated_at=product.updated_at,
+            version=product.version
         )
 
     @staticmethod
     def domain_to_update_response(product: Product) -> UpdateProductResponse:
         """Convierte una entidad Product a UpdateProductResponse."""
-        return UpdateProductResponse(
+        return UpdateProductResponse.model_construct(
             product_id=product.product_id,
             sku=str(product.sku),
             name=product.name,
@@ -61,5 +65,6 @@ class ProductDTOMapper:
             currency=product.price.currency,
             stock=product.stock.quantity,
             is_active=product.is_active,
-            updated_at=product.updated_at
+            updated_at=product.updated_at,
+            version=product.version
         )
@@ -2,8 +2,13 @@
 Router de FastAPI para el módulo de Catálogo.
 Define los endpoints HTTP para gestionar productos.
 """
-from fastapi import APIRouter, Depends, status
-from typing import List, Annotated
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import List, Annotated, Literal, Optional
+
+from src.core.etag import ETAG_HEADER, make_etag
+from src.core.pagination import NEXT_CURSOR_HEADER, set_next_cursor_header
+from src.core.responses import FastResponseRoute
 
 from src.modules.catalogo.application.facade import CatalogoFacade
 from src.modules.catalogo.application.features.create_product.command import CreateProductCommand
@@ -14,13 +19,28 @@ from src.modules.catalogo.application.features.update_product.command import Upd
 from src.modules.catalogo.application.features.update_product.response import UpdateProductResponse
 from src.modules.catalogo.application.features.delete_product.command import DeleteProductCommand
 from src.modules.catalogo.application.features.delete_product.response import DeleteProductResponse
-from src.modules.catalogo.api.dependencies import get_catalogo_facade
+from src.modules.catalogo.application.features.search_products.command import SearchProductsCommand
+from src.modules.catalogo.application.features.autocomplete_products.command import AutocompleteProductsCommand
+from src.modules.catalogo.application.features.autocomplete_products.response import ProductSuggestionResponse
+from src.modules.catalogo.application.features.import_products.command import ImportProductsCommand
+from src.modules.catalogo.application.features.import_products.response import ImportProductsResponse
+from src.modules.catalogo.application.features.export_products.command import ExportProductsCommand
+from src.modules.catalogo.application.features.export_products.formatters import FORMATS as EXPORT_FORMATS
+from src.modules.catalogo.api.dependencies import get_catalogo_facade, get_catalogo_read_facade
 
 
 from src.modules.catalogo.api.mappers import ProductDTOMapper
 
-# Router del módulo
-router = APIRouter()
+# Router del módulo (respuestas serializadas directamente con Pydantic, sin revalidar)
+router = APIRouter(route_class=FastResponseRoute)
+
+# Content-Type aceptados por la importación masiva -> formato
+IMPORT_MEDIA_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
 
 
 @router.post(
@@ -54,15 +74,57 @@ async def create_product(
     return ProductDTOMapper.domain_to_response(saved_product)
 
 
+@router.post(
+    "/products/import",
+    response_model=ImportProductsResponse,
+    summary="Importar productos en bloque",
+    description=(
+        "Da de alta productos desde un archivo CSV (con cabecera) o NDJSON enviado como cuerpo "
+        "del request. El archivo se procesa a medida que llega, en lotes; los registros "
+        "inválidos o con SKU existente se reportan por número de línea sin detener la importación"
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    }
+)
+async def import_products(
+    request: Request,
+    facade: Annotated[CatalogoFacade, Depends(get_catalogo_facade)]
+) -> ImportProductsResponse:
+    """
+    Importa productos leyendo el cuerpo como flujo (sin cargarlo en memoria).
+    
+    El formato se toma del Content-Type: text/csv o application/x-ndjson.
+    """
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if media_type not in IMPORT_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Content-Type no soportado; use uno de: {', '.join(IMPORT_MEDIA_TYPES)}"
+        )
+    command = ImportProductsCommand(format=IMPORT_MEDIA_TYPES[media_type], content=request.stream())
+    return await facade.import_products(command)
+
+
 @router.get(
     "/products",
     response_model=List[CreateProductResponse],
     summary="Listar productos",
-    description="Obtiene una lista paginada de productos"
+    description=(
+        "Obtiene una lista paginada de productos ordenada por fecha de creación. "
+        f"El cursor de la página siguiente se retorna en la cabecera {NEXT_CURSOR_HEADER}"
+    )
 )
 async def list_products(
-    facade: Annotated[CatalogoFacade, Depends(get_catalogo_facade)],
-    skip: int = 0,
+    facade: Annotated[CatalogoFacade, Depends(get_catalogo_read_facade)],
+    response: Response,
+    cursor: Optional[str] = None,
     limit: int = 100
 ) -> List[CreateProductResponse]:
     """
@@ -70,65 +132,165 @@ async def list_products(
     Usa la Facade del módulo Catálogo.
     
     Args:
-        skip: Número de registros a saltar (paginación)
+        cursor: Cursor opaco de la página anterior (paginación keyset)
         limit: Número máximo de registros a retornar
         facade: Facade del módulo inyectada automáticamente
         
     Returns:
         Lista de productos
     """
-    # La facade retorna una lista de entidades de dominio
-    products = await facade.list_products(skip, limit)
+    # La facade retorna una página de DTOs proyectados desde la base de datos
+    page = await facade.list_products(cursor, limit)
+    set_next_cursor_header(response, page)
+    return page.items
+
+
+@router.get(
+    "/products/search",
+    response_model=List[CreateProductResponse],
+    summary="Buscar productos",
+    description=(
+        "Búsqueda de texto completo en SKU, nombre y descripción, ordenada por relevancia "
+        "y combinable con un rango de precios"
+    )
+)
+async def search_products(
+    facade: Annotated[CatalogoFacade, Depends(get_catalogo_read_facade)],
+    q: Annotated[Optional[str], Query(max_length=200)] = None,
+    min_price: Annotated[Optional[float], Query(ge=0)] = None,
+    max_price: Annotated[Optional[float], Query(ge=0)] = None,
+    skip: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20
+) -> List[CreateProductResponse]:
+    """
+    Busca productos por texto y precio.
     
-    # Mapeamos a lista de DTOs de respuesta
+    Se declara antes de /products/{product_id} para que "search" no se
+    interprete como un ID.
+    """
+    command = SearchProductsCommand(
+        query=q, min_price=min_price, max_price=max_price, skip=skip, limit=limit
+    )
+    products = await facade.search_products(command)
     return [ProductDTOMapper.domain_to_response(p) for p in products]
 
 
+@router.get(
+    "/products/autocomplete",
+    response_model=List[ProductSuggestionResponse],
+    summary="Autocompletar productos",
+    description="Sugerencias por prefijo de SKU o nombre, ordenadas por popularidad (unidades vendidas)"
+)
+async def autocomplete_products(
+    facade: Annotated[CatalogoFacade, Depends(get_catalogo_read_facade)],
+    prefix: Annotated[str, Query(min_length=1, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=20)] = 10
+) -> List[ProductSuggestionResponse]:
+    """
+    Sugiere productos para el texto tecleado.
+    
+    Se resuelve desde el índice de prefijos en memoria, sin consultar la base
+    de datos, una vez cargado al arrancar.
+    """
+    command = AutocompleteProductsCommand(prefix=prefix, limit=limit)
+    return await facade.autocomplete_products(command)
+
+
+@router.get(
+    "/products/export",
+    response_class=StreamingResponse,
+    summary="Exportar el catálogo",
+    description=(
+        "Descarga todos los productos no borrados en NDJSON o CSV. Se lee con una única "
+        "consulta sobre un cursor del servidor (instantánea consistente) y se envía por lotes"
+    ),
+    responses={200: {"content": {export_format.media_type: {} for export_format in EXPORT_FORMATS.values()}}}
+)
+async def export_products(
+    facade: Annotated[CatalogoFacade, Depends(get_catalogo_read_facade)],
+    format: Literal["ndjson", "csv"] = "ndjson"
+) -> StreamingResponse:
+    """
+    Exporta el catálogo como flujo.
+    
+    StreamingResponse espera a que cada bloque se entregue antes de pedir el
+    siguiente, así que un cliente lento frena la lectura del cursor en lugar
+    de acumular filas en memoria.
+    """
+    command = ExportProductsCommand(format=format)
+    return StreamingResponse(
+        facade.export_products(command),
+        media_type=EXPORT_FORMATS[format].media_type,
+        headers={"Content-Disposition": f'attachment; filename="products.{format}"'}
+    )
+
+
 @router.get(
     "/products/{product_id}",
     response_model=GetProductResponse,
     summary="Obtener producto por ID",
-    description="Busca un producto específico por su UUID"
+    description=(
+        "Busca un producto específico por su UUID. Retorna un ETag; con If-None-Match "
+        "responde 304 si el producto no cambió"
+    )
 )
 async def get_product_by_id(
     product_id: str,
-    facade: Annotated[CatalogoFacade, Depends(get_catalogo_facade)]
+    facade: Annotated[CatalogoFacade, Depends(get_catalogo_read_facade)],
+    response: Response,
+    if_none_match: Annotated[Optional[str], Header()] = None
 ) -> GetProductResponse:
     """Obtiene un producto por su ID."""
     command = GetProductCommand(product_id=product_id)
-    return await facade.get_product(command)
+    product = await facade.get_product(command, if_none_match)
+    response.headers[ETAG_HEADER] = make_etag(product.product_id, product.version)
+    return product
 
 
 @router.get(
     "/products/sku/{sku}",
     response_model=GetProductResponse,
     summary="Obtener producto por SKU",
-    description="Busca un producto específico por su SKU"
+    description=(
+        "Busca un producto específico por su SKU. Retorna un ETag; con If-None-Match "
+        "responde 304 si el producto no cambió"
+    )
 )
 async def get_product_by_sku(
     sku: str,
-    facade: Annotated[CatalogoFacade, Depends(get_catalogo_facade)]
+    facade: Annotated[CatalogoFacade, Depends(get_catalogo_read_facade)],
+    response: Response,
+    if_none_match: Annotated[Optional[str], Header()] = None
 ) -> GetProductResponse:
     """Obtiene un producto por su SKU."""
     command = GetProductCommand(sku=sku)
-    return await facade.get_product(command)
+    product = await facade.get_product(command, if_none_match)
+    response.headers[ETAG_HEADER] = make_etag(product.product_id, product.version)
+    return product
 
 
 @router.put(
     "/products/{product_id}",
     response_model=UpdateProductResponse,
     summary="Actualizar producto",
-    description="Actualiza campos de un producto existente"
+    description=(
+        "Actualiza campos de un producto existente. Con If-Match solo se aplica si el "
+        "producto sigue en esa versión (412 en caso contrario)"
+    )
 )
 async def update_product(
     product_id: str,
     command: UpdateProductCommand,
-    facade: Annotated[CatalogoFacade, Depends(get_catalogo_facade)]
+    facade: Annotated[CatalogoFacade, Depends(get_catalogo_facade)],
+    response: Response,
+    if_match: Annotated[Optional[str], Header()] = None
 ) -> UpdateProductResponse:
     """Actualiza un producto."""
     if str(command.product_id) != product_id:
         command.product_id = product_id
-    return await facade.update_product(command)
+    updated = await facade.update_product(command, if_match)
+    response.headers[ETAG_HEADER] = make_etag(updated.product_id, updated.version)
+    return updated
 
 
 @router.delete(
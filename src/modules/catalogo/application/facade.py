@@ -2,7 +2,7 @@
 Facade del módulo Catálogo.
 Proporciona un punto único de entrada para todas las operaciones del catálogo.
 """
-from typing import List
+from typing import AsyncIterator, List, Optional
 
 from src.modules.catalogo.application.interfaces import (
     ICreateProductUseCase,
@@ -10,10 +10,16 @@ from src.modules.catalogo.application.interfaces import (
     IReserveStockUseCase,
     IGetProductUseCase,
     IUpdateProductUseCase,
-    IDeleteProductUseCase
+    IDeleteProductUseCase,
+    ISearchProductsUseCase,
+    IAutocompleteProductsUseCase,
+    IImportProductsUseCase,
+    IExportProductsUseCase
 )
+from src.core.pagination import Page
 from src.modules.catalogo.domain.entities import Product
 from src.modules.catalogo.application.features.create_product.command import CreateProductCommand
+from src.modules.catalogo.application.features.create_product.response import CreateProductResponse
 from src.modules.catalogo.application.features.get_product.command import GetProductCommand
 from src.modules.catalogo.application.features.get_product.response import GetProductResponse
 from src.modules.catalogo.application.features.update_product.command import UpdateProductCommand
@@ -22,6 +28,12 @@ from src.modules.catalogo.application.features.delete_product.command import Del
 from src.modules.catalogo.application.features.delete_product.response import DeleteProductResponse
 from src.modules.catalogo.application.features.reserve_stock.command import ReserveStockCommand
 from src.modules.catalogo.application.features.reserve_stock.response import ReserveStockResponse
+from src.modules.catalogo.application.features.search_products.command import SearchProductsCommand
+from src.modules.catalogo.application.features.autocomplete_products.command import AutocompleteProductsCommand
+from src.modules.catalogo.application.features.autocomplete_products.response import ProductSuggestionResponse
+from src.modules.catalogo.application.features.import_products.command import ImportProductsCommand
+from src.modules.catalogo.application.features.import_products.response import ImportProductsResponse
+from src.modules.catalogo.application.features.export_products.command import ExportProductsCommand
 
 
 class CatalogoFacade:
@@ -41,7 +53,11 @@ class CatalogoFacade:
         reserve_stock_use_case: IReserveStockUseCase,
         get_product_use_case: IGetProductUseCase,
         update_product_use_case: IUpdateProductUseCase,
-        delete_product_use_case: IDeleteProductUseCase
+        delete_product_use_case: IDeleteProductUseCase,
+        search_products_use_case: ISearchProductsUseCase,
+        autocomplete_products_use_case: IAutocompleteProductsUseCase,
+        import_products_use_case: IImportProductsUseCase,
+        export_products_use_case: IExportProductsUseCase
     ):
         """
         Constructor con inyección de dependencias.
@@ -52,6 +68,10 @@ class CatalogoFacade:
         self._get_product = get_product_use_case
         self._update_product = update_product_use_case
         self._delete_product = delete_product_use_case
+        self._search_products = search_products_use_case
+        self._autocomplete_products = autocomplete_products_use_case
+        self._import_products = import_products_use_case
+        self._export_products = export_products_use_case
     
     # ==================== Operaciones de Productos ====================
     
@@ -71,18 +91,72 @@ class CatalogoFacade:
         """
         return await self._create_product.execute(command)
     
-    async def list_products(self, skip: int = 0, limit: int = 100) -> List[Product]:
+    async def list_products(self, cursor: Optional[str] = None, limit: int = 100) -> Page[CreateProductResponse]:
         """
-        Lista productos del catálogo.
+        Lista productos del catálogo (paginación por cursor).
         
         Args:
-            skip: Número de registros a saltar (paginación)
+            cursor: Cursor de la página anterior (None = primera página)
             limit: Número máximo de registros a retornar
             
         Returns:
-            Lista de entidades de dominio Product
+            Página de DTOs de productos
         """
-        return await self._list_products.execute(skip, limit)
+        return await self._list_products.execute(cursor, limit)
+    
+    async def search_products(self, command: SearchProductsCommand) -> List[Product]:
+        """
+        Busca productos por texto y rango de precio.
+        
+        Args:
+            command: Texto, filtros de precio y paginación
+            
+        Returns:
+            Entidades de dominio Product ordenadas por relevancia
+            
+        Raises:
+            ValidationError: Si el rango de precios es inválido
+        """
+        return await self._search_products.execute(command)
+    
+    async def autocomplete_products(self, command: AutocompleteProductsCommand) -> List[ProductSuggestionResponse]:
+        """
+        Sugiere productos por prefijo de SKU o nombre.
+        
+        Args:
+            command: Prefijo tecleado y número de sugerencias
+            
+        Returns:
+            Sugerencias ordenadas por popularidad
+        """
+        return await self._autocomplete_products.execute(command)
+    
+    async def import_products(self, command: ImportProductsCommand) -> ImportProductsResponse:
+        """
+        Importa productos en bloque desde un archivo CSV o NDJSON.
+        
+        Args:
+            command: Formato y contenido (flujo de bytes) del archivo
+            
+        Returns:
+            Totales de la importación y los registros rechazados por línea
+            
+        Raises:
+            ValidationError: Si el archivo no tiene un formato legible
+        """
+        return await self._import_products.execute(command)
+    
+    def export_products(self, command: ExportProductsCommand) -> AsyncIterator[bytes]:
+        """
+        Exporta todos los productos no borrados.
+        
+        Args:
+            command: Formato de exportación (NDJSON o CSV)
+            
+        Returns:
+            Flujo de bloques de bytes, leído del cursor a medida que se consume
+        """
+        return self._export_products.execute(command)
     
     # ==================== Operaciones de Stock ====================
     
@@ -105,13 +179,13 @@ class CatalogoFacade:
         """
         return await self._reserve_stock.execute(command)
 
-    async def get_product(self, command: GetProductCommand) -> GetProductResponse:
-        """Obtiene un producto por ID o SKU."""
-        return await self._get_product.execute(command)
+    async def get_product(self, command: GetProductCommand, if_none_match: Optional[str] = None) -> GetProductResponse:
+        """Obtiene un producto por ID o SKU (NotModifiedError si el ETag del cliente sigue vigente)."""
+        return await self._get_product.execute(command, if_none_match)
         
-    async def update_product(self, command: UpdateProductCommand) -> UpdateProductResponse:
-        """Actualiza un producto existente."""
-        return await self._update_product.execute(command)
+    async def update_product(self, command: UpdateProductCommand, if_match: Optional[str] = None) -> UpdateProductResponse:
+        """Actualiza un producto existente (condicionado al ETag `if_match`, si se indica)."""
+        return await self._update_product.execute(command, if_match)
         
     async def delete_product(self, command: DeleteProductCommand) -> DeleteProductResponse:
         """Elimina o desactiva un producto."""
@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+
+class AutocompleteProductsCommand(BaseModel):
+    """Comando para sugerir productos a partir de un prefijo de SKU o nombre."""
+    prefix: str = Field(..., min_length=1, max_length=100)
+    limit: int = Field(10, ge=1, le=20)
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+from uuid import UUID
+
+
+class ProductSuggestionResponse(BaseModel):
+    """Sugerencia de autocompletado."""
+    product_id: UUID
+    sku: str
+    name: str
@@ -0,0 +1,33 @@
+"""
+Caso de Uso: Autocompletar Productos.
+Sugiere productos cuyo SKU o nombre empieza por el texto tecleado.
+"""
+from typing import List
+
+from src.modules.catalogo.application.features.autocomplete_products.command import AutocompleteProductsCommand
+from src.modules.catalogo.application.features.autocomplete_products.response import ProductSuggestionResponse
+from src.modules.catalogo.application.interfaces import IAutocompleteProductsUseCase
+from src.modules.catalogo.domain.repositories import ProductRepository
+
+
+class AutocompleteProductsUseCase(IAutocompleteProductsUseCase):
+    """
+    Caso de Uso: Autocompletar productos del catálogo.
+    
+    Las sugerencias se ordenan por popularidad (unidades vendidas).
+    """
+    
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+    
+    async def execute(self, command: AutocompleteProductsCommand) -> List[ProductSuggestionResponse]:
+        """Retorna las sugerencias más populares para el prefijo."""
+        prefix = command.prefix.lstrip()
+        if not prefix:
+            return []
+        
+        suggestions = await self.product_repository.suggest(prefix, command.limit)
+        return [
+            ProductSuggestionResponse(product_id=s.product_id, sku=s.sku, name=s.name)
+            for s in suggestions
+        ]
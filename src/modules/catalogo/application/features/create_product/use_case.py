@@ -16,9 +16,9 @@ class CreateProductUseCase(ICreateProductUseCase):
     Caso de Uso: Crear un nuevo producto en el catálogo.
     
     Responsabilidades:
-    1. Validar que el SKU no exista
-    2. Crear la entidad Product con los Value Objects
-    3. Persistir usando el repositorio
+    1. Crear la entidad Product con los Value Objects
+    2. Persistirla solo si el SKU no existe (el índice único lo garantiza
+       en la misma escritura, sin consulta previa)
     """
         
     def __init__(self, product_repository: ProductRepository):
@@ -54,11 +54,10 @@ class CreateProductUseCase(ICreateProductUseCase):
                 initial_stock=command.initial_stock
             )
         
-        # 1. Verificar que el SKU no exista (regla de negocio)
-        if await self.product_repository.exists_by_sku(product.sku):
+        # Persistir si el SKU no existe (regla de negocio) y retornar la entidad de dominio
+        saved = await self.product_repository.save_if_sku_available(product)
+        if saved is None:
             raise BusinessRuleViolation(
                 f"Ya existe un producto con el SKU: {product.sku}"
             )
-        
-        # 2. Persistir y retornar la entidad de dominio
-        return await self.product_repository.save(product)
+        return saved
@@ -7,6 +7,7 @@ from src.modules.catalogo.application.features.delete_product.command import Del
 from src.modules.catalogo.application.features.delete_product.response import DeleteProductResponse
 from src.modules.catalogo.domain.repositories import ProductRepository
 from src.core.exceptions import NotFoundError
+from src.core.retry import retry_on_conflict
 
 class DeleteProductUseCase(IDeleteProductUseCase):
     """
@@ -16,6 +17,7 @@ class DeleteProductUseCase(IDeleteProductUseCase):
     def __init__(self, product_repository: ProductRepository):
         self.product_repository = product_repository
         
+    @retry_on_conflict()
     async def execute(self, command: DeleteProductCommand) -> DeleteProductResponse:
         """
         Ejecuta la eliminación o desactivación.
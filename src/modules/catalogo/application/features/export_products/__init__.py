@@ -0,0 +1 @@
+# ExportProducts Feature
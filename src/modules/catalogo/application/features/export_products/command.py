@@ -0,0 +1,11 @@
+"""
+Command (DTO) para exportar el catálogo completo.
+"""
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class ExportProductsCommand(BaseModel):
+    """DTO de entrada para la exportación del catálogo."""
+    format: Literal["ndjson", "csv"] = Field("ndjson", description="Formato del archivo")
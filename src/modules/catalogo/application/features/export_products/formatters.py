@@ -0,0 +1,56 @@
+"""
+Formatos de exportación del catálogo (NDJSON y CSV).
+
+Cada lote de productos se codifica en un único bloque de bytes, que es lo
+que se envía al cliente: un envío por lote en lugar de uno por fila.
+"""
+import csv
+import io
+from datetime import datetime
+from typing import Callable, List, NamedTuple
+
+from pydantic import TypeAdapter
+
+from src.modules.catalogo.application.features.get_product.response import GetProductResponse
+
+
+# Columnas exportadas (las del DTO de detalle), en orden
+EXPORT_COLUMNS = tuple(GetProductResponse.model_fields)
+
+_product_adapter = TypeAdapter(GetProductResponse)
+
+
+class ExportFormat(NamedTuple):
+    """Media type, cabecera y codificador de lotes de un formato."""
+    media_type: str
+    header: bytes
+    encode: Callable[[List[GetProductResponse]], bytes]
+
+
+def encode_ndjson(products: List[GetProductResponse]) -> bytes:
+    """Un objeto JSON por línea, serializado por Pydantic directamente a bytes."""
+    return b"".join(_product_adapter.dump_json(product) + b"\n" for product in products)
+
+
+def _csv_bytes(rows) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode()
+
+
+def encode_csv(products: List[GetProductResponse]) -> bytes:
+    """Una fila por producto; las fechas en ISO 8601 como en las respuestas JSON."""
+    return _csv_bytes(
+        [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in (getattr(product, column) for column in EXPORT_COLUMNS)
+        ]
+        for product in products
+    )
+
+
+# Formatos soportados: nombre -> formato
+FORMATS = {
+    "ndjson": ExportFormat("application/x-ndjson", b"", encode_ndjson),
+    "csv": ExportFormat("text/csv", _csv_bytes([EXPORT_COLUMNS]), encode_csv),
+}
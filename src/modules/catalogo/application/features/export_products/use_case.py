@@ -0,0 +1,61 @@
+"""
+Caso de Uso: Exportar Productos.
+Genera el catálogo completo como un flujo de bytes (NDJSON o CSV).
+"""
+from typing import AsyncIterator, List
+
+from loguru import logger
+
+from src.modules.catalogo.application.features.export_products.command import ExportProductsCommand
+from src.modules.catalogo.application.features.export_products.formatters import FORMATS, ExportFormat
+from src.modules.catalogo.application.features.get_product.response import GetProductResponse
+from src.modules.catalogo.application.interfaces import IExportProductsUseCase
+from src.modules.catalogo.application.queries import ProductQueries
+
+
+class ExportProductsUseCase(IExportProductsUseCase):
+    """
+    Caso de Uso: Exportar todos los productos no borrados.
+
+    Lee el catálogo con una única consulta sobre un cursor del servidor y
+    codifica cada lote según se recibe: la memoria usada depende de
+    `batch_size`, no del tamaño del catálogo. El siguiente lote no se lee
+    hasta que el anterior se entregó al cliente (contrapresión).
+    """
+
+    def __init__(self, product_queries: ProductQueries, batch_size: int = 1000):
+        """
+        Args:
+            product_queries: Consultas de productos (lado de lectura)
+            batch_size: Filas por lote leído del cursor
+        """
+        self.product_queries = product_queries
+        self.batch_size = batch_size
+
+    def execute(self, command: ExportProductsCommand) -> AsyncIterator[bytes]:
+        """
+        Ejecuta el caso de uso.
+
+        Las consultas se resuelven aquí, durante el request; el flujo
+        retornado se consume después, mientras se envía la respuesta.
+
+        Args:
+            command: Formato de exportación
+
+        Returns:
+            Flujo de bloques de bytes (cabecera y un bloque por lote)
+        """
+        batches = self.product_queries.stream_products(self.batch_size)
+        return self._encode(batches, FORMATS[command.format])
+
+    @staticmethod
+    async def _encode(batches: AsyncIterator[List[GetProductResponse]], export_format: ExportFormat) -> AsyncIterator[bytes]:
+        if export_format.header:
+            yield export_format.header
+
+        exported = 0
+        async for products in batches:
+            exported += len(products)
+            yield export_format.encode(products)
+
+        logger.info(f"Exportación del catálogo ({export_format.media_type}): {exported} productos")
@@ -15,3 +15,4 @@ class GetProductResponse(BaseModel):
     is_active: bool
     created_at: datetime
     updated_at: datetime
+    version: int  # Versión de la fila (base del ETag)
@@ -2,47 +2,56 @@
 Caso de Uso: Obtener Producto.
 Permite buscar un producto por su ID único o por su SKU.
 """
+from typing import Optional
+
 from src.modules.catalogo.application.interfaces import IGetProductUseCase
 from src.modules.catalogo.application.features.get_product.command import GetProductCommand
 from src.modules.catalogo.application.features.get_product.response import GetProductResponse
-from src.modules.catalogo.domain.repositories import ProductRepository
-from src.core.exceptions import NotFoundError, ValidationError
+from src.modules.catalogo.application.queries import ProductQueries
+from src.core.etag import etag_matches, make_etag
+from src.core.exceptions import NotFoundError, NotModifiedError, ValidationError
 
 class GetProductUseCase(IGetProductUseCase):
     """
     Caso de Uso: Obtener un producto del catálogo.
     """
     
-    def __init__(self, product_repository: ProductRepository):
-        self.product_repository = product_repository
+    def __init__(self, queries: ProductQueries):
+        self.queries = queries
         
-    async def execute(self, command: GetProductCommand) -> GetProductResponse:
+    async def execute(self, command: GetProductCommand, if_none_match: Optional[str] = None) -> GetProductResponse:
         """
         Busca un producto según los criterios del comando.
+        
+        Es una lectura pura: se proyecta directamente a GetProductResponse.
+        Primero se lee solo la versión actual, que decide el 304 y con la que
+        se pide el detalle: la respuesta (y su ETag) nunca es una copia
+        cacheada de una versión anterior.
+        
+        Args:
+            command: Criterios de búsqueda (ID o SKU)
+            if_none_match: ETags que ya tiene el cliente (cabecera If-None-Match)
+            
+        Raises:
+            NotModifiedError: Si el ETag del cliente sigue vigente (solo se lee la versión)
         """
         if not command.product_id and not command.sku:
             raise ValidationError("Debe proporcionar product_id o sku")
-            
-        product = None
         
         if command.product_id:
-            product = await self.product_repository.get_by_id(command.product_id)
-            if not product:
-                raise NotFoundError("Product", str(command.product_id))
+            current = await self.queries.get_version(command.product_id)
         else:
-            product = await self.product_repository.get_by_sku(command.sku)
-            if not product:
-                raise NotFoundError("Product", command.sku)
-                
-        return GetProductResponse(
-            product_id=product.product_id,
-            sku=str(product.sku),
-            name=product.name,
-            description=product.description,
-            price=product.price.amount,
-            currency=product.price.currency,
-            stock=product.stock.quantity,
-            is_active=product.is_active,
-            created_at=product.created_at,
-            updated_at=product.updated_at
-        )
+            current = await self.queries.get_version_by_sku(command.sku)
+        if current is None:
+            raise NotFoundError("Product", str(command.product_id or command.sku))
+        
+        product_id, version = current
+        if if_none_match:
+            etag = make_etag(product_id, version)
+            if etag_matches(if_none_match, etag):
+                raise NotModifiedError(etag)
+        
+        product = await self.queries.get_by_id(product_id, version)
+        if not product:
+            raise NotFoundError("Product", str(command.product_id or command.sku))
+        return product
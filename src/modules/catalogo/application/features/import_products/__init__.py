@@ -0,0 +1 @@
+# ImportProducts Feature
@@ -0,0 +1,19 @@
+"""
+Command (DTO) para importar productos en bloque.
+"""
+from typing import AsyncIterable, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ImportProductsCommand(BaseModel):
+    """
+    DTO de entrada para la importación masiva.
+
+    `content` es el cuerpo del request como flujo de bloques de bytes: se lee
+    a medida que llega. Cada registro tiene los campos de CreateProductCommand.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    format: Literal["csv", "ndjson"] = Field(..., description="Formato del archivo")
+    content: AsyncIterable[bytes] = Field(..., description="Cuerpo del archivo (flujo de bytes)")
@@ -0,0 +1,139 @@
+"""
+Lectura incremental de los formatos de importación (CSV y NDJSON).
+
+Los parsers consumen el cuerpo como un flujo de bloques de bytes y emiten
+una fila por registro a medida que llegan, sin cargar el archivo completo en
+memoria. Cada fila lleva su número de línea para poder reportar los rechazos.
+"""
+import codecs
+import csv
+import json
+from collections import deque
+from typing import Any, AsyncIterable, AsyncIterator, Dict, NamedTuple, Optional, Tuple
+
+from src.core.exceptions import ValidationError
+
+
+# Columnas obligatorias del CSV (el resto toma los valores por defecto de CreateProductCommand)
+REQUIRED_CSV_COLUMNS = ("sku", "name", "price")
+
+
+class ImportRow(NamedTuple):
+    """Registro leído del archivo: sus datos o, si no se pudo leer, el error."""
+    line: int
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+async def _iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Convierte el flujo de bytes en líneas (sin el salto de línea) numeradas desde 1.
+
+    Acepta BOM de UTF-8 y finales de línea CRLF; los bytes inválidos se
+    reemplazan para que el error se reporte en la fila afectada.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    number = 0
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            number += 1
+            yield number, line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield number + 1, buffer.rstrip("\r")
+
+
+async def parse_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportRow]:
+    """Un objeto JSON por línea; las líneas vacías se ignoran."""
+    async for number, line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield ImportRow(number, error=f"JSON inválido: {e}")
+            continue
+        if not isinstance(data, dict):
+            yield ImportRow(number, error="Cada línea debe ser un objeto JSON")
+            continue
+        yield ImportRow(number, data=data)
+
+
+class _LineFeed:
+    """Iterador de líneas alimentado a mano; el lector CSV se queda con él."""
+
+    def __init__(self):
+        self.lines = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+async def parse_csv(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportRow]:
+    """
+    CSV con cabecera (nombres de columna de CreateProductCommand).
+
+    Un registro puede ocupar varias líneas si tiene campos entre comillas con
+    saltos de línea: las líneas se acumulan hasta que las comillas cierran y
+    solo entonces se entregan al lector CSV, que nunca se queda sin entrada a
+    mitad de un registro.
+
+    Raises:
+        ValidationError: Si la cabecera falta o no incluye las columnas obligatorias
+    """
+    feed = _LineFeed()
+    reader = csv.reader(feed)
+    header = None
+    start, quotes = 0, 0
+    async for number, line in _iter_lines(chunks):
+        if not feed.lines:
+            start, quotes = number, 0
+        feed.lines.append(line + "\n")
+        quotes += line.count('"')
+        if quotes % 2:
+            continue  # Campo entre comillas abierto: el registro sigue en la línea siguiente
+
+        try:
+            values = next(reader)
+        except csv.Error as e:
+            feed.lines.clear()
+            yield ImportRow(start, error=f"CSV inválido: {e}")
+            continue
+        if not any(value.strip() for value in values):
+            continue
+
+        if header is None:
+            header = [name.strip().lower() for name in values]
+            missing = [name for name in REQUIRED_CSV_COLUMNS if name not in header]
+            if missing:
+                raise ValidationError(
+                    f"La cabecera del CSV no incluye las columnas: {', '.join(missing)}",
+                    field="header"
+                )
+            continue
+
+        if len(values) != len(header):
+            yield ImportRow(start, error=f"Se esperaban {len(header)} columnas y hay {len(values)}")
+            continue
+        # Las celdas vacías toman el valor por defecto del campo
+        yield ImportRow(start, data={name: value for name, value in zip(header, values) if value != ""})
+
+    if feed.lines:
+        yield ImportRow(start, error="CSV inválido: comillas sin cerrar")
+    elif header is None:
+        raise ValidationError("El CSV está vacío: se esperaba una cabecera", field="header")
+
+
+# Formatos soportados: nombre -> parser
+PARSERS = {
+    "csv": parse_csv,
+    "ndjson": parse_ndjson,
+}
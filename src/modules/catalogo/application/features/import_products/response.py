@@ -0,0 +1,33 @@
+"""
+Response (DTO) para la importación masiva de productos.
+"""
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class RejectedRowResponse(BaseModel):
+    """Registro rechazado: línea del archivo, SKU (si se pudo leer) y motivo."""
+    line: int
+    sku: Optional[str] = None
+    error: str
+
+
+class ImportProductsResponse(BaseModel):
+    """
+    DTO de salida con el resultado de la importación.
+    """
+    received: int
+    imported: int
+    rejected: List[RejectedRowResponse]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "received": 3,
+                "imported": 2,
+                "rejected": [
+                    {"line": 3, "sku": "PROD-12345", "error": "Ya existe un producto con el SKU: PROD-12345"}
+                ]
+            }
+        }
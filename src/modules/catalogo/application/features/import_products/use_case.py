@@ -0,0 +1,144 @@
+"""
+Caso de Uso: Importar Productos.
+Da de alta productos en bloque desde un archivo CSV o NDJSON.
+"""
+from typing import List, Optional, Set, Tuple
+
+from loguru import logger
+from pydantic import ValidationError as PydanticValidationError
+
+from src.core.exceptions import DomainError
+from src.core.unit_of_work import IUnitOfWork
+from src.modules.catalogo.application.features.create_product.command import CreateProductCommand
+from src.modules.catalogo.application.features.import_products.command import ImportProductsCommand
+from src.modules.catalogo.application.features.import_products.parsers import PARSERS, ImportRow
+from src.modules.catalogo.application.features.import_products.response import (
+    ImportProductsResponse,
+    RejectedRowResponse
+)
+from src.modules.catalogo.application.interfaces import IImportProductsUseCase
+from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.domain.factories import ProductFactory
+from src.modules.catalogo.domain.repositories import ProductRepository
+
+
+class ImportProductsUseCase(IImportProductsUseCase):
+    """
+    Caso de Uso: Importar productos en bloque.
+
+    Responsabilidades:
+    1. Leer el archivo de forma incremental (sin cargarlo entero en memoria)
+    2. Validar cada registro como en la creación individual (CreateProductCommand
+       y ProductFactory) y rechazar los SKUs repetidos dentro del archivo
+    3. Por lotes de `batch_size`: persistir con una única escritura masiva que
+       omite los SKUs ya existentes (también los dados de alta mientras tanto)
+    4. Confirmar cada lote con la unidad de trabajo, de modo que la memoria
+       pendiente de commit (índices, invalidaciones de caché) no crece con el archivo
+    5. Reportar cada registro rechazado con su número de línea
+
+    Los registros válidos se guardan aunque otros se rechacen; si la importación
+    se interrumpe, los lotes ya confirmados se conservan.
+    """
+
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        batch_size: int = 1000,
+        unit_of_work: Optional[IUnitOfWork] = None
+    ):
+        """
+        Args:
+            product_repository: Implementación del puerto ProductRepository
+            batch_size: Registros válidos por lote de escritura
+            unit_of_work: Transacción del request; None = un único commit al final del request
+        """
+        self.product_repository = product_repository
+        self.batch_size = batch_size
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, command: ImportProductsCommand) -> ImportProductsResponse:
+        """
+        Ejecuta el caso de uso.
+
+        Args:
+            command: Formato y contenido del archivo
+
+        Returns:
+            Totales de la importación y los registros rechazados
+
+        Raises:
+            ValidationError: Si el archivo no tiene un formato legible (p. ej. CSV sin cabecera)
+        """
+        received, imported = 0, 0
+        rejected: List[RejectedRowResponse] = []
+        seen: Set[str] = set()
+        batch: List[Tuple[int, Product]] = []
+
+        async for row in PARSERS[command.format](command.content):
+            received += 1
+            product = self._build(row, rejected)
+            if product is None:
+                continue
+
+            sku = str(product.sku)
+            if sku in seen:
+                rejected.append(RejectedRowResponse(line=row.line, sku=sku, error="SKU repetido en el archivo"))
+                continue
+            seen.add(sku)
+
+            batch.append((row.line, product))
+            if len(batch) >= self.batch_size:
+                imported += await self._write(batch, rejected)
+                batch = []
+
+        if batch:
+            imported += await self._write(batch, rejected)
+
+        logger.info(
+            f"Importación de productos ({command.format}): {imported} importados, "
+            f"{len(rejected)} rechazados de {received}"
+        )
+        rejected.sort(key=lambda rejection: rejection.line)
+        return ImportProductsResponse(received=received, imported=imported, rejected=rejected)
+
+    @staticmethod
+    def _build(row: ImportRow, rejected: List[RejectedRowResponse]) -> Optional[Product]:
+        """Valida un registro y crea el producto; si no es válido, lo rechaza y retorna None."""
+        if row.error is not None:
+            rejected.append(RejectedRowResponse(line=row.line, error=row.error))
+            return None
+
+        try:
+            command = CreateProductCommand(**row.data)
+            return ProductFactory.create_from_primitives(
+                sku=command.sku,
+                name=command.name,
+                description=command.description,
+                price=command.price,
+                currency=command.currency,
+                initial_stock=command.initial_stock
+            )
+        except PydanticValidationError as e:
+            error = "; ".join(
+                f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" for detail in e.errors()
+            )
+        except DomainError as e:
+            error = e.message
+
+        sku = row.data.get("sku")
+        rejected.append(RejectedRowResponse(line=row.line, sku=str(sku) if sku is not None else None, error=error))
+        return None
+
+    async def _write(self, batch: List[Tuple[int, Product]], rejected: List[RejectedRowResponse]) -> int:
+        """Guarda el lote, rechaza los SKUs que ya existían y confirma la transacción."""
+        inserted = await self.product_repository.save_many([product for _, product in batch])
+        if self.unit_of_work is not None:
+            await self.unit_of_work.commit()
+
+        for line, product in batch:
+            sku = str(product.sku)
+            if sku not in inserted:
+                rejected.append(
+                    RejectedRowResponse(line=line, sku=sku, error=f"Ya existe un producto con el SKU: {sku}")
+                )
+        return len(inserted)
@@ -1,32 +1,33 @@
 """
 Caso de uso para listar productos.
 """
-from typing import List
+from typing import Optional
 
+from src.core.pagination import Page, clamp_page_size
 from src.modules.catalogo.application.interfaces import IListProductsUseCase
-from src.modules.catalogo.domain.repositories import ProductRepository
-from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.application.queries import ProductQueries
+from src.modules.catalogo.application.features.create_product.response import CreateProductResponse
 
 
 class ListProductsUseCase(IListProductsUseCase):
     """
     Caso de uso: Listar Productos.
-    Obtiene una lista paginada de productos del repositorio.
+    Obtiene una lista paginada de productos desde el lado de consultas.
     """
     
-    def __init__(self, repository: ProductRepository):
-        self.repository = repository
+    def __init__(self, queries: ProductQueries):
+        self.queries = queries
     
-    async def execute(self, skip: int = 0, limit: int = 100) -> List[Product]:
+    async def execute(self, cursor: Optional[str] = None, limit: int = 100) -> Page[CreateProductResponse]:
         """
         Ejecuta la lógica de negocio.
         
         Args:
-            skip: Cantidad de registros a saltar
+            cursor: Cursor de la página anterior (None = primera página)
             limit: Cantidad máxima de registros a retornar
             
         Returns:
-            Lista de entidades de dominio Product
+            Página de DTOs de productos
         """
-        # Obtener y retornar entidades del dominio directamente
-        return await self.repository.get_all(skip, limit)
+        # Proyección directa a DTOs (sin pasar por entidades de dominio)
+        return await self.queries.list_products(cursor, clamp_page_size(limit))
@@ -3,14 +3,16 @@ Caso de Uso: Liberar Stock de Productos.
 Este use case es llamado cuando se cancela una orden y necesitamos
 devolver el stock que había sido reservado.
 """
-from typing import List
+from typing import List, Dict
+from uuid import UUID
 
 from src.modules.catalogo.application.features.release_stock.command import ReleaseStockCommand
 from src.modules.catalogo.application.features.release_stock.response import (
     ReleaseStockResponse, ProductStockInfo
 )
 from src.modules.catalogo.domain.repositories import ProductRepository
-from src.core.exceptions import NotFoundError
+from src.modules.catalogo.domain.value_objects import Stock
+from src.core.exceptions import NotFoundError, ValidationError
 
 
 class ReleaseStockUseCase:
@@ -21,10 +23,9 @@ class ReleaseStockUseCase:
     Se llama cuando se cancela una orden para devolver el stock reservado.
     
     Responsabilidades:
-    1. Verificar que todos los productos existan
-    2. Liberar el stock (incrementar la cantidad disponible)
-    3. Actualizar los productos en la base de datos
-    4. Operación transaccional: todo o nada
+    1. Liberar el stock con un único UPDATE para todo el lote
+    2. Verificar con una sola consulta los productos que no se pudieron liberar
+    3. Operación transaccional: todo o nada
     """
     
     def __init__(self, product_repository: ProductRepository):
@@ -48,36 +49,36 @@ class ReleaseStockUseCase:
             
         Raises:
             NotFoundError: Si algún producto no existe
+            ValidationError: Si la liberación excede el stock máximo
         """
-        products_info: List[ProductStockInfo] = []
-        
-        # Fase 1: Verificar que todos los productos existan
+        quantities: Dict[UUID, int] = {}
         for item in command.items:
-            product = await self.product_repository.get_by_id(item.product_id)
-            
-            if not product:
-                raise NotFoundError("Product", str(item.product_id))
+            quantities[item.product_id] = quantities.get(item.product_id, 0) + item.quantity
         
-        # Fase 2: Liberar stock (si llegamos aquí, todos los productos existen)
-        for item in command.items:
-            product = await self.product_repository.get_by_id(item.product_id)
-            
-            # Liberar stock (esto incrementa la cantidad)
-            product.release_stock(item.quantity)
+        # Liberación atómica: un único UPDATE para todo el lote
+        released = await self.product_repository.release_stock(quantities)
+        
+        if len(released) < len(quantities):
+            # La excepción aborta la transacción, descartando la liberación parcial
+            pending = [product_id for product_id in quantities if product_id not in released]
+            products = await self.product_repository.get_by_ids(pending)
             
-            # Actualizar en la base de datos
-            updated_product = await self.product_repository.update(product)
+            for product_id in pending:
+                if product_id not in products:
+                    raise NotFoundError("Product", str(product_id))
             
-            # Agregar información del producto
-            products_info.append(
-                ProductStockInfo(
-                    product_id=updated_product.product_id,
-                    product_name=updated_product.name,
-                    sku=str(updated_product.sku),
-                    released_quantity=item.quantity,
-                    current_stock=updated_product.stock.quantity
-                )
+            raise ValidationError(f"El stock no puede exceder {Stock.MAX_STOCK}")
+        
+        products_info: List[ProductStockInfo] = [
+            ProductStockInfo(
+                product_id=item.product_id,
+                product_name=released[item.product_id].name,
+                sku=str(released[item.product_id].sku),
+                released_quantity=item.quantity,
+                current_stock=released[item.product_id].stock.quantity
             )
+            for item in command.items
+        ]
         
         return ReleaseStockResponse(
             success=True,
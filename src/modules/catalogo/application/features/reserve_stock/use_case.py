@@ -2,13 +2,15 @@
 Caso de Uso: Reservar Stock de Productos.
 Este use case es llamado por el módulo de Pedidos via el Gateway.
 """
-from typing import List
+from typing import List, Dict
+from uuid import UUID
 
 from src.modules.catalogo.application.interfaces import IReserveStockUseCase
 from src.modules.catalogo.application.features.reserve_stock.command import ReserveStockCommand
 from src.modules.catalogo.application.features.reserve_stock.response import (
     ReserveStockResponse, ProductStockInfo
 )
+from src.modules.catalogo.domain.entities import Product
 from src.modules.catalogo.domain.repositories import ProductRepository
 from src.core.exceptions import BusinessRuleViolation, NotFoundError
 
@@ -21,9 +23,10 @@ class ReserveStockUseCase(IReserveStockUseCase):
     Es llamado por el módulo de Pedidos cuando se crea una orden.
     
     Responsabilidades:
-    1. Verificar que todos los productos existan
-    2. Verificar que haya stock suficiente para todos los items
-    3. Reservar el stock (reducir la cantidad disponible)
+    1. Reservar el stock con un único UPDATE condicional (sin leer antes)
+    2. Si algún producto no cumple, lanzar el error: la transacción de la
+       petición se revierte y con ella la reserva parcial
+    3. Informar si el fallo se debe a un producto inexistente o sin stock
     4. Operación transaccional: todo o nada
     """
     
@@ -50,47 +53,72 @@ class ReserveStockUseCase(IReserveStockUseCase):
             NotFoundError: Si algún producto no existe
             BusinessRuleViolation: Si no hay stock suficiente
         """
-        products_info: List[ProductStockInfo] = []
+        quantities = self._aggregate_quantities(command)
         
-        # Fase 1: Verificar que todos los productos existan y tengan stock
+        # Reserva atómica: un único UPDATE condicional para todo el lote
+        reserved = await self.product_repository.reserve_stock(quantities)
+        
+        if len(reserved) < len(quantities):
+            # Todo o nada: el error revierte la transacción, incluida la reserva parcial
+            await self._raise_reservation_error(quantities, reserved)
+        
+        products_info: List[ProductStockInfo] = [
+            ProductStockInfo(
+                product_id=item.product_id,
+                product_name=reserved[item.product_id].name,
+                sku=str(reserved[item.product_id].sku),
+                requested_quantity=item.quantity,
+                reserved_quantity=item.quantity,
+                remaining_stock=reserved[item.product_id].stock.quantity,
+                unit_price=reserved[item.product_id].price.amount
+            )
+            for item in command.items
+        ]
+        
+        return ReserveStockResponse(
+            success=True,
+            products=products_info,
+            message=f"Stock reservado exitosamente para {len(products_info)} producto(s)"
+        )
+    
+    @staticmethod
+    def _aggregate_quantities(command: ReserveStockCommand) -> Dict[UUID, int]:
+        """Agrupa las cantidades por producto (un producto puede repetirse en el pedido)."""
+        quantities: Dict[UUID, int] = {}
         for item in command.items:
-            product = await self.product_repository.get_by_id(item.product_id)
+            quantities[item.product_id] = quantities.get(item.product_id, 0) + item.quantity
+        return quantities
+    
+    async def _raise_reservation_error(
+        self,
+        quantities: Dict[UUID, int],
+        reserved: Dict[UUID, Product]
+    ) -> None:
+        """
+        Determina por qué falló la reserva y lanza el error correspondiente.
+        Solo se ejecuta en el camino de error, por lo que no penaliza el caso feliz.
+        """
+        pending = [product_id for product_id in quantities if product_id not in reserved]
+        products = await self.product_repository.get_by_ids(pending)
+        
+        for product_id in pending:
+            product = products.get(product_id)
+            quantity = quantities[product_id]
             
             if not product:
-                raise NotFoundError("Product", str(item.product_id))
+                raise NotFoundError("Product", str(product_id))
             
-            # Verificar stock disponible
-            if not product.stock.is_available(item.quantity):
+            if not product.is_active:
                 raise BusinessRuleViolation(
-                    f"Stock insuficiente para el producto '{product.name}'. "
-                    f"Disponible: {product.stock.quantity}, Solicitado: {item.quantity}"
+                    f"No se puede reservar stock de un producto inactivo: {product.name}"
                 )
-        
-        # Fase 2: Reservar stock (si llegamos aquí, todo está OK)
-        for item in command.items:
-            product = await self.product_repository.get_by_id(item.product_id)
             
-            # Reservar stock (esto reduce la cantidad)
-            product.reserve_stock(item.quantity)
-            
-            # Actualizar en la base de datos
-            updated_product = await self.product_repository.update(product)
-            
-            # Agregar información del producto
-            products_info.append(
-                ProductStockInfo(
-                    product_id=updated_product.product_id,
-                    product_name=updated_product.name,
-                    sku=str(updated_product.sku),
-                    requested_quantity=item.quantity,
-                    reserved_quantity=item.quantity,
-                    remaining_stock=updated_product.stock.quantity,
-                    unit_price=updated_product.price.amount
+            if not product.stock.is_available(quantity):
+                raise BusinessRuleViolation(
+                    f"Stock insuficiente para el producto '{product.name}'. "
+                    f"Disponible: {product.stock.quantity}, Solicitado: {quantity}"
                 )
-            )
         
-        return ReserveStockResponse(
-            success=True,
-            products=products_info,
-            message=f"Stock reservado exitosamente para {len(products_info)} producto(s)"
+        raise BusinessRuleViolation(
+            "No se pudo reservar el stock solicitado por un cambio concurrente. Intente nuevamente."
         )
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+
+
+class SearchProductsCommand(BaseModel):
+    """Comando para buscar productos por texto y rango de precio."""
+    query: Optional[str] = Field(None, max_length=200)
+    min_price: Optional[float] = Field(None, ge=0)
+    max_price: Optional[float] = Field(None, ge=0)
+    skip: int = Field(0, ge=0)
+    limit: int = Field(20, ge=1, le=100)
@@ -0,0 +1,46 @@
+"""
+Caso de Uso: Buscar Productos.
+Búsqueda de texto completo combinable con filtros de precio.
+"""
+from typing import List
+
+from src.modules.catalogo.application.features.search_products.command import SearchProductsCommand
+from src.modules.catalogo.application.interfaces import ISearchProductsUseCase
+from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.domain.repositories import ProductRepository
+from src.core.exceptions import ValidationError
+
+
+class SearchProductsUseCase(ISearchProductsUseCase):
+    """
+    Caso de Uso: Buscar productos en el catálogo.
+    
+    Los resultados se ordenan por relevancia cuando hay texto de búsqueda.
+    """
+    
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+    
+    async def execute(self, command: SearchProductsCommand) -> List[Product]:
+        """
+        Ejecuta la búsqueda.
+        
+        Raises:
+            ValidationError: Si el rango de precios es inválido
+        """
+        if (
+            command.min_price is not None
+            and command.max_price is not None
+            and command.min_price > command.max_price
+        ):
+            raise ValidationError("min_price no puede ser mayor que max_price", field="min_price")
+        
+        query = command.query.strip() if command.query else None
+        
+        return await self.product_repository.search(
+            query=query or None,
+            min_price=command.min_price,
+            max_price=command.max_price,
+            skip=command.skip,
+            limit=command.limit
+        )
@@ -13,3 +13,4 @@ class UpdateProductResponse(BaseModel):
     stock: int
     is_active: bool
     updated_at: datetime
+    version: int  # Versión tras la actualización (base del ETag)
@@ -1,13 +1,17 @@
 """
 Caso de Uso: Actualizar Producto.
 """
+from typing import Optional
+
 from loguru import logger
 from src.modules.catalogo.application.interfaces import IUpdateProductUseCase
 from src.modules.catalogo.application.features.update_product.command import UpdateProductCommand
 from src.modules.catalogo.application.features.update_product.response import UpdateProductResponse
 from src.modules.catalogo.domain.repositories import ProductRepository
 from src.modules.catalogo.domain.value_objects import SKU, Price, Stock
-from src.core.exceptions import NotFoundError, BusinessRuleViolation
+from src.core.etag import etag_matches, make_etag
+from src.core.exceptions import NotFoundError, BusinessRuleViolation, PreconditionFailedError
+from src.core.retry import retry_on_conflict
 
 class UpdateProductUseCase(IUpdateProductUseCase):
     """
@@ -17,12 +21,27 @@ class UpdateProductUseCase(IUpdateProductUseCase):
     def __init__(self, product_repository: ProductRepository):
         self.product_repository = product_repository
         
-    async def execute(self, command: UpdateProductCommand) -> UpdateProductResponse:
+    @retry_on_conflict()
+    async def execute(self, command: UpdateProductCommand, if_match: Optional[str] = None) -> UpdateProductResponse:
         """
         Actualiza los campos permitidos de un producto.
+        
+        Con `if_match` (cabecera If-Match) la escritura es condicional: si el
+        producto ya no está en la versión que leyó el cliente se lanza
+        PreconditionFailedError. La versión se lee de la base de datos, no de
+        la caché de productos, que otro worker puede haber dejado desfasada.
+        Un conflicto durante el UPDATE reintenta el caso de uso, que relee la
+        versión y falla aquí.
         """
         logger.info(f"Actualizando producto {command.product_id}")
         
+        if if_match:
+            version = await self.product_repository.get_version(command.product_id)
+            if version is None:
+                raise NotFoundError("Product", str(command.product_id))
+            if not etag_matches(if_match, make_etag(command.product_id, version), weak=False):
+                raise PreconditionFailedError("Product", str(command.product_id))
+        
         # 1. Obtener el producto existente
         product = await self.product_repository.get_by_id(command.product_id)
         if not product:
@@ -59,5 +78,6 @@ class UpdateProductUseCase(IUpdateProductUseCase):
             currency=updated_product.price.currency,
             stock=updated_product.stock.quantity,
             is_active=updated_product.is_active,
-            updated_at=updated_product.updated_at
+            updated_at=updated_product.updated_at,
+            version=updated_product.version
         )
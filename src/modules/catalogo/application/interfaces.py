@@ -3,9 +3,11 @@ Interfaces (Puertos) para los Casos de Uso del módulo Catálogo.
 Estas interfaces permiten la inversión de dependencias (Dependency Inversion Principle).
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List, Optional
 
 from src.modules.catalogo.application.features.create_product.command import CreateProductCommand
+from src.modules.catalogo.application.features.create_product.response import CreateProductResponse
+from src.core.pagination import Page
 from src.modules.catalogo.domain.entities import Product
 from src.modules.catalogo.application.features.reserve_stock.command import ReserveStockCommand
 from src.modules.catalogo.application.features.reserve_stock.response import ReserveStockResponse
@@ -17,6 +19,12 @@ from src.modules.catalogo.application.features.update_product.command import Upd
 from src.modules.catalogo.application.features.update_product.response import UpdateProductResponse
 from src.modules.catalogo.application.features.delete_product.command import DeleteProductCommand
 from src.modules.catalogo.application.features.delete_product.response import DeleteProductResponse
+from src.modules.catalogo.application.features.search_products.command import SearchProductsCommand
+from src.modules.catalogo.application.features.autocomplete_products.command import AutocompleteProductsCommand
+from src.modules.catalogo.application.features.autocomplete_products.response import ProductSuggestionResponse
+from src.modules.catalogo.application.features.import_products.command import ImportProductsCommand
+from src.modules.catalogo.application.features.import_products.response import ImportProductsResponse
+from src.modules.catalogo.application.features.export_products.command import ExportProductsCommand
 
 
 
@@ -55,16 +63,16 @@ class IListProductsUseCase(ABC):
     """
     
     @abstractmethod
-    async def execute(self, skip: int = 0, limit: int = 100) -> List[Product]:
+    async def execute(self, cursor: Optional[str] = None, limit: int = 100) -> Page[CreateProductResponse]:
         """
         Ejecuta el listado de productos.
         
         Args:
-            skip: Número de registros a saltar (paginación)
+            cursor: Cursor de la página anterior (None = primera página)
             limit: Número máximo de registros a retornar
             
         Returns:
-            Lista de entidades de dominio Product
+            Página de DTOs de productos
         """
         pass
 
@@ -123,14 +131,14 @@ class IReleaseStockUseCase(ABC):
 class IGetProductUseCase(ABC):
     """Interfaz para el caso de uso de obtener producto."""
     @abstractmethod
-    async def execute(self, command: GetProductCommand) -> GetProductResponse:
+    async def execute(self, command: GetProductCommand, if_none_match: Optional[str] = None) -> GetProductResponse:
         pass
 
 
 class IUpdateProductUseCase(ABC):
     """Interfaz para el caso de uso de actualizar producto."""
     @abstractmethod
-    async def execute(self, command: UpdateProductCommand) -> UpdateProductResponse:
+    async def execute(self, command: UpdateProductCommand, if_match: Optional[str] = None) -> UpdateProductResponse:
         pass
 
 
@@ -140,3 +148,31 @@ class IDeleteProductUseCase(ABC):
     async def execute(self, command: DeleteProductCommand) -> DeleteProductResponse:
         pass
 
+
+class ISearchProductsUseCase(ABC):
+    """Interfaz para el caso de uso de buscar productos."""
+    @abstractmethod
+    async def execute(self, command: SearchProductsCommand) -> List[Product]:
+        pass
+
+
+class IAutocompleteProductsUseCase(ABC):
+    """Interfaz para el caso de uso de autocompletar productos."""
+    @abstractmethod
+    async def execute(self, command: AutocompleteProductsCommand) -> List[ProductSuggestionResponse]:
+        pass
+
+
+class IImportProductsUseCase(ABC):
+    """Interfaz para el caso de uso de importar productos en bloque."""
+    @abstractmethod
+    async def execute(self, command: ImportProductsCommand) -> ImportProductsResponse:
+        pass
+
+
+class IExportProductsUseCase(ABC):
+    """Interfaz para el caso de uso de exportar el catálogo (flujo de bytes)."""
+    @abstractmethod
+    def execute(self, command: ExportProductsCommand) -> AsyncIterator[bytes]:
+        pass
+
@@ -0,0 +1,73 @@
+"""
+Puerto del lado de consultas (CQRS) del módulo Catálogo.
+
+Las lecturas que solo alimentan una respuesta HTTP no necesitan el modelo de
+dominio: la implementación proyecta las columnas necesarias directamente a
+los DTOs de respuesta. Las escrituras siguen el camino DDD completo
+(repositorio → entidad → reglas de negocio).
+"""
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import UUID
+
+from src.core.pagination import Page
+from src.modules.catalogo.application.features.create_product.response import CreateProductResponse
+from src.modules.catalogo.application.features.get_product.response import GetProductResponse
+
+
+class ProductQueries(ABC):
+    """
+    Consultas de solo lectura sobre productos que retornan DTOs.
+    Esta es una interfaz que será implementada en la capa de Infraestructura.
+    """
+
+    @abstractmethod
+    async def list_products(self, cursor: Optional[str] = None, limit: int = 100) -> Page[CreateProductResponse]:
+        """
+        Obtiene una página de productos no borrados ordenada por (created_at, id).
+        `cursor` es el `next_cursor` de la página anterior (None = primera página).
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, product_id: UUID, version: Optional[int] = None) -> Optional[GetProductResponse]:
+        """
+        Busca un producto no borrado por su ID.
+        Con `version` (la leída con get_version) el resultado debe estar en esa
+        versión: una implementación con caché no puede servir una copia anterior.
+        Retorna None si no existe.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_sku(self, sku: str) -> Optional[GetProductResponse]:
+        """
+        Busca un producto no borrado por su SKU.
+        Retorna None si no existe.
+        """
+        pass
+
+    @abstractmethod
+    async def get_version(self, product_id: UUID) -> Optional[Tuple[UUID, int]]:
+        """
+        Retorna (product_id, version) de un producto no borrado, sin leer el resto de la fila.
+        Retorna None si no existe.
+        """
+        pass
+
+    @abstractmethod
+    async def get_version_by_sku(self, sku: str) -> Optional[Tuple[UUID, int]]:
+        """
+        Retorna (product_id, version) del producto con ese SKU, sin leer el resto de la fila.
+        Retorna None si no existe.
+        """
+        pass
+
+    @abstractmethod
+    def stream_products(self, batch_size: int = 1000) -> AsyncIterator[List[GetProductResponse]]:
+        """
+        Recorre todos los productos no borrados, ordenados por (created_at, id),
+        en lotes de `batch_size` leídos con un cursor del servidor: una sola
+        consulta (una instantánea consistente) con memoria constante.
+        """
+        pass
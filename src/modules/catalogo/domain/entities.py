@@ -8,14 +8,16 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from src.modules.catalogo.domain.value_objects import SKU, Price, Stock
+from src.core.change_tracking import ChangeTracking
 from src.core.exceptions import BusinessRuleViolation
 
 
-@dataclass
-class Product:
+@dataclass(slots=True)
+class Product(ChangeTracking):
     """
     Agregado Raíz: Producto.
     Representa un producto en el catálogo.
+    Registra qué campos cambian desde que se carga (ver ChangeTracking).
     """
     # Identidad
     product_id: UUID = field(default_factory=uuid4)
@@ -31,6 +33,7 @@ class Product:
     is_active: bool = field(default=True)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+    version: int = field(default=1)  # Versión leída (concurrencia optimista)
     
     def __post_init__(self):
         """Validaciones de la entidad."""
@@ -3,11 +3,12 @@ Puertos de Repositorio (Interfaces/Contratos).
 Define CÓMO el dominio quiere persistir datos, sin saber DÓNDE ni CÓMO se implementa.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Set
 from uuid import UUID
 
+from src.core.pagination import Page
 from src.modules.catalogo.domain.entities import Product
-from src.modules.catalogo.domain.value_objects import SKU
+from src.modules.catalogo.domain.value_objects import SKU, ProductSuggestion
 
 
 class ProductRepository(ABC):
@@ -24,6 +25,24 @@ class ProductRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def save_if_sku_available(self, product: Product) -> Optional[Product]:
+        """
+        Guarda un nuevo producto solo si su SKU no está en uso (atómico).
+        Retorna el producto guardado, o None si el SKU ya existía.
+        """
+        pass
+    
+    @abstractmethod
+    async def save_many(self, products: List[Product]) -> Set[str]:
+        """
+        Inserta varios productos nuevos con una única escritura masiva, omitiendo
+        los que tengan un SKU ya en uso (también por productos borrados).
+        No relee los productos guardados (importaciones).
+        Retorna los SKUs insertados.
+        """
+        pass
+    
     @abstractmethod
     async def update(self, product: Product) -> Product:
         """
@@ -32,6 +51,23 @@ class ProductRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def reserve_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, Product]:
+        """
+        Descuenta stock de forma atómica con una única sentencia condicional.
+        Solo se modifican los productos activos, no borrados y con stock suficiente.
+        Retorna los productos efectivamente actualizados, indexados por ID.
+        """
+        pass
+    
+    @abstractmethod
+    async def release_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, Product]:
+        """
+        Devuelve stock de forma atómica con una única sentencia condicional.
+        Retorna los productos efectivamente actualizados, indexados por ID.
+        """
+        pass
+    
     @abstractmethod
     async def get_by_id(self, product_id: UUID) -> Optional[Product]:
         """
@@ -40,6 +76,23 @@ class ProductRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_version(self, product_id: UUID) -> Optional[int]:
+        """
+        Versión actual de un producto leída siempre de la base de datos (nunca
+        de una caché): es la que deciden las precondiciones If-Match.
+        Retorna None si no existe.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_by_ids(self, product_ids: List[UUID]) -> Dict[UUID, Product]:
+        """
+        Busca varios productos en una sola consulta.
+        Retorna un diccionario indexado por ID; los inexistentes no aparecen.
+        """
+        pass
+    
     @abstractmethod
     async def get_by_sku(self, sku: SKU) -> Optional[Product]:
         """
@@ -49,9 +102,10 @@ class ProductRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Product]:
+    async def get_page(self, cursor: Optional[str] = None, limit: int = 100) -> Page[Product]:
         """
-        Obtiene todos los productos con paginación.
+        Obtiene una página de productos ordenada por (created_at, id).
+        `cursor` es el `next_cursor` de la página anterior (None = primera página).
         """
         pass
 
@@ -68,3 +122,11 @@ class ProductRepository(ABC):
         Búsqueda avanzada con filtros dinámicos y búsqueda de texto.
         """
         pass
+
+    @abstractmethod
+    async def suggest(self, prefix: str, limit: int = 10) -> List[ProductSuggestion]:
+        """
+        Autocompletado: productos activos cuyo SKU o nombre empieza por `prefix`,
+        ordenados por popularidad.
+        """
+        pass
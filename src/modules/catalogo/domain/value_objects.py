@@ -3,10 +3,11 @@ Value Objects del dominio de Catálogo.
 Los VOs son inmutables y encapsulan reglas de validación.
 """
 from dataclasses import dataclass
+from uuid import UUID
 from src.core.exceptions import ValidationError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SKU:
     """
     Stock Keeping Unit - Código único de producto.
@@ -30,7 +31,7 @@ class SKU:
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Price:
     """
     Precio del producto.
@@ -78,7 +79,7 @@ class Price:
         return Price(amount=round(self.amount * quantity, 2), currency=self.currency)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Stock:
     """
     Cantidad de stock disponible.
@@ -117,3 +118,15 @@ class Stock:
             raise ValidationError("No se puede aumentar el stock por una cantidad negativa")
         
         return Stock(quantity=self.quantity + amount)
+
+
+@dataclass(frozen=True, slots=True)
+class ProductSuggestion:
+    """
+    Sugerencia de autocompletado: lo mínimo para mostrar y enlazar un producto.
+    `popularity` son las unidades vendidas (reservadas).
+    """
+    product_id: UUID
+    sku: str
+    name: str
+    popularity: int = 0
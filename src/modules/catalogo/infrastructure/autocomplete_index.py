@@ -0,0 +1,221 @@
+"""
+Índice de prefijos en memoria para el autocompletado de productos.
+
+El storefront consulta en cada pulsación de tecla, así que las sugerencias se
+resuelven en el proceso sin tocar la base de datos. Las claves (SKU y nombre
+normalizados) viven en una lista ordenada de tuplas (clave, product_id): un
+prefijo corresponde a un rango contiguo que se localiza con dos bisect.
+
+Solo se indexan productos activos y no borrados. Cada proceso mantiene su
+propia copia, que se carga al arrancar y se actualiza al hacer commit.
+"""
+import bisect
+import heapq
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.domain.value_objects import ProductSuggestion
+from src.modules.catalogo.infrastructure.models import ProductModel
+from src.modules.catalogo.infrastructure.search_index import STOPWORDS, normalize, words
+
+
+# Mayor que cualquier carácter de una clave: cierra el rango de un prefijo
+_PREFIX_END = "\U0010ffff"
+
+
+def prefix_keys(sku: str, name: str) -> List[str]:
+    """
+    Claves indexadas de un producto: el SKU y el nombre completo, más el
+    nombre a partir de cada palabra ("lampara roja" -> "roja"). Las claves
+    son palabras normalizadas separadas por espacios ("ABC-12" -> "abc 12").
+    """
+    name_words = words(name)
+    keys = {" ".join(words(sku))}
+    keys.update(
+        " ".join(name_words[i:]) for i, word in enumerate(name_words) if i == 0 or word not in STOPWORDS
+    )
+    keys.discard("")
+    return sorted(keys)
+
+
+class AutocompleteIndex:
+    """
+    Índice de prefijos sobre SKU y nombre, con ranking por popularidad.
+
+    La popularidad son las unidades vendidas; a igual popularidad se ordena
+    por nombre normalizado.
+    """
+
+    # A partir de este tamaño, add_many ordena una vez en lugar de insertar uno a uno
+    BULK_THRESHOLD = 64
+
+    def __init__(self):
+        self.ready = False
+        self.lookups = 0
+        self.clear()
+
+    def clear(self) -> None:
+        """Vacía el índice."""
+        self._entries: List[Tuple[str, UUID]] = []
+        self._labels: Dict[UUID, Tuple[str, str]] = {}
+        self._sort_names: Dict[UUID, str] = {}
+        self._popularity: Dict[UUID, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    # Mantenimiento
+
+    def add_entry(self, product_id: UUID, sku: str, name: str, popularity: int = 0) -> None:
+        """Indexa (o reindexa) un producto con su popularidad."""
+        if self._labels.get(product_id) == (sku, name):
+            # Mismas claves (p. ej. solo cambió el stock): no hay que reordenar nada
+            self._popularity[product_id] = popularity
+            return
+        self.remove(product_id)
+        self._labels[product_id] = (sku, name)
+        self._sort_names[product_id] = normalize(name)
+        self._popularity[product_id] = popularity
+        for key in prefix_keys(sku, name):
+            bisect.insort(self._entries, (key, product_id))
+
+    def rebuild(self, rows: Iterable[Tuple[UUID, str, str, int]]) -> None:
+        """
+        Reconstruye el índice completo a partir de filas (id, sku, nombre, popularidad).
+
+        Las claves se ordenan una sola vez al final, en lugar de un insort por clave.
+        """
+        self.clear()
+        entries: List[Tuple[str, UUID]] = []
+        for product_id, sku, name, popularity in rows:
+            self._labels[product_id] = (sku, name)
+            self._sort_names[product_id] = normalize(name)
+            self._popularity[product_id] = popularity
+            entries.extend((key, product_id) for key in prefix_keys(sku, name))
+        entries.sort()
+        self._entries = entries
+
+    def add(self, product: Product) -> None:
+        """Indexa un producto conservando su popularidad; los inactivos se retiran."""
+        if not product.is_active:
+            self.remove(product.product_id)
+            return
+        popularity = self._popularity.get(product.product_id, 0)
+        self.add_entry(product.product_id, str(product.sku), product.name, popularity)
+
+    def add_many(self, products: Iterable[Product]) -> None:
+        """
+        Indexa varios productos.
+
+        Los lotes grandes (importaciones) añaden sus claves al final y ordenan
+        una sola vez, en lugar de pagar un insort O(n) por clave.
+        """
+        products = list({product.product_id: product for product in products}.values())
+        if len(products) <= self.BULK_THRESHOLD:
+            for product in products:
+                self.add(product)
+            return
+
+        entries: List[Tuple[str, UUID]] = []
+        for product in products:
+            if not product.is_active:
+                self.remove(product.product_id)
+                continue
+            sku, popularity = str(product.sku), self._popularity.get(product.product_id, 0)
+            if self._labels.get(product.product_id) == (sku, product.name):
+                continue
+            self.remove(product.product_id)
+            self._labels[product.product_id] = (sku, product.name)
+            self._sort_names[product.product_id] = normalize(product.name)
+            self._popularity[product.product_id] = popularity
+            entries.extend((key, product.product_id) for key in prefix_keys(sku, product.name))
+        if entries:
+            self._entries.extend(entries)
+            self._entries.sort()
+
+    def remove(self, product_id: UUID) -> None:
+        """Quita un producto del índice (si estaba indexado)."""
+        labels = self._labels.pop(product_id, None)
+        if labels is None:
+            return
+        self._sort_names.pop(product_id, None)
+        self._popularity.pop(product_id, None)
+        for key in prefix_keys(*labels):
+            position = bisect.bisect_left(self._entries, (key, product_id))
+            if position < len(self._entries) and self._entries[position] == (key, product_id):
+                del self._entries[position]
+
+    def add_popularity(self, quantities: Dict[UUID, int]) -> None:
+        """Suma (o resta, si es negativa) unidades vendidas a los productos indexados."""
+        for product_id, quantity in quantities.items():
+            if product_id in self._popularity:
+                self._popularity[product_id] = max(0, self._popularity[product_id] + quantity)
+
+    # Consultas
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[ProductSuggestion]:
+        """Los `limit` productos más populares cuyo SKU o nombre empieza por `prefix`."""
+        self.lookups += 1
+        key = " ".join(words(prefix))
+        if prefix[-1:].isspace() and key:
+            key += " "
+        if not key:
+            return []
+
+        low = bisect.bisect_left(self._entries, (key,))
+        high = bisect.bisect_left(self._entries, (key + _PREFIX_END,), low)
+        matches = {product_id for _, product_id in self._entries[low:high]}
+        best = heapq.nsmallest(
+            limit, matches, key=lambda pid: (-self._popularity[pid], self._sort_names[pid], pid)
+        )
+        return [
+            ProductSuggestion(
+                product_id=pid, sku=self._labels[pid][0], name=self._labels[pid][1], popularity=self._popularity[pid]
+            )
+            for pid in best
+        ]
+
+    def snapshot(self) -> Dict[str, object]:
+        """Retorna el tamaño y los contadores del índice."""
+        return {
+            "ready": self.ready,
+            "products": len(self._labels),
+            "keys": len(self._entries),
+            "lookups": self.lookups,
+        }
+
+
+# Índice del proceso compartido por todos los requests
+product_autocomplete_index = AutocompleteIndex()
+
+
+async def load_autocomplete_index(
+    session_factory: async_sessionmaker,
+    index: AutocompleteIndex = product_autocomplete_index,
+    batch_size: int = 1000
+) -> None:
+    """
+    Carga completa del índice desde la base de datos.
+
+    Solo lee las columnas necesarias (sin hidratar entidades) y las recorre
+    en lotes de `batch_size` con un cursor del servidor.
+    """
+    index.ready = False
+    rows = []
+    stmt = (
+        select(ProductModel.product_id, ProductModel.sku, ProductModel.name, ProductModel.units_sold)
+        .where(ProductModel.deleted_at == None, ProductModel.is_active == True)
+        .execution_options(yield_per=batch_size)
+    )
+    async with session_factory() as session:
+        result = await session.stream(stmt)
+        async for partition in result.partitions():
+            rows.extend(tuple(row) for row in partition)
+    index.rebuild(rows)
+    index.ready = True
+    logger.info(f"Índice de autocompletado cargado: {len(index)} productos")
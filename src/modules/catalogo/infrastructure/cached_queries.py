@@ -0,0 +1,108 @@
+"""
+Consultas de productos con caché de lectura (read-through).
+
+El detalle de producto es la lectura más frecuente del catálogo y se sirve
+desde el lado de consultas (DTOs). Esta caché usa las mismas claves que la
+del repositorio (`("id", product_id)` y `("sku", sku)`), de modo que las
+escrituras del repositorio la invalidan al hacer commit igual que a aquella.
+"""
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import UUID
+
+from src.core.cache import MISSING, TTLCache, create_cache
+from src.core.config import settings
+from src.core.database import session_has_writes
+from src.core.pagination import Page
+from src.modules.catalogo.application.features.create_product.response import CreateProductResponse
+from src.modules.catalogo.application.features.get_product.response import GetProductResponse
+from src.modules.catalogo.application.queries import ProductQueries
+
+
+# Caché del proceso compartida por todos los requests
+product_detail_cache = create_cache(
+    "product_details",
+    max_size=settings.product_cache_size,
+    ttl_seconds=settings.product_cache_ttl,
+    negative_ttl_seconds=settings.product_cache_negative_ttl
+)
+
+
+class CachedProductQueries(ProductQueries):
+    """
+    Decorador de ProductQueries con caché del detalle de producto.
+
+    - get_by_id / get_by_sku consultan primero la caché
+    - El SKU solo guarda el ID (índice), como en CachedProductRepository
+    - Las búsquedas sin resultado también se cachean (caché negativa)
+    - get_by_id con `version` revalida la copia contra la versión leída de la
+      base de datos: otro worker puede haber escrito sin invalidar esta caché,
+      y la versión alimenta el ETag de la respuesta
+    - Si la sesión ya escribió, las lecturas van directas a la base de datos
+    - Se devuelven copias: mutar la respuesta nunca altera la caché
+    - Listados, versiones (ETag) y exportación no se cachean
+    """
+
+    def __init__(self, inner: ProductQueries, cache: TTLCache = product_detail_cache):
+        """
+        Args:
+            inner: Consultas reales (SQLAlchemy)
+            cache: Caché del detalle de producto
+        """
+        self.inner = inner
+        self.session = inner.session
+        self.cache = cache
+
+    def _cache_enabled(self) -> bool:
+        return not session_has_writes(self.session)
+
+    def _remember(self, product: GetProductResponse) -> None:
+        self.cache.set(("id", product.product_id), product.model_copy())
+        self.cache.set(("sku", product.sku), product.product_id)
+
+    async def get_by_id(self, product_id: UUID, version: Optional[int] = None) -> Optional[GetProductResponse]:
+        """Busca un producto por su ID, primero en la caché (si está en la versión pedida)."""
+        if not self._cache_enabled():
+            return await self.inner.get_by_id(product_id, version)
+
+        found, cached = self.cache.get(("id", product_id))
+        if found and (version is None or (cached is not MISSING and cached.version == version)):
+            return None if cached is MISSING else cached.model_copy()
+
+        product = await self.inner.get_by_id(product_id)
+        if product is None:
+            self.cache.set(("id", product_id), MISSING)
+        else:
+            self._remember(product)
+        return product
+
+    async def get_by_sku(self, sku: str) -> Optional[GetProductResponse]:
+        """Busca un producto por su SKU usando el índice SKU -> ID de la caché."""
+        if not self._cache_enabled():
+            return await self.inner.get_by_sku(sku)
+
+        found, product_id = self.cache.get(("sku", sku))
+        if found:
+            if product_id is MISSING:
+                return None
+            found, cached = self.cache.get(("id", product_id))
+            if found and cached is not MISSING and cached.sku == sku:
+                return cached.model_copy()
+
+        product = await self.inner.get_by_sku(sku)
+        if product is None:
+            self.cache.set(("sku", sku), MISSING)
+        else:
+            self._remember(product)
+        return product
+
+    async def list_products(self, cursor: Optional[str] = None, limit: int = 100) -> Page[CreateProductResponse]:
+        return await self.inner.list_products(cursor, limit)
+
+    async def get_version(self, product_id: UUID) -> Optional[Tuple[UUID, int]]:
+        return await self.inner.get_version(product_id)
+
+    async def get_version_by_sku(self, sku: str) -> Optional[Tuple[UUID, int]]:
+        return await self.inner.get_version_by_sku(sku)
+
+    def stream_products(self, batch_size: int = 1000) -> AsyncIterator[List[GetProductResponse]]:
+        return self.inner.stream_products(batch_size)
@@ -0,0 +1,199 @@
+"""
+Repositorio de productos con caché de lectura (read-through).
+"""
+import copy
+from typing import Optional, List, Dict, Set
+from uuid import UUID
+
+from src.core.cache import MISSING, TTLCache, create_cache, invalidate_on_commit
+from src.core.config import settings
+from src.core.database import session_has_writes
+from src.core.pagination import Page
+from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.domain.value_objects import SKU, ProductSuggestion
+from src.modules.catalogo.domain.repositories import ProductRepository
+from src.modules.catalogo.infrastructure.cached_queries import product_detail_cache
+
+
+# Caché del proceso compartida por todos los requests
+product_cache = create_cache(
+    "products",
+    max_size=settings.product_cache_size,
+    ttl_seconds=settings.product_cache_ttl,
+    negative_ttl_seconds=settings.product_cache_negative_ttl
+)
+
+
+class CachedProductRepository(ProductRepository):
+    """
+    Decorador de ProductRepository con caché de lectura.
+
+    - get_by_id / get_by_ids / get_by_sku consultan primero la caché
+    - Los productos se guardan por ID; el SKU solo guarda el ID (índice), de
+      modo que un cambio de SKU nunca devuelve un producto equivocado
+    - Las búsquedas sin resultado también se cachean (caché negativa)
+    - Las escrituras invalidan las entradas afectadas al hacer commit, también
+      en la caché del detalle (CachedProductQueries, mismas claves)
+    - Si la sesión ya escribió, las lecturas van directas a la base de datos
+      para ver los cambios propios aún no confirmados
+    - Se devuelven copias: mutar la entidad nunca altera la caché
+    """
+
+    def __init__(
+        self,
+        inner: ProductRepository,
+        cache: TTLCache = product_cache,
+        detail_cache: TTLCache = product_detail_cache
+    ):
+        """
+        Args:
+            inner: Repositorio real (SQLAlchemy)
+            cache: Caché de productos
+            detail_cache: Caché del lado de consultas que comparte las claves
+        """
+        self.inner = inner
+        self.session = inner.session
+        self.cache = cache
+        self.detail_cache = detail_cache
+
+    # Lecturas
+
+    def _cache_enabled(self) -> bool:
+        return not session_has_writes(self.session)
+
+    def _remember(self, product: Product) -> None:
+        self.cache.set(("id", product.product_id), copy.copy(product))
+        self.cache.set(("sku", str(product.sku)), product.product_id)
+
+    async def get_by_id(self, product_id: UUID) -> Optional[Product]:
+        """Busca un producto por su ID, primero en la caché."""
+        if not self._cache_enabled():
+            return await self.inner.get_by_id(product_id)
+
+        found, cached = self.cache.get(("id", product_id))
+        if found:
+            return None if cached is MISSING else copy.copy(cached)
+
+        product = await self.inner.get_by_id(product_id)
+        if product is None:
+            self.cache.set(("id", product_id), MISSING)
+        else:
+            self._remember(product)
+        return product
+
+    async def get_version(self, product_id: UUID) -> Optional[int]:
+        # Nunca desde la caché: otro worker puede haber escrito sin invalidarla aquí
+        return await self.inner.get_version(product_id)
+
+    async def get_by_ids(self, product_ids: List[UUID]) -> Dict[UUID, Product]:
+        """Sirve desde la caché los productos presentes y consulta solo el resto."""
+        if not self._cache_enabled():
+            return await self.inner.get_by_ids(product_ids)
+
+        products: Dict[UUID, Product] = {}
+        pending: List[UUID] = []
+        for product_id in set(product_ids):
+            found, cached = self.cache.get(("id", product_id))
+            if not found:
+                pending.append(product_id)
+            elif cached is not MISSING:
+                products[product_id] = copy.copy(cached)
+
+        if pending:
+            loaded = await self.inner.get_by_ids(pending)
+            for product_id in pending:
+                product = loaded.get(product_id)
+                if product is None:
+                    self.cache.set(("id", product_id), MISSING)
+                else:
+                    self._remember(product)
+                    products[product_id] = product
+
+        return products
+
+    async def get_by_sku(self, sku: SKU) -> Optional[Product]:
+        """Busca un producto por su SKU usando el índice SKU -> ID de la caché."""
+        if not self._cache_enabled():
+            return await self.inner.get_by_sku(sku)
+
+        found, product_id = self.cache.get(("sku", str(sku)))
+        if found:
+            if product_id is MISSING:
+                return None
+            found, cached = self.cache.get(("id", product_id))
+            if found and cached is not MISSING and str(cached.sku) == str(sku):
+                return copy.copy(cached)
+
+        product = await self.inner.get_by_sku(sku)
+        if product is None:
+            self.cache.set(("sku", str(sku)), MISSING)
+        else:
+            self._remember(product)
+        return product
+
+    async def get_page(self, cursor: Optional[str] = None, limit: int = 100) -> Page[Product]:
+        return await self.inner.get_page(cursor, limit)
+
+    async def search(
+        self,
+        query: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> List[Product]:
+        return await self.inner.search(query, min_price, max_price, skip, limit)
+
+    async def suggest(self, prefix: str, limit: int = 10) -> List[ProductSuggestion]:
+        return await self.inner.suggest(prefix, limit)
+
+    async def exists_by_sku(self, sku: SKU) -> bool:
+        return await self.inner.exists_by_sku(sku)
+
+    # Escrituras (invalidan al hacer commit)
+
+    def _invalidate(self, product_ids, skus=()) -> None:
+        keys = [("id", product_id) for product_id in product_ids]
+        keys += [("sku", str(sku)) for sku in skus]
+        invalidate_on_commit(self.session, self.cache, keys)
+        invalidate_on_commit(self.session, self.detail_cache, keys)
+
+    async def save(self, product: Product) -> Product:
+        saved = await self.inner.save(product)
+        self._invalidate([saved.product_id], [saved.sku])
+        return saved
+
+    async def save_if_sku_available(self, product: Product) -> Optional[Product]:
+        saved = await self.inner.save_if_sku_available(product)
+        if saved is not None:
+            self._invalidate([saved.product_id], [saved.sku])
+        return saved
+
+    async def save_many(self, products: List[Product]) -> Set[str]:
+        inserted = await self.inner.save_many(products)
+        # Puede haber entradas negativas (MISSING) para estos IDs o SKUs
+        products = [product for product in products if str(product.sku) in inserted]
+        self._invalidate([product.product_id for product in products], [product.sku for product in products])
+        return inserted
+
+    async def update(self, product: Product) -> Product:
+        try:
+            return await self.inner.update(product)
+        finally:
+            self._invalidate([product.product_id], [product.sku])
+
+    async def delete(self, product_id: UUID) -> bool:
+        deleted = await self.inner.delete(product_id)
+        if deleted:
+            self._invalidate([product_id])
+        return deleted
+
+    async def reserve_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, Product]:
+        updated = await self.inner.reserve_stock(quantities)
+        self._invalidate(updated)
+        return updated
+
+    async def release_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, Product]:
+        updated = await self.inner.release_stock(quantities)
+        self._invalidate(updated)
+        return updated
@@ -0,0 +1,185 @@
+"""
+Repositorio de productos que resuelve la búsqueda y el autocompletado con
+índices en memoria.
+"""
+from typing import Optional, List, Dict, Set
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.core.database import session_has_writes
+from src.core.pagination import Page
+from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.domain.value_objects import SKU, ProductSuggestion
+from src.modules.catalogo.domain.repositories import ProductRepository
+from src.modules.catalogo.infrastructure.autocomplete_index import AutocompleteIndex
+from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
+from src.modules.catalogo.infrastructure.search_index import ProductSearchIndex
+
+
+# Índice del proceso compartido por todos los requests
+product_search_index = ProductSearchIndex()
+
+
+class IndexedProductRepository(ProductRepository):
+    """
+    Decorador de ProductRepository que enruta `search` y `suggest` a los
+    índices en memoria.
+
+    - Mientras un índice no esté cargado (o no esté configurado), o si la
+      sesión ya escribió, la consulta va a la base de datos
+    - Las escrituras actualizan los índices al hacer commit (nunca con datos
+      de una transacción que termine en rollback)
+    - El resto de operaciones se delega sin cambios
+    """
+
+    def __init__(
+        self,
+        inner: ProductRepository,
+        index: Optional[ProductSearchIndex] = product_search_index,
+        autocomplete_index: Optional[AutocompleteIndex] = None
+    ):
+        """
+        Args:
+            inner: Repositorio real (SQLAlchemy)
+            index: Índice de búsqueda en memoria (None = deshabilitado)
+            autocomplete_index: Índice de autocompletado (None = deshabilitado)
+        """
+        self.inner = inner
+        self.session = inner.session
+        self.index = index
+        self.autocomplete_index = autocomplete_index
+
+    def _serves(self, index) -> bool:
+        return index is not None and index.ready and not session_has_writes(self.session)
+
+    # Lecturas
+
+    async def search(
+        self,
+        query: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> List[Product]:
+        """Busca en el índice en memoria si está disponible; si no, en la base de datos."""
+        if not self._serves(self.index):
+            return await self.inner.search(query, min_price, max_price, skip, limit)
+        return self.index.search(query, min_price, max_price, skip, limit)
+
+    async def suggest(self, prefix: str, limit: int = 10) -> List[ProductSuggestion]:
+        """Autocompleta desde el índice de prefijos si está disponible; si no, desde la base de datos."""
+        if not self._serves(self.autocomplete_index):
+            return await self.inner.suggest(prefix, limit)
+        return self.autocomplete_index.suggest(prefix, limit)
+
+    async def get_by_id(self, product_id: UUID) -> Optional[Product]:
+        return await self.inner.get_by_id(product_id)
+
+    async def get_version(self, product_id: UUID) -> Optional[int]:
+        return await self.inner.get_version(product_id)
+
+    async def get_by_ids(self, product_ids: List[UUID]) -> Dict[UUID, Product]:
+        return await self.inner.get_by_ids(product_ids)
+
+    async def get_by_sku(self, sku: SKU) -> Optional[Product]:
+        return await self.inner.get_by_sku(sku)
+
+    async def get_page(self, cursor: Optional[str] = None, limit: int = 100) -> Page[Product]:
+        return await self.inner.get_page(cursor, limit)
+
+    async def exists_by_sku(self, sku: SKU) -> bool:
+        return await self.inner.exists_by_sku(sku)
+
+    # Escrituras (se aplican al índice al hacer commit)
+
+    def _on_commit(
+        self, upserts: List[Product] = (), removals: List[UUID] = (), sold: Optional[Dict[UUID, int]] = None
+    ) -> None:
+        indexes = [index for index in (self.index, self.autocomplete_index) if index is not None]
+        self.session.info.setdefault("product_index_changes", []).append(
+            (indexes, list(upserts), list(removals), sold or {})
+        )
+
+    async def save(self, product: Product) -> Product:
+        saved = await self.inner.save(product)
+        self._on_commit(upserts=[saved])
+        return saved
+
+    async def save_if_sku_available(self, product: Product) -> Optional[Product]:
+        saved = await self.inner.save_if_sku_available(product)
+        if saved is not None:
+            self._on_commit(upserts=[saved])
+        return saved
+
+    async def save_many(self, products: List[Product]) -> Set[str]:
+        inserted = await self.inner.save_many(products)
+        self._on_commit(upserts=[product for product in products if str(product.sku) in inserted])
+        return inserted
+
+    async def update(self, product: Product) -> Product:
+        updated = await self.inner.update(product)
+        self._on_commit(upserts=[updated])
+        return updated
+
+    async def delete(self, product_id: UUID) -> bool:
+        deleted = await self.inner.delete(product_id)
+        if deleted:
+            self._on_commit(removals=[product_id])
+        return deleted
+
+    async def reserve_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, Product]:
+        updated = await self.inner.reserve_stock(quantities)
+        self._on_commit(upserts=list(updated.values()), sold={pid: quantities[pid] for pid in updated})
+        return updated
+
+    async def release_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, Product]:
+        updated = await self.inner.release_stock(quantities)
+        self._on_commit(upserts=list(updated.values()), sold={pid: -quantities[pid] for pid in updated})
+        return updated
+
+
+@event.listens_for(Session, "after_commit")
+def _on_after_commit(session: Session) -> None:
+    for indexes, upserts, removals, sold in session.info.pop("product_index_changes", []):
+        for index in indexes:
+            index.add_many(upserts)
+            for product_id in removals:
+                index.remove(product_id)
+            if sold and isinstance(index, AutocompleteIndex):
+                index.add_popularity(sold)
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_after_rollback(session: Session) -> None:
+    session.info.pop("product_index_changes", None)
+
+
+async def load_search_index(
+    session_factory: async_sessionmaker,
+    index: ProductSearchIndex = product_search_index,
+    batch_size: int = 1000
+) -> None:
+    """
+    Carga completa del índice desde la base de datos.
+
+    Recorre los productos con paginación keyset en lotes de `batch_size` y
+    solo entonces marca el índice como listo para atender búsquedas.
+    """
+    index.ready = False
+    index.clear()
+    async with session_factory() as session:
+        repository = SQLAlchemyProductRepository(session)
+        cursor = None
+        while True:
+            page = await repository.get_page(cursor, batch_size)
+            index.add_many(page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+    index.ready = True
+    logger.info(f"Índice de búsqueda cargado: {len(index)} productos")
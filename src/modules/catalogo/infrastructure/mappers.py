@@ -2,11 +2,31 @@
 Mappers de Infraestructura para el módulo de Catálogo.
 Responsable de convertir entre entidades de dominio y modelos ORM.
 """
+from src.core.change_tracking import changed_values
+from src.core.hydration import hydrator
 from src.modules.catalogo.domain.entities import Product
 from src.modules.catalogo.domain.value_objects import SKU, Price, Stock
 from src.modules.catalogo.infrastructure.models import ProductModel
 
 
+# Hidratadores de confianza (sin validación ni __post_init__) para datos leídos de la base de datos
+_hydrate_product = hydrator(Product)
+_hydrate_sku = hydrator(SKU)
+_hydrate_price = hydrator(Price)
+_hydrate_stock = hydrator(Stock)
+
+# Columnas editables en las que se guarda cada campo de Product
+_COLUMNS_BY_FIELD = {
+    "sku": ("sku",),
+    "name": ("name",),
+    "description": ("description",),
+    "price": ("price_amount", "price_currency"),
+    "stock": ("stock_quantity",),
+    "is_active": ("is_active",),
+    "updated_at": ("updated_at",),
+}
+
+
 class ProductMapper:
     """
     Mapper estático para convertir entre Product (dominio) y ProductModel (ORM).
@@ -22,22 +42,26 @@ class ProductMapper:
         """
         Convierte un ProductModel (ORM) a Product (entidad de dominio).
         
+        Los datos vienen de la base de datos y ya fueron validados al
+        escribirse: se hidratan sin repetir las validaciones de los VOs.
+        
         Args:
-            model: Modelo ORM de SQLAlchemy
+            model: Modelo ORM de SQLAlchemy (o fila con las mismas columnas)
             
         Returns:
             Entidad de dominio Product
         """
-        return Product(
+        return _hydrate_product(
             product_id=model.product_id,
-            sku=SKU(value=model.sku),
+            sku=_hydrate_sku(value=model.sku),
             name=model.name,
             description=model.description,
-            price=Price(amount=model.price_amount, currency=model.price_currency),
-            stock=Stock(quantity=model.stock_quantity),
+            price=_hydrate_price(amount=model.price_amount, currency=model.price_currency),
+            stock=_hydrate_stock(quantity=model.stock_quantity),
             is_active=model.is_active,
             created_at=model.created_at,
-            updated_at=model.updated_at
+            updated_at=model.updated_at,
+            version=model.version
         )
     
     @staticmethod
@@ -61,16 +85,76 @@ class ProductMapper:
             stock_quantity=product.stock.quantity,
             is_active=product.is_active,
             created_at=product.created_at,
-            updated_at=product.updated_at
+            updated_at=product.updated_at,
+            version=product.version
         )
     
+    @staticmethod
+    def to_row(product: Product) -> dict:
+        """
+        Convierte un Product en el diccionario con todas las columnas de un INSERT.
+        
+        Se usa en las inserciones masivas (executemany / COPY), sin pasar por el ORM.
+        
+        Args:
+            product: Entidad de dominio
+            
+        Returns:
+            Diccionario columna -> valor
+        """
+        return {
+            "product_id": product.product_id,
+            **ProductMapper.to_values(product),
+            "created_at": product.created_at,
+            "version": product.version,
+        }
+    
+    @staticmethod
+    def to_values(product: Product) -> dict:
+        """
+        Convierte un Product en el diccionario de columnas editables.
+        
+        Se usa para construir sentencias UPDATE sin cargar el modelo ORM.
+        
+        Args:
+            product: Entidad de dominio
+            
+        Returns:
+            Diccionario columna -> valor
+        """
+        return {
+            "sku": str(product.sku),
+            "name": product.name,
+            "description": product.description,
+            "price_amount": product.price.amount,
+            "price_currency": product.price.currency,
+            "stock_quantity": product.stock.quantity,
+            "is_active": product.is_active,
+            "updated_at": product.updated_at,
+        }
+    
+    @staticmethod
+    def to_changed_values(product: Product) -> dict:
+        """
+        Como `to_values`, pero solo con las columnas de los campos que
+        cambiaron desde que se cargó el producto (todas si no se sabe).
+        
+        Args:
+            product: Entidad de dominio
+            
+        Returns:
+            Diccionario columna -> valor (vacío si no hay cambios)
+        """
+        return changed_values(product, ProductMapper.to_values(product), _COLUMNS_BY_FIELD)
+    
     @staticmethod
     def update_model(model: ProductModel, product: Product) -> ProductModel:
         """
         Actualiza un ProductModel existente con datos de una entidad Product.
         
         Útil para operaciones de actualización donde ya tenemos un modelo
-        cargado de la base de datos.
+        cargado de la base de datos. Solo asigna las columnas modificadas, de
+        modo que el flush del ORM no las incluya en el UPDATE.
         
         Args:
             model: Modelo ORM existente a actualizar
@@ -79,13 +163,7 @@ class ProductMapper:
         Returns:
             El mismo modelo actualizado (para encadenamiento)
         """
-        model.sku = str(product.sku)
-        model.name = product.name
-        model.description = product.description
-        model.price_amount = product.price.amount
-        model.price_currency = product.price.currency
-        model.stock_quantity = product.stock.quantity
-        model.is_active = product.is_active
-        model.updated_at = product.updated_at
+        for column, value in ProductMapper.to_changed_values(product).items():
+            setattr(model, column, value)
         
         return model
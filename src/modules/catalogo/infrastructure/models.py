@@ -2,13 +2,21 @@
 Modelos de SQLAlchemy para el módulo de Catálogo.
 Estos modelos representan la estructura de la base de datos.
 """
-from sqlalchemy import Column, String, Float, Integer, Boolean, DateTime, Uuid
+from sqlalchemy import Column, String, Float, Integer, Boolean, DateTime, Index, Uuid
 from datetime import datetime
 import uuid
 
 from src.core.database import Base, SoftDeleteMixin
 
 
+# Búsqueda de texto completo (solo PostgreSQL). La columna generada
+# `search_vector` y su índice GIN se crean por migración y no se mapean en el
+# modelo: la base de datos los mantiene y el ORM nunca los lee ni escribe.
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_VECTOR_INDEX = "ix_products_search_vector"
+SEARCH_TEXT_CONFIG = "spanish"  # Mismo diccionario en el vector (SKU incluido) y en la consulta
+
+
 class ProductModel(Base, SoftDeleteMixin):
     """
     Modelo de base de datos para Product.
@@ -32,6 +40,9 @@ class ProductModel(Base, SoftDeleteMixin):
     # Estado
     is_active = Column(Boolean, nullable=False, default=True)
     
+    # Popularidad: unidades reservadas (vendidas), mantenida por reserve/release_stock
+    units_sold = Column(Integer, nullable=False, default=0, server_default="0")
+    
     # Control de concurrencia optimista
     version = Column(Integer, nullable=False, default=1)
     
@@ -39,6 +50,10 @@ class ProductModel(Base, SoftDeleteMixin):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Paginación keyset: ORDER BY / WHERE (created_at, product_id)
+        Index("ix_products_created_at_product_id", "created_at", "product_id"),
+    )
     
     def __repr__(self):
         return f"<ProductModel(sku='{self.sku}', name='{self.name}')>"
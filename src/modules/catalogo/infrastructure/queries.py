@@ -0,0 +1,106 @@
+"""
+Consultas de productos (lado de lectura de CQRS) con SQLAlchemy Core.
+
+Seleccionan solo las columnas de la respuesta, etiquetadas con el nombre del
+campo del DTO, y construyen los DTOs directamente desde las filas: sin
+identity map del ORM, sin entidades de dominio y sin revalidar datos que ya
+se validaron al escribirlos.
+"""
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.pagination import Page, build_page, keyset_paginate
+from src.modules.catalogo.application.features.create_product.response import CreateProductResponse
+from src.modules.catalogo.application.features.get_product.response import GetProductResponse
+from src.modules.catalogo.application.queries import ProductQueries
+from src.modules.catalogo.infrastructure.models import ProductModel
+
+
+# Columnas de la respuesta de listado, con el nombre del campo del DTO
+_LIST_COLUMNS = (
+    ProductModel.product_id,
+    ProductModel.sku,
+    ProductModel.name,
+    ProductModel.description,
+    ProductModel.price_amount.label("price"),
+    ProductModel.price_currency.label("currency"),
+    ProductModel.stock_quantity.label("stock"),
+    ProductModel.is_active,
+    ProductModel.created_at,
+)
+
+_DETAIL_COLUMNS = (*_LIST_COLUMNS, ProductModel.updated_at, ProductModel.version)
+
+
+class SQLAlchemyProductQueries(ProductQueries):
+    """
+    Implementación de ProductQueries sobre la sesión de lectura.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Args:
+            session: Sesión async de SQLAlchemy (réplica si está configurada)
+        """
+        self.session = session
+
+    async def list_products(self, cursor: Optional[str] = None, limit: int = 100) -> Page[CreateProductResponse]:
+        """Obtiene una página de productos (keyset sobre created_at, product_id)."""
+        stmt = keyset_paginate(
+            select(*_LIST_COLUMNS).where(ProductModel.deleted_at == None),
+            ProductModel.created_at,
+            ProductModel.product_id,
+            cursor,
+            limit
+        )
+        result = await self.session.execute(stmt)
+        items = [CreateProductResponse.model_construct(**row) for row in result.mappings()]
+
+        return build_page(items, limit, key=lambda p: (p.created_at, p.product_id))
+
+    async def get_by_id(self, product_id: UUID, version: Optional[int] = None) -> Optional[GetProductResponse]:
+        """Busca un producto por su ID (solo si no está borrado); la lectura siempre es actual."""
+        return await self._get_one(ProductModel.product_id == product_id)
+
+    async def get_by_sku(self, sku: str) -> Optional[GetProductResponse]:
+        """Busca un producto por su SKU (solo si no está borrado)."""
+        return await self._get_one(ProductModel.sku == sku)
+
+    async def get_version(self, product_id: UUID) -> Optional[Tuple[UUID, int]]:
+        """Lee solo (product_id, version) de un producto por su ID."""
+        return await self._get_version(ProductModel.product_id == product_id)
+
+    async def get_version_by_sku(self, sku: str) -> Optional[Tuple[UUID, int]]:
+        """Lee solo (product_id, version) de un producto por su SKU."""
+        return await self._get_version(ProductModel.sku == sku)
+
+    async def stream_products(self, batch_size: int = 1000) -> AsyncIterator[List[GetProductResponse]]:
+        """Recorre el catálogo con un cursor del servidor (`yield_per`), lote a lote."""
+        stmt = (
+            select(*_DETAIL_COLUMNS)
+            .where(ProductModel.deleted_at == None)
+            .order_by(ProductModel.created_at, ProductModel.product_id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+        try:
+            async for partition in result.mappings().partitions():
+                yield [GetProductResponse.model_construct(**row) for row in partition]
+        finally:
+            # Si el cliente se desconecta a mitad, el cursor se cierra igualmente
+            await result.close()
+
+    async def _get_one(self, criterion) -> Optional[GetProductResponse]:
+        stmt = select(*_DETAIL_COLUMNS).where(criterion, ProductModel.deleted_at == None)
+        row = (await self.session.execute(stmt)).mappings().one_or_none()
+
+        return GetProductResponse.model_construct(**row) if row else None
+
+    async def _get_version(self, criterion) -> Optional[Tuple[UUID, int]]:
+        stmt = select(ProductModel.product_id, ProductModel.version).where(criterion, ProductModel.deleted_at == None)
+        row = (await self.session.execute(stmt)).one_or_none()
+
+        return tuple(row) if row else None
@@ -1,14 +1,29 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Dict, Set
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, case, func, literal_column, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.modules.catalogo.domain.entities import Product
-from src.modules.catalogo.domain.value_objects import SKU
+from src.modules.catalogo.domain.value_objects import SKU, Stock, ProductSuggestion
 from src.modules.catalogo.domain.repositories import ProductRepository
-from src.modules.catalogo.infrastructure.models import ProductModel
+from src.modules.catalogo.infrastructure.models import ProductModel, SEARCH_TEXT_CONFIG, SEARCH_VECTOR_COLUMN
 from src.modules.catalogo.infrastructure.mappers import ProductMapper
+from src.core.database import mark_session_writes
 from src.core.exceptions import ConcurrencyError
+from src.core.pagination import Page, build_page, keyset_paginate
+
+
+# Columna generada de PostgreSQL (ver models.py), referenciada solo en búsquedas
+_search_vector = literal_column(f"{ProductModel.__tablename__}.{SEARCH_VECTOR_COLUMN}", type_=TSVECTOR)
+
+# Columnas mapeadas de la tabla: lo que retornan las escrituras con RETURNING
+_RETURNING_COLUMNS = tuple(ProductModel.__table__.c)
+
+# INSERT con ON CONFLICT por dialecto (ambos admiten RETURNING)
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
 
 
 class SQLAlchemyProductRepository(ProductRepository):
@@ -32,83 +47,288 @@ class SQLAlchemyProductRepository(ProductRepository):
     # Implementación de los métodos del puerto
     
     async def save(self, product: Product) -> Product:
-        """Guarda un nuevo producto en la base de datos."""
-        model = ProductMapper.to_model(product)
-        self.session.add(model)
-        await self.session.flush()  # Para obtener el ID generado
-        await self.session.refresh(model)
-        return ProductMapper.to_domain(model)
+        """Guarda un nuevo producto con un único `INSERT ... RETURNING`."""
+        stmt = insert(ProductModel).values(ProductMapper.to_row(product)).returning(*_RETURNING_COLUMNS)
+        result = await self.session.execute(stmt)
+        return ProductMapper.to_domain(result.one())
+    
+    async def save_if_sku_available(self, product: Product) -> Optional[Product]:
+        """
+        Inserta el producto salvo que su SKU ya esté en uso, en un solo viaje:
+        `INSERT ... ON CONFLICT (sku) DO NOTHING RETURNING`. El índice único es
+        quien decide, así que dos altas concurrentes del mismo SKU no pueden
+        pasar ambas (la comprobación previa con SELECT sí lo permitía).
+        
+        En motores sin ON CONFLICT se recurre a exists_by_sku + save.
+        """
+        dialect_insert = _UPSERT_INSERTS.get(self._dialect_name())
+        if dialect_insert is None:
+            if await self.exists_by_sku(product.sku):
+                return None
+            return await self.save(product)
+        
+        stmt = (
+            dialect_insert(ProductModel)
+            .values(ProductMapper.to_row(product))
+            .on_conflict_do_nothing(index_elements=[ProductModel.sku])
+            .returning(*_RETURNING_COLUMNS)
+        )
+        row = (await self.session.execute(stmt)).first()
+        return ProductMapper.to_domain(row) if row else None
+    
+    async def save_many(self, products: List[Product]) -> Set[str]:
+        """
+        Inserta productos nuevos en bloque, sin unidades de trabajo del ORM,
+        omitiendo los que tengan un SKU ya en uso (`ON CONFLICT (sku) DO NOTHING`).
+        
+        El índice único decide, así que un SKU dado de alta por otro request
+        mientras dura la importación se omite en lugar de abortar la transacción.
+        
+        En PostgreSQL hace COPY (asyncpg) a una tabla temporal y de ahí un único
+        `INSERT ... SELECT`; en los demás motores, un executemany que SQLAlchemy
+        agrupa en INSERT multi-fila dentro del límite de parámetros del driver.
+        Requiere un motor con ON CONFLICT: sin él, la comprobación previa de SKUs
+        no sería segura frente a altas concurrentes.
+        
+        Returns:
+            SKUs efectivamente insertados
+        
+        Raises:
+            NotImplementedError: Si el motor no admite ON CONFLICT
+        """
+        if not products:
+            return set()
+        rows = [ProductMapper.to_row(product) for product in products]
+        if self._is_postgresql():
+            return await self._copy_rows(rows)
+        
+        dialect_insert = _UPSERT_INSERTS.get(self._dialect_name())
+        if dialect_insert is None:
+            raise NotImplementedError(
+                f"La inserción masiva requiere ON CONFLICT, no disponible en '{self._dialect_name()}'"
+            )
+        
+        stmt = (
+            dialect_insert(ProductModel)
+            .on_conflict_do_nothing(index_elements=[ProductModel.sku])
+            .returning(ProductModel.sku)
+        )
+        result = await self.session.execute(stmt, rows)
+        return set(result.scalars().all())
+    
+    async def _copy_rows(self, rows: List[dict]) -> Set[str]:
+        """
+        COPY ... FROM STDIN en binario con asyncpg (mucho más rápido que los INSERT)
+        a una tabla temporal, y `INSERT ... SELECT ... ON CONFLICT (sku) DO NOTHING`.
+        """
+        table = ProductModel.__tablename__
+        staging = f"{table}_import"
+        columns = list(rows[0])
+        column_list = ", ".join(columns)
+        
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        # Se crea dentro de la transacción: si algo falla, el rollback también la descarta
+        await driver_connection.execute(f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS)")
+        await driver_connection.copy_records_to_table(
+            staging,
+            columns=columns,
+            records=[tuple(row[column] for column in columns) for row in rows]
+        )
+        inserted = await driver_connection.fetch(
+            f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging} "
+            f"ON CONFLICT (sku) DO NOTHING RETURNING sku"
+        )
+        await driver_connection.execute(f"DROP TABLE {staging}")
+        # El COPY no pasa por SQLAlchemy: se marca la escritura para que la sesión haga commit
+        mark_session_writes(self.session)
+        return {record["sku"] for record in inserted}
     
     async def update(self, product: Product) -> Product:
         """
         Actualiza un producto existente con control de concurrencia optimista.
+        
+        El UPDATE solo aplica si la versión en base de datos sigue siendo la que
+        se leyó (`WHERE version = :expected`); en caso contrario lanza ConcurrencyError.
+        Solo escribe las columnas de los campos modificados; si no cambió nada,
+        no emite ninguna sentencia.
         """
-        # Buscar el modelo existente
-        stmt = select(ProductModel).where(ProductModel.product_id == product.product_id)
+        values = ProductMapper.to_changed_values(product)
+        if not values:
+            return product
+        
+        stmt = (
+            update(ProductModel)
+            .where(
+                ProductModel.product_id == product.product_id,
+                ProductModel.version == product.version
+            )
+            .values(**values, version=ProductModel.version + 1)
+            .returning(*_RETURNING_COLUMNS)
+            .execution_options(synchronize_session="fetch")
+        )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        row = result.first()
+        
+        if row is None:
+            await self._raise_update_conflict(product)
         
-        if not model:
+        return ProductMapper.to_domain(row)
+    
+    async def _raise_update_conflict(self, product: Product) -> None:
+        """Distingue entre producto inexistente y conflicto de versión."""
+        stmt = select(ProductModel.version).where(ProductModel.product_id == product.product_id)
+        actual_version = (await self.session.execute(stmt)).scalar_one_or_none()
+        
+        if actual_version is None:
             raise ValueError(f"Producto con ID {product.product_id} no encontrado")
         
-        # Incrementar versión para concurrencia optimista
-        model.version = model.version + 1
+        raise ConcurrencyError(
+            entity_name="Product",
+            entity_id=str(product.product_id),
+            expected_version=product.version,
+            actual_version=actual_version
+        )
+    
+    async def reserve_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, Product]:
+        """
+        Reserva stock con un único UPDATE condicional para todo el lote.
+        
+        La condición `stock_quantity >= cantidad` se evalúa dentro de la propia
+        sentencia, por lo que dos reservas concurrentes nunca pueden sobrevender.
+        """
+        quantity = self._quantity_expression(quantities)
+        return await self._adjust_stock(
+            quantities,
+            ProductModel.stock_quantity - quantity,
+            ProductModel.stock_quantity >= quantity,
+            ProductModel.is_active == True,
+            units_sold=ProductModel.units_sold + quantity,
+        )
+    
+    async def release_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, Product]:
+        """Devuelve stock con un único UPDATE condicional para todo el lote."""
+        quantity = self._quantity_expression(quantities)
+        return await self._adjust_stock(
+            quantities,
+            ProductModel.stock_quantity + quantity,
+            ProductModel.stock_quantity + quantity <= Stock.MAX_STOCK,
+            units_sold=case(
+                (ProductModel.units_sold >= quantity, ProductModel.units_sold - quantity),
+                else_=0
+            ),
+        )
+    
+    @staticmethod
+    def _quantity_expression(quantities: Dict[UUID, int]):
+        """Expresión CASE que resuelve la cantidad solicitada para cada fila."""
+        return case(quantities, value=ProductModel.product_id)
+    
+    async def _adjust_stock(
+        self, quantities: Dict[UUID, int], new_stock, *conditions, **extra_values
+    ) -> Dict[UUID, Product]:
+        """
+        Ejecuta `UPDATE ... WHERE <condiciones> RETURNING` sobre el lote.
         
-        # Actualizar campos usando el mapper
-        ProductMapper.update_model(model, product)
+        `extra_values` son columnas adicionales a actualizar (p. ej. la popularidad).
         
-        await self.session.flush()
-        await self.session.refresh(model)
-        return ProductMapper.to_domain(model)
-
+        Las filas que no cumplen las condiciones simplemente no se actualizan;
+        el llamador decide qué hacer con los productos ausentes en el resultado.
+        """
+        if not quantities:
+            return {}
+        
+        stmt = (
+            update(ProductModel)
+            .where(
+                ProductModel.product_id.in_(list(quantities)),
+                ProductModel.deleted_at == None,
+                *conditions
+            )
+            .values(
+                stock_quantity=new_stock,
+                version=ProductModel.version + 1,
+                updated_at=datetime.utcnow(),
+                **extra_values
+            )
+            .returning(*ProductModel.__table__.c)
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await self.session.execute(stmt)
+        
+        return {row.product_id: ProductMapper.to_domain(row) for row in result}
     
     async def get_by_id(self, product_id: UUID) -> Optional[Product]:
         """Busca un producto por su ID (solo si no está borrado)."""
         stmt = select(ProductModel).where(
             ProductModel.product_id == product_id,
             ProductModel.deleted_at == None
-        )
+        ).execution_options(populate_existing=True)
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
         
         return ProductMapper.to_domain(model) if model else None
     
-    async def get_by_sku(self, sku: SKU) -> Optional[Product]:
-        """Busca un producto por su SKU (solo si no está borrado)."""
-        stmt = select(ProductModel).where(
-            ProductModel.sku == str(sku),
+    async def get_version(self, product_id: UUID) -> Optional[int]:
+        """Versión del producto (no borrado) sin cargar la fila completa."""
+        stmt = select(ProductModel.version).where(
+            ProductModel.product_id == product_id,
             ProductModel.deleted_at == None
         )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        
-        return ProductMapper.to_domain(model) if model else None
+        return result.scalar_one_or_none()
     
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Product]:
-        """Obtiene todos los productos no borrados con paginación."""
+    async def get_by_ids(self, product_ids: List[UUID]) -> Dict[UUID, Product]:
+        """Busca varios productos (no borrados) con un único `WHERE product_id IN (...)`."""
+        if not product_ids:
+            return {}
+        
         stmt = select(ProductModel).where(
+            ProductModel.product_id.in_(set(product_ids)),
             ProductModel.deleted_at == None
-        ).offset(skip).limit(limit)
+        )
         result = await self.session.execute(stmt)
         models = result.scalars().all()
         
-        return [ProductMapper.to_domain(model) for model in models]
+        return {model.product_id: ProductMapper.to_domain(model) for model in models}
     
-    async def delete(self, product_id: UUID) -> bool:
-        """Realiza un BORRADO LÓGICO de un producto."""
+    async def get_by_sku(self, sku: SKU) -> Optional[Product]:
+        """Busca un producto por su SKU (solo si no está borrado)."""
         stmt = select(ProductModel).where(
-            ProductModel.product_id == product_id,
+            ProductModel.sku == str(sku),
             ProductModel.deleted_at == None
-        )
+        ).execution_options(populate_existing=True)
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
         
-        if not model:
-            return False
+        return ProductMapper.to_domain(model) if model else None
+    
+    async def get_page(self, cursor: Optional[str] = None, limit: int = 100) -> Page[Product]:
+        """Obtiene una página de productos no borrados (keyset sobre created_at, product_id)."""
+        stmt = keyset_paginate(
+            select(ProductModel).where(ProductModel.deleted_at == None),
+            ProductModel.created_at,
+            ProductModel.product_id,
+            cursor,
+            limit
+        )
+        result = await self.session.execute(stmt)
+        products = [ProductMapper.to_domain(model) for model in result.scalars().all()]
         
-        model.soft_delete()
-        await self.session.flush()
-        return True
+        return build_page(products, limit, key=lambda p: (p.created_at, p.product_id))
+    
+    async def delete(self, product_id: UUID) -> bool:
+        """Realiza un BORRADO LÓGICO de un producto (un único `UPDATE ... RETURNING`)."""
+        stmt = (
+            update(ProductModel)
+            .where(ProductModel.product_id == product_id, ProductModel.deleted_at == None)
+            .values(deleted_at=datetime.utcnow())
+            .returning(ProductModel.product_id)
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await self.session.execute(stmt)
+        return result.first() is not None
     
     async def exists_by_sku(self, sku: SKU) -> bool:
         """Verifica si existe un producto con el SKU dado (no borrado)."""
@@ -127,24 +347,78 @@ class SQLAlchemyProductRepository(ProductRepository):
         skip: int = 0,
         limit: int = 20
     ) -> List[Product]:
-        """Búsqueda avanzada con filtros dinámicos."""
-        stmt = select(ProductModel).where(ProductModel.deleted_at == None)
+        """
+        Búsqueda avanzada con filtros dinámicos.
         
-        if query:
-            # Simulación de búsqueda de texto simple (mejorar con to_tsvector en Postgres real)
-            stmt = stmt.where(
-                (ProductModel.name.ilike(f"%{query}%")) | 
-                (ProductModel.description.ilike(f"%{query}%"))
-            )
+        En PostgreSQL el texto se busca con `search_vector @@ websearch_to_tsquery`
+        (resuelto por el índice GIN) y se ordena por `ts_rank`. En otros motores
+        (SQLite en tests) se recurre a ILIKE sobre SKU, nombre y descripción.
+        """
+        stmt = select(ProductModel).where(ProductModel.deleted_at == None)
         
         if min_price is not None:
             stmt = stmt.where(ProductModel.price_amount >= min_price)
             
         if max_price is not None:
             stmt = stmt.where(ProductModel.price_amount <= max_price)
+        
+        if query and self._supports_full_text():
+            ts_query = func.websearch_to_tsquery(SEARCH_TEXT_CONFIG, query)
+            stmt = stmt.where(_search_vector.op("@@")(ts_query)).order_by(
+                func.ts_rank(_search_vector, ts_query).desc(),
+                ProductModel.product_id
+            )
+        elif query:
+            pattern = f"%{query}%"
+            stmt = stmt.where(or_(
+                ProductModel.sku.ilike(pattern),
+                ProductModel.name.ilike(pattern),
+                ProductModel.description.ilike(pattern)
+            )).order_by(ProductModel.name, ProductModel.product_id)
+        else:
+            stmt = stmt.order_by(ProductModel.name, ProductModel.product_id)
             
         stmt = stmt.offset(skip).limit(limit)
         result = await self.session.execute(stmt)
         models = result.scalars().all()
         
         return [ProductMapper.to_domain(model) for model in models]
+    
+    async def suggest(self, prefix: str, limit: int = 10) -> List[ProductSuggestion]:
+        """Autocompletado por prefijo de SKU o nombre, ordenado por unidades vendidas."""
+        pattern = self._escape_like(prefix) + "%"
+        stmt = (
+            select(ProductModel.product_id, ProductModel.sku, ProductModel.name, ProductModel.units_sold)
+            .where(
+                ProductModel.deleted_at == None,
+                ProductModel.is_active == True,
+                or_(
+                    ProductModel.sku.ilike(pattern, escape="\\"),
+                    ProductModel.name.ilike(pattern, escape="\\")
+                )
+            )
+            .order_by(ProductModel.units_sold.desc(), ProductModel.name, ProductModel.product_id)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        
+        return [
+            ProductSuggestion(product_id=row.product_id, sku=row.sku, name=row.name, popularity=row.units_sold)
+            for row in result
+        ]
+    
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        """Escapa los comodines de LIKE para tratarlos como texto literal."""
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    
+    def _supports_full_text(self) -> bool:
+        """La búsqueda de texto completo requiere PostgreSQL."""
+        return self._is_postgresql()
+
+    def _is_postgresql(self) -> bool:
+        return self._dialect_name() == "postgresql"
+
+    def _dialect_name(self) -> Optional[str]:
+        bind = self.session.bind
+        return bind.dialect.name if bind is not None else None
@@ -1,50 +1,58 @@
 """
-Gestor Singleton para Repositorios del módulo Catálogo.
+Registro de Repositorios del módulo Catálogo con alcance de request.
 Garantiza una única instancia de repositorio por sesión de BD.
 """
-from typing import Optional
+from contextvars import ContextVar
+from typing import Dict, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
+from src.modules.catalogo.infrastructure.cached_repository import CachedProductRepository
+from src.modules.catalogo.infrastructure.autocomplete_index import product_autocomplete_index
+from src.modules.catalogo.infrastructure.indexed_repository import IndexedProductRepository, product_search_index
 from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
 from src.modules.catalogo.domain.repositories import ProductRepository
 
 
+# Repositorios de la tarea actual, indexados por sesión.
+# Cada request de FastAPI corre en su propia tarea asyncio y, por tanto, en su
+# propio contexto: dos requests concurrentes nunca comparten este registro.
+_task_repositories: ContextVar[Optional[Dict[AsyncSession, ProductRepository]]] = ContextVar(
+    "catalogo_repositories", default=None
+)
+
+
 class RepositoryManager:
     """
-    Singleton para gestionar instancias de repositorios.
+    Registro de repositorios con alcance de request (ContextVar).
     
     Este patrón asegura que:
     1. Solo existe una instancia del repositorio por sesión
-    2. Se reutiliza la misma instancia en múltiples casos de uso
-    3. Se optimiza el uso de recursos
+    2. Se reutiliza la misma instancia en múltiples casos de uso del request
+    3. Ningún request ve la sesión o el repositorio de otro
     
-    Beneficios:
-    - Eficiencia: Reutiliza instancias del repositorio
-    - Consistencia: Misma instancia en toda la request
-    - Gestión centralizada: Un solo punto para obtener repositorios
+    El gestor no guarda estado propio: el registro vive en el contexto de la
+    tarea, por lo que instanciarlo es gratuito y no hay mutación global. Las
+    entradas (y con ellas las sesiones, a las que cada repositorio referencia)
+    duran lo mismo que ese contexto: se liberan cuando termina la tarea del
+    request, no al cerrar la sesión. Fuera de un request (p. ej. al arrancar)
+    se debe llamar a `reset` al terminar.
     """
     
-    _instance: Optional['RepositoryManager'] = None
-    _product_repository: Optional[ProductRepository] = None
-    _current_session: Optional[AsyncSession] = None
-    
-    def __new__(cls):
-        """
-        Implementación del patrón Singleton.
-        
-        Garantiza que solo exista una instancia de RepositoryManager
-        en toda la aplicación.
-        """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    def _registry(self) -> Dict[AsyncSession, ProductRepository]:
+        registry = _task_repositories.get()
+        if registry is None:
+            registry = {}
+            _task_repositories.set(registry)
+        return registry
     
     def get_product_repository(self, session: AsyncSession) -> ProductRepository:
         """
         Obtiene la instancia del repositorio de productos.
         
-        Si la sesión cambia, crea una nueva instancia.
-        Si la sesión es la misma, reutiliza la instancia existente.
+        Si la sesión no tiene repositorio en esta tarea, crea una nueva instancia
+        (con índices en memoria y caché de lectura si están habilitados). Si ya
+        lo tiene, la reutiliza.
         
         Args:
             session: Sesión de base de datos
@@ -52,19 +60,26 @@ class RepositoryManager:
         Returns:
             Instancia del repositorio de productos
         """
-        # Si la sesión cambió o no hay repositorio, crear uno nuevo
-        if self._current_session is not session or self._product_repository is None:
-            self._current_session = session
-            self._product_repository = SQLAlchemyProductRepository(session)
+        registry = self._registry()
+        repository = registry.get(session)
+        if repository is None:
+            repository = SQLAlchemyProductRepository(session)
+            if settings.product_search_index_enabled or settings.product_autocomplete_enabled:
+                repository = IndexedProductRepository(
+                    repository,
+                    product_search_index if settings.product_search_index_enabled else None,
+                    product_autocomplete_index if settings.product_autocomplete_enabled else None
+                )
+            if settings.product_cache_enabled:
+                repository = CachedProductRepository(repository)
+            registry[session] = repository
         
-        return self._product_repository
+        return repository
     
     def reset(self):
         """
-        Resetea el singleton (útil para testing).
+        Limpia el registro de la tarea actual (útil para testing).
         
-        Limpia las referencias a repositorios y sesiones,
-        permitiendo crear nuevas instancias.
+        Solo afecta al contexto actual; el resto de requests no se ve afectado.
         """
-        self._product_repository = None
-        self._current_session = None
+        _task_repositories.set(None)
@@ -0,0 +1,223 @@
+"""
+Índice invertido en memoria para la búsqueda de productos.
+
+Pensado para despliegues embebidos/SQLite (sin búsqueda de texto completo en
+la base de datos) y como caché caliente delante de PostgreSQL: resuelve una
+búsqueda por palabras clave sin ida y vuelta a la base de datos.
+
+- Texto normalizado: minúsculas y sin tildes ("Canción" == "cancion")
+- Ranking BM25 con pesos por campo (SKU > nombre > descripción)
+- Filtro por rango de precio con bisect sobre una lista ordenada
+- Actualización incremental al crear, actualizar o borrar productos
+
+Cada proceso mantiene su propia copia: los cambios hechos desde otro proceso
+no se ven hasta la siguiente carga completa.
+"""
+import bisect
+import copy
+import heapq
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from src.modules.catalogo.domain.entities import Product
+
+
+# Palabras vacías frecuentes en español (no aportan relevancia)
+STOPWORDS = frozenset({
+    "a", "al", "con", "de", "del", "e", "el", "en", "la", "las", "lo", "los",
+    "o", "para", "por", "sin", "su", "sus", "u", "un", "una", "unas", "unos", "y",
+})
+
+# Peso de cada campo en la frecuencia del término (BM25F simplificado)
+FIELD_WEIGHTS = (("sku", 3), ("name", 2), ("description", 1))
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Pasa a minúsculas y elimina tildes y diacríticos (ñ -> n)."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def words(text: str) -> List[str]:
+    """Divide el texto normalizado en palabras."""
+    return _TOKEN_RE.findall(normalize(text))
+
+
+def tokenize(text: str) -> List[str]:
+    """Divide el texto normalizado en términos, sin palabras vacías."""
+    return [token for token in words(text) if token not in STOPWORDS]
+
+
+class ProductSearchIndex:
+    """
+    Índice invertido de productos con ranking BM25.
+
+    Las búsquedas con texto exigen que aparezcan todos los términos (como
+    `websearch_to_tsquery` en PostgreSQL) y se ordenan por relevancia; sin
+    texto se ordenan por nombre.
+    """
+
+    # A partir de este tamaño, add_many ordena una vez en lugar de insertar uno a uno
+    BULK_THRESHOLD = 64
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.ready = False
+        self.searches = 0
+        self.clear()
+
+    def clear(self) -> None:
+        """Vacía el índice."""
+        self._products: Dict[UUID, Product] = {}
+        self._postings: Dict[str, Dict[UUID, int]] = {}
+        self._lengths: Dict[UUID, int] = {}
+        self._total_length = 0
+        # (precio, product_id) ordenado para filtrar rangos con bisect
+        self._prices: List[Tuple[float, UUID]] = []
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    # Mantenimiento
+
+    def add(self, product: Product) -> None:
+        """Indexa un producto (o lo reemplaza si ya estaba indexado)."""
+        bisect.insort(self._prices, self._index(product))
+
+    def add_many(self, products: Iterable[Product]) -> None:
+        """
+        Indexa varios productos.
+
+        Los lotes grandes (carga inicial) se añaden al final y se ordenan una
+        sola vez, en lugar de pagar un insort O(n) por producto.
+        """
+        products = list({product.product_id: product for product in products}.values())
+        if len(products) <= self.BULK_THRESHOLD:
+            for product in products:
+                self.add(product)
+            return
+        entries = [self._index(product) for product in products]
+        self._prices.extend(entries)
+        self._prices.sort()
+
+    def _index(self, product: Product) -> Tuple[float, UUID]:
+        """Indexa los términos del producto; retorna su entrada de precio (aún sin insertar)."""
+        self.remove(product.product_id)
+
+        frequencies: Counter = Counter()
+        for field, weight in FIELD_WEIGHTS:
+            for token in tokenize(str(getattr(product, field) or "")):
+                frequencies[token] += weight
+
+        product_id = product.product_id
+        self._products[product_id] = copy.copy(product)
+        for term, frequency in frequencies.items():
+            self._postings.setdefault(term, {})[product_id] = frequency
+        self._lengths[product_id] = sum(frequencies.values())
+        self._total_length += self._lengths[product_id]
+        return product.price.amount, product_id
+
+    def remove(self, product_id: UUID) -> None:
+        """Quita un producto del índice (si estaba indexado)."""
+        product = self._products.pop(product_id, None)
+        if product is None:
+            return
+
+        for field, _ in FIELD_WEIGHTS:
+            for token in tokenize(str(getattr(product, field) or "")):
+                postings = self._postings.get(token)
+                if postings is not None:
+                    postings.pop(product_id, None)
+                    if not postings:
+                        del self._postings[token]
+        self._total_length -= self._lengths.pop(product_id)
+
+        entry = (product.price.amount, product_id)
+        position = bisect.bisect_left(self._prices, entry)
+        if position < len(self._prices) and self._prices[position] == entry:
+            del self._prices[position]
+
+    # Consultas
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> List[Product]:
+        """Busca productos por texto y rango de precio; retorna copias."""
+        self.searches += 1
+        allowed = self._price_range(min_price, max_price)
+        wanted = skip + limit
+
+        if query:
+            terms = list(dict.fromkeys(tokenize(query)))
+            ranked = heapq.nsmallest(
+                wanted,
+                ((-score, product_id) for product_id, score in self._score(terms, allowed).items())
+            )
+            product_ids = [product_id for _, product_id in ranked]
+        else:
+            candidates = self._products if allowed is None else allowed
+            product_ids = heapq.nsmallest(
+                wanted, candidates, key=lambda pid: (self._products[pid].name, pid)
+            )
+
+        return [copy.copy(self._products[pid]) for pid in product_ids[skip:wanted]]
+
+    def _price_range(self, min_price: Optional[float], max_price: Optional[float]) -> Optional[Set[UUID]]:
+        """IDs con precio dentro del rango (None si no hay filtro de precio)."""
+        if min_price is None and max_price is None:
+            return None
+
+        price = lambda entry: entry[0]
+        low = 0 if min_price is None else bisect.bisect_left(self._prices, min_price, key=price)
+        high = len(self._prices) if max_price is None else bisect.bisect_right(self._prices, max_price, key=price)
+        return {product_id for _, product_id in self._prices[low:high]}
+
+    def _score(self, terms: List[str], allowed: Optional[Set[UUID]]) -> Dict[UUID, float]:
+        """Puntuación BM25 de los productos que contienen todos los términos."""
+        if not terms:
+            return {}
+
+        postings = [self._postings.get(term) for term in terms]
+        if not all(postings):
+            return {}
+
+        # Intersección empezando por la lista más corta
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for other in postings[1:]:
+            candidates.intersection_update(other)
+        if allowed is not None:
+            candidates &= allowed
+
+        total = len(self._products)
+        average_length = self._total_length / total if total else 0.0
+        scores = dict.fromkeys(candidates, 0.0)
+        for term_postings in postings:
+            frequency_in_corpus = len(term_postings)
+            idf = math.log(1 + (total - frequency_in_corpus + 0.5) / (frequency_in_corpus + 0.5))
+            for product_id in candidates:
+                frequency = term_postings[product_id]
+                norm = 1 - self.b + self.b * self._lengths[product_id] / average_length if average_length else 1
+                scores[product_id] += idf * frequency * (self.k1 + 1) / (frequency + self.k1 * norm)
+        return scores
+
+    def snapshot(self) -> Dict[str, object]:
+        """Retorna el tamaño y los contadores del índice."""
+        return {
+            "ready": self.ready,
+            "products": len(self._products),
+            "terms": len(self._postings),
+            "searches": self.searches,
+        }
@@ -1,12 +1,19 @@
 """
 Funciones de Inyección de Dependencias para el módulo de Pedidos.
+
+Los casos de uso son singletons sin estado registrados en el contenedor DI;
+repositorios, consultas, gateway y outbox son SCOPED (uno por request, sobre
+la sesión del request) y llegan a los casos de uso a través de proxies. Las
+lecturas puras (listar y consultar órdenes) usan el lado de consultas sobre
+la sesión de lectura; las escrituras cargan el agregado con el repositorio.
 """
-from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
-from typing import Annotated
+from typing import Annotated, Any, Dict
 
-from src.core.database import get_db_session
+from src.core.container import DIContainer, Lifetime, container, request_scope
+from src.core.events.outbox import SQLAlchemyEventOutbox
 from src.modules.pedidos.infrastructure.repositories import SQLAlchemyOrderRepository
+from src.modules.pedidos.infrastructure.queries import SQLAlchemyOrderQueries
 from src.modules.pedidos.infrastructure.gateways import CatalogoInventoryGateway
 from src.modules.pedidos.application.features.place_order.use_case import PlaceOrderUseCase
 from src.modules.pedidos.application.features.cancel_order.use_case import CancelOrderUseCase
@@ -16,82 +23,87 @@ from src.modules.pedidos.application.features.update_status.use_case import Upda
 from src.modules.pedidos.application.features.get_orders_by_customer.use_case import GetOrdersByCustomerUseCase
 
 
-# Dependency: Order Repository
-async def get_order_repository(
-    session: Annotated[AsyncSession, Depends(get_db_session)] 
-) -> SQLAlchemyOrderRepository:
-    """Inyecta el repositorio de órdenes."""
-    return SQLAlchemyOrderRepository(session)
-
+# ==================== Registro en el contenedor DI ====================
 
-# Dependency: Inventory Gateway
-async def get_inventory_gateway(
-    session: Annotated[AsyncSession, Depends(get_db_session)]
-) -> CatalogoInventoryGateway:
+def register_pedidos_dependencies(di: DIContainer = container):
     """
-    Inyecta el Gateway de Inventario.
+    Registra el grafo de dependencias del módulo Pedidos.
     
-    IMPORTANTE: Este Gateway conecta con el módulo de Catálogo.
+    IMPORTANTE: El Gateway de Inventario conecta con el módulo de Catálogo
+    sobre la misma sesión (y transacción) que el repositorio de órdenes.
     """
-    return CatalogoInventoryGateway(session)
+    # Por request
+    di.register("order_repository", lambda: SQLAlchemyOrderRepository(di.resolve("db_session")), Lifetime.SCOPED)
+    di.register("order_queries", lambda: SQLAlchemyOrderQueries(di.resolve("read_session")), Lifetime.SCOPED)
+    di.register("inventory_gateway", lambda: CatalogoInventoryGateway(di.resolve("db_session")), Lifetime.SCOPED)
+    di.register("event_outbox", lambda: SQLAlchemyEventOutbox(di.resolve("db_session")), Lifetime.SCOPED)
+    
+    # Casos de uso (una instancia por proceso)
+    di.register(
+        "place_order_use_case",
+        lambda: PlaceOrderUseCase(
+            di.proxy("order_repository"), di.proxy("inventory_gateway"), di.proxy("event_outbox")
+        ),
+        Lifetime.SINGLETON
+    )
+    di.register(
+        "cancel_order_use_case",
+        lambda: CancelOrderUseCase(di.proxy("order_repository"), di.proxy("inventory_gateway")),
+        Lifetime.SINGLETON
+    )
+    di.register("list_orders_use_case", lambda: ListOrdersUseCase(di.proxy("order_queries")), Lifetime.SINGLETON)
+    di.register("get_order_use_case", lambda: GetOrderUseCase(di.proxy("order_queries")), Lifetime.SINGLETON)
+    di.register("update_status_use_case", lambda: UpdateOrderStatusUseCase(di.proxy("order_repository")), Lifetime.SINGLETON)
+    di.register(
+        "get_orders_by_customer_use_case",
+        lambda: GetOrdersByCustomerUseCase(di.proxy("order_queries")),
+        Lifetime.SINGLETON
+    )
+
+
+RequestScope = Annotated[Dict[str, Any], Depends(request_scope)]
 
 
 # Dependency: PlaceOrder Use Case
-async def get_place_order_use_case(
-    repository: Annotated[SQLAlchemyOrderRepository, Depends(get_order_repository)],
-    gateway: Annotated[CatalogoInventoryGateway, Depends(get_inventory_gateway)] 
-) -> PlaceOrderUseCase:
+async def get_place_order_use_case(scope: RequestScope) -> PlaceOrderUseCase:
     """
     Inyecta el caso de uso PlaceOrder.
     
-    Este use case recibe AMBOS: el repositorio Y el gateway.
+    Este use case recibe el repositorio, el gateway y el outbox de eventos.
     """
-    return PlaceOrderUseCase(repository, gateway)
+    return container.resolve("place_order_use_case")
 
 
 # Dependency: ListOrders Use Case
-async def get_list_orders_use_case(
-    repository: Annotated[SQLAlchemyOrderRepository, Depends(get_order_repository)]
-) -> "ListOrdersUseCase":
+async def get_list_orders_use_case(scope: RequestScope) -> "ListOrdersUseCase":
     """Inyecta el caso de uso ListOrders."""
-    
-    return ListOrdersUseCase(repository)
+    return container.resolve("list_orders_use_case")
 
 
 # Dependency: CancelOrder Use Case
-async def get_cancel_order_use_case(
-    repository: Annotated[SQLAlchemyOrderRepository, Depends(get_order_repository)],
-    gateway: Annotated[CatalogoInventoryGateway, Depends(get_inventory_gateway)]
-) -> CancelOrderUseCase:
+async def get_cancel_order_use_case(scope: RequestScope) -> CancelOrderUseCase:
     """
     Inyecta el caso de uso CancelOrder.
     
     Este use case recibe AMBOS: el repositorio Y el gateway.
     El gateway es necesario para liberar el stock.
     """
-    return CancelOrderUseCase(repository, gateway)
+    return container.resolve("cancel_order_use_case")
 
 
 # Dependency: GetOrder Use Case
-async def get_get_order_use_case(
-    repository: Annotated[SQLAlchemyOrderRepository, Depends(get_order_repository)]
-) -> GetOrderUseCase:
+async def get_get_order_use_case(scope: RequestScope) -> GetOrderUseCase:
     """Inyecta el caso de uso GetOrder."""
-    return GetOrderUseCase(repository)
+    return container.resolve("get_order_use_case")
 
 
 # Dependency: UpdateOrderStatus Use Case
-async def get_update_status_use_case(
-    repository: Annotated[SQLAlchemyOrderRepository, Depends(get_order_repository)]
-) -> UpdateOrderStatusUseCase:
+async def get_update_status_use_case(scope: RequestScope) -> UpdateOrderStatusUseCase:
     """Inyecta el caso de uso UpdateOrderStatus."""
-    return UpdateOrderStatusUseCase(repository)
+    return container.resolve("update_status_use_case")
 
 
 # Dependency: GetOrdersByCustomer Use Case
-async def get_get_orders_by_customer_use_case(
-    repository: Annotated[SQLAlchemyOrderRepository, Depends(get_order_repository)]
-) -> GetOrdersByCustomerUseCase:
+async def get_get_orders_by_customer_use_case(scope: RequestScope) -> GetOrdersByCustomerUseCase:
     """Inyecta el caso de uso GetOrdersByCustomer."""
-    return GetOrdersByCustomerUseCase(repository)
-
+    return container.resolve("get_orders_by_customer_use_case")
@@ -1,8 +1,12 @@
 """
 Router de FastAPI para el módulo de Pedidos.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from typing import Annotated, List, Optional
+
+from src.core.etag import ETAG_HEADER, make_etag
+from src.core.pagination import NEXT_CURSOR_HEADER, set_next_cursor_header
+from src.core.responses import FastResponseRoute
 
 from src.modules.pedidos.application.features.place_order.command import PlaceOrderCommand
 from src.modules.pedidos.application.features.place_order.response import PlaceOrderResponse
@@ -29,12 +33,15 @@ from src.modules.pedidos.application.features.get_order.use_case import GetOrder
 from src.modules.pedidos.application.features.update_status.use_case import UpdateOrderStatusUseCase
 from src.modules.pedidos.application.features.get_orders_by_customer.use_case import GetOrdersByCustomerUseCase
 from src.modules.pedidos.domain.gateways import StockReservationError
-from src.core.exceptions import DomainError, BusinessRuleViolation, ValidationError, NotFoundError
+from src.core.exceptions import (
+    DomainError, BusinessRuleViolation, ValidationError, NotFoundError, ConcurrencyError,
+    NotModifiedError, PreconditionFailedError, InvalidStateTransitionError
+)
 
 
 
-# Router del módulo
-router = APIRouter()
+# Router del módulo (respuestas serializadas directamente con Pydantic, sin revalidar)
+router = APIRouter(route_class=FastResponseRoute)
 
 
 @router.post(
@@ -121,17 +128,23 @@ async def place_order(
     "/orders",
     response_model=List[PlaceOrderResponse],
     summary="Listar órdenes",
-    description="Obtiene una lista paginada de órdenes"
+    description=(
+        "Obtiene una lista paginada de órdenes ordenada por fecha de creación. "
+        f"El cursor de la página siguiente se retorna en la cabecera {NEXT_CURSOR_HEADER}"
+    )
 )
 async def list_orders(
-    skip: int = 0,
+    response: Response,
+    cursor: Optional[str] = None,
     limit: int = 100,
     use_case: ListOrdersUseCase = Depends(get_list_orders_use_case)
 ) -> List[PlaceOrderResponse]:
     """
-    Endpoint para listar órdenes.
+    Endpoint para listar órdenes (paginación keyset por cursor).
     """
-    return await use_case.execute(skip, limit)
+    page = await use_case.execute(cursor, limit)
+    set_next_cursor_header(response, page)
+    return page.items
 
 
 @router.post(
@@ -201,6 +214,10 @@ async def cancel_order(
             detail={"error": "Stock Release Error", "message": e.message}
         )
         
+    except ConcurrencyError:
+        # La orden fue modificada por otra petición: responde el handler global (409)
+        raise
+        
     except BusinessRuleViolation as e:
         # Violaciones de reglas de negocio (ej: orden ya enviada)
         raise HTTPException(
@@ -227,16 +244,25 @@ async def cancel_order(
     "/orders/{order_id}",
     response_model=GetOrderResponse,
     summary="Obtener orden por ID",
-    description="Busca una orden específica por su UUID"
+    description=(
+        "Busca una orden específica por su UUID. Retorna un ETag; con If-None-Match "
+        "responde 304 si la orden no cambió"
+    )
 )
 async def get_order_by_id(
     order_id: str,
+    response: Response,
+    if_none_match: Annotated[Optional[str], Header()] = None,
     use_case: GetOrderUseCase = Depends(get_get_order_use_case)
 ) -> GetOrderResponse:
     """Obtiene una orden por su ID."""
     try:
         command = GetOrderCommand(order_id=order_id)
-        return await use_case.execute(command)
+        order = await use_case.execute(command, if_none_match)
+        response.headers[ETAG_HEADER] = make_etag(order.order_id, order.version)
+        return order
+    except NotModifiedError:
+        raise  # Responde el handler global (304 con el ETag vigente)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -247,18 +273,28 @@ async def get_order_by_id(
     "/orders/{order_id}/status",
     response_model=UpdateOrderStatusResponse,
     summary="Actualizar estado de orden",
-    description="Actualiza el estado de una orden existente"
+    description=(
+        "Avanza el estado de una orden (confirmed → processing → shipped → delivered) con un "
+        "único UPDATE condicionado al estado de origen. 409 si la orden ya no está en ese "
+        "estado; con If-Match solo se aplica si la orden sigue en esa versión (412 en caso contrario)"
+    )
 )
 async def update_order_status(
     order_id: str,
     command: UpdateOrderStatusCommand,
+    response: Response,
+    if_match: Annotated[Optional[str], Header()] = None,
     use_case: UpdateOrderStatusUseCase = Depends(get_update_status_use_case)
 ) -> UpdateOrderStatusResponse:
     """Actualiza el estado de una orden."""
     try:
         if str(command.order_id) != order_id:
             command.order_id = order_id
-        return await use_case.execute(command)
+        result = await use_case.execute(command, if_match)
+        response.headers[ETAG_HEADER] = make_etag(result.order_id, result.version)
+        return result
+    except (PreconditionFailedError, InvalidStateTransitionError):
+        raise  # Responden los handlers globales (412, o 409 con el estado actual en el contexto)
     except (NotFoundError, BusinessRuleViolation) as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -269,18 +305,20 @@ async def update_order_status(
     "/orders/customer/{customer_id}",
     response_model=GetOrdersByCustomerResponse,
     summary="Obtener órdenes por cliente",
-    description="Obtiene todas las órdenes asociadas a un cliente"
+    description="Obtiene las órdenes asociadas a un cliente; `next_cursor` permite pedir la página siguiente"
 )
 async def get_orders_by_customer(
     customer_id: str,
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100,
     use_case: GetOrdersByCustomerUseCase = Depends(get_get_orders_by_customer_use_case)
 ) -> GetOrdersByCustomerResponse:
     """Obtiene las órdenes de un cliente."""
     try:
-        command = GetOrdersByCustomerCommand(customer_id=customer_id, skip=skip, limit=limit)
+        command = GetOrdersByCustomerCommand(customer_id=customer_id, cursor=cursor, limit=limit)
         return await use_case.execute(command)
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -26,3 +26,4 @@ class GetOrderResponse(BaseModel):
     created_at: datetime
     confirmed_at: Optional[datetime]
     cancelled_at: Optional[datetime]
+    version: int  # Versión de la fila (base del ETag)
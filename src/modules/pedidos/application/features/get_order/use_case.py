@@ -1,46 +1,39 @@
 """
 Caso de Uso: Obtener Orden.
 """
+from typing import Optional
+
 from src.modules.pedidos.application.features.get_order.command import GetOrderCommand
-from src.modules.pedidos.application.features.get_order.response import GetOrderResponse, OrderItemResponse
-from src.modules.pedidos.domain.repositories import OrderRepository
-from src.core.exceptions import NotFoundError
+from src.modules.pedidos.application.features.get_order.response import GetOrderResponse
+from src.modules.pedidos.application.queries import OrderQueries
+from src.core.etag import etag_matches, make_etag
+from src.core.exceptions import NotFoundError, NotModifiedError
 
 class GetOrderUseCase:
     """
     Caso de Uso: Obtener los detalles de una orden por su ID.
     """
     
-    def __init__(self, order_repository: OrderRepository):
-        self.order_repository = order_repository
+    def __init__(self, queries: OrderQueries):
+        self.queries = queries
         
-    async def execute(self, command: GetOrderCommand) -> GetOrderResponse:
+    async def execute(self, command: GetOrderCommand, if_none_match: Optional[str] = None) -> GetOrderResponse:
         """
-        Busca la orden en el repositorio y la retorna como DTO.
+        Proyecta la orden directamente a DTO desde el lado de consultas.
+        
+        Con `if_none_match` (cabecera If-None-Match) primero se lee solo la
+        versión: si el ETag del cliente sigue vigente se lanza NotModifiedError
+        sin cargar la orden ni sus items.
         """
-        order = await self.order_repository.get_by_id(command.order_id)
+        if if_none_match:
+            version = await self.queries.get_version(command.order_id)
+            if version is not None:
+                etag = make_etag(command.order_id, version)
+                if etag_matches(if_none_match, etag):
+                    raise NotModifiedError(etag)
+        
+        order = await self.queries.get_by_id(command.order_id)
         if not order:
             raise NotFoundError("Order", str(command.order_id))
             
-        return GetOrderResponse(
-            order_id=order.order_id,
-            customer_id=order.customer_info.customer_id,
-            customer_name=order.customer_info.name,
-            customer_email=order.customer_info.email,
-            customer_phone=order.customer_info.phone,
-            items=[
-                OrderItemResponse(
-                    product_id=item.product_id,
-                    product_name=item.product_name,
-                    quantity=item.quantity.value,
-                    unit_price=item.unit_price,
-                    subtotal=item.calculate_subtotal()
-                )
-                for item in order.items
-            ],
-            total_amount=order.total_amount,
-            status=order.status.value,
-            created_at=order.created_at,
-            confirmed_at=order.confirmed_at,
-            cancelled_at=order.cancelled_at
-        )
+        return order
@@ -1,7 +1,8 @@
+from typing import Optional
 from pydantic import BaseModel
 
 class GetOrdersByCustomerCommand(BaseModel):
     """Comando para obtener las órdenes de un cliente."""
     customer_id: str
-    skip: int = 0
+    cursor: Optional[str] = None
     limit: int = 100
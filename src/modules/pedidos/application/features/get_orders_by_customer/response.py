@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 from src.modules.pedidos.application.features.get_order.response import GetOrderResponse
 
 class GetOrdersByCustomerResponse(BaseModel):
@@ -7,3 +7,4 @@ class GetOrdersByCustomerResponse(BaseModel):
     customer_id: str
     orders: List[GetOrderResponse]
     total: int
+    next_cursor: Optional[str] = None
@@ -14,6 +14,7 @@ from src.modules.pedidos.domain.value_objects import (
 )
 from src.modules.pedidos.domain.repositories import OrderRepository
 from src.modules.pedidos.domain.gateways import InventoryGateway, StockReservationError
+from src.core.events.outbox import EventOutbox
 from src.core.exceptions import BusinessRuleViolation, NotFoundError
 
 
@@ -29,12 +30,14 @@ class PlaceOrderUseCase:
     3. Crear la entidad Order con los items
     4. Confirmar la orden
     5. Persistir usando el repositorio
+    6. Registrar los eventos de dominio en el outbox (misma transacción)
     """
     
     def __init__(
         self,
         order_repository: OrderRepository,
-        inventory_gateway: InventoryGateway
+        inventory_gateway: InventoryGateway,
+        event_outbox: EventOutbox
     ):
         """
         Constructor con Inyección de Dependencias.
@@ -42,9 +45,11 @@ class PlaceOrderUseCase:
         Args:
             order_repository: Implementación del puerto OrderRepository
             inventory_gateway: Implementación del puerto InventoryGateway
+            event_outbox: Outbox donde se registran los eventos de dominio
         """
         self.order_repository = order_repository
         self.inventory_gateway = inventory_gateway
+        self.event_outbox = event_outbox
     
     async def execute(self, command: PlaceOrderCommand) -> PlaceOrderResponse:
         """
@@ -84,12 +89,14 @@ class PlaceOrderUseCase:
         # Por ahora, usaremos un precio dummy que será reemplazado por el adaptador
         order_items: List[OrderItem] = []
         
+        # Verificar que todos los productos existen (una sola consulta al catálogo)
+        missing = await self.inventory_gateway.find_missing_products(
+            [item_cmd.product_id for item_cmd in command.items]
+        )
+        if missing:
+            raise NotFoundError("Product", str(missing[0]))
+        
         for item_cmd in command.items:
-            # Verificar que el producto existe
-            exists = await self.inventory_gateway.verify_product_exists(item_cmd.product_id)
-            if not exists:
-                raise NotFoundError("Product", str(item_cmd.product_id))
-            
             # Crear OrderItem (el precio será obtenido por el Gateway en el paso siguiente)
             # Por ahora usamos un placeholder
             order_item = OrderItem(
@@ -123,14 +130,11 @@ class PlaceOrderUseCase:
         saved_order = await self.order_repository.save(order)
         logger.info(f"Orden {saved_order.order_id} creada exitosamente con estado {saved_order.status}")
         
-        # 7. PUBLICAR EVENTOS DE DOMINIO
-        from src.core.events.event_bus import EventBus
-        try:
-            await EventBus.publish(order.domain_events)
-            order.domain_events.clear()  # Limpiar eventos tras publicar
-        except Exception as e:
-            logger.error(f"Error al publicar eventos de dominio: {str(e)}")
-            # No fallamos la transacción por errores en eventos secundarios (depende del negocio)
+        # 7. REGISTRAR EVENTOS DE DOMINIO EN EL OUTBOX
+        # Se guardan en la misma transacción que la orden; el relay los publica
+        # tras el commit, por lo que un rollback nunca dispara notificaciones
+        await self.event_outbox.add(order.domain_events)
+        order.domain_events.clear()
         
         # 8. Mapear a Response DTO
         items_response = [
@@ -8,3 +8,4 @@ class UpdateOrderStatusResponse(BaseModel):
     new_status: str
     success: bool
     message: str
+    version: int  # Versión tras la actualización (base del ETag)
@@ -1,52 +1,88 @@
 """
 Caso de Uso: Actualizar Estado de Orden.
 """
+from typing import Optional
+
 from src.modules.pedidos.application.features.update_status.command import UpdateOrderStatusCommand
 from src.modules.pedidos.application.features.update_status.response import UpdateOrderStatusResponse
 from src.modules.pedidos.domain.repositories import OrderRepository
-from src.modules.pedidos.domain.value_objects import OrderStatus
-from src.core.exceptions import NotFoundError, BusinessRuleViolation
+from src.modules.pedidos.domain.value_objects import OrderStatus, StatusTransition, ORDER_STATUS_TRANSITIONS
+from src.core.etag import if_match_versions
+from src.core.exceptions import (
+    NotFoundError, BusinessRuleViolation, PreconditionFailedError, InvalidStateTransitionError
+)
 
 class UpdateOrderStatusUseCase:
     """
     Caso de Uso: Actualizar el estado de una orden.
-    Permite avanzar la orden en su ciclo de vida.
+    Permite avanzar la orden en su ciclo de vida (ver ORDER_STATUS_TRANSITIONS).
+    
+    No carga el agregado: cada transición es un único UPDATE condicionado al
+    estado de origen. Solo si no se aplica se lee el estado actual para
+    explicar por qué.
     """
     
     def __init__(self, order_repository: OrderRepository):
         self.order_repository = order_repository
         
-    async def execute(self, command: UpdateOrderStatusCommand) -> UpdateOrderStatusResponse:
+    async def execute(self, command: UpdateOrderStatusCommand, if_match: Optional[str] = None) -> UpdateOrderStatusResponse:
         """
         Ejecuta la actualización del estado.
+        
+        Con `if_match` (cabecera If-Match) solo se aplica si la orden sigue en
+        la versión que leyó el cliente; si no, PreconditionFailedError. Si la
+        orden ya no está en el estado de origen (por ejemplo, otra petición
+        aplicó antes la misma transición), InvalidStateTransitionError.
         """
-        order = await self.order_repository.get_by_id(command.order_id)
-        if not order:
-            raise NotFoundError("Order", str(command.order_id))
-            
-        old_status = order.status
         try:
-            new_status_enum = OrderStatus(command.new_status.lower())
+            new_status = OrderStatus(command.new_status.lower())
         except ValueError:
             raise BusinessRuleViolation(f"Estado '{command.new_status}' no es válido")
-            
-        # Validaciones simples de transición
-        if old_status == OrderStatus.CANCELLED:
-            raise BusinessRuleViolation("No se puede cambiar el estado de una orden cancelada")
-            
-        if old_status == OrderStatus.DELIVERED:
-            raise BusinessRuleViolation("No se puede cambiar el estado de una orden entregada")
-            
-        # Actualizar el estado
-        order.status = new_status_enum
         
-        # Guardar cambios
-        await self.order_repository.update(order)
+        transition = ORDER_STATUS_TRANSITIONS.get(new_status)
+        if transition is None:
+            if new_status == OrderStatus.CANCELLED:
+                raise BusinessRuleViolation(
+                    "Las órdenes se cancelan con la operación de cancelación, que libera el stock reservado"
+                )
+            raise BusinessRuleViolation(f"Ninguna transición lleva una orden al estado '{new_status}'")
+        
+        expected_versions = if_match_versions(if_match, command.order_id) if if_match else None
+        new_version = await self.order_repository.transition_status(
+            command.order_id, transition, expected_versions
+        )
+        if new_version is None:
+            await self._raise_not_applied(command, transition, expected_versions)
         
+        old_status = transition.previous_status
         return UpdateOrderStatusResponse(
-            order_id=order.order_id,
+            order_id=command.order_id,
             old_status=old_status.value,
-            new_status=new_status_enum.value,
+            new_status=new_status.value,
             success=True,
-            message=f"Estado de la orden actualizado de {old_status.value} a {new_status_enum.value}"
+            message=f"Estado de la orden actualizado de {old_status.value} a {new_status.value}",
+            version=new_version
+        )
+    
+    async def _raise_not_applied(
+        self,
+        command: UpdateOrderStatusCommand,
+        transition: StatusTransition,
+        expected_versions: Optional[list]
+    ) -> None:
+        """Distingue entre orden inexistente, If-Match desactualizado y estado de origen incorrecto."""
+        current = await self.order_repository.get_status(command.order_id)
+        if current is None:
+            raise NotFoundError("Order", str(command.order_id))
+        
+        status, version = current
+        if expected_versions is not None and version not in expected_versions:
+            raise PreconditionFailedError("Order", str(command.order_id))
+        
+        raise InvalidStateTransitionError(
+            entity_name="Order",
+            entity_id=str(command.order_id),
+            current_state=status.value,
+            target_state=transition.target.value,
+            allowed_from=[allowed.value for allowed in transition.allowed_from]
         )
@@ -0,0 +1,55 @@
+"""
+Puerto del lado de consultas (CQRS) del módulo Pedidos.
+
+Las lecturas que solo alimentan una respuesta HTTP no necesitan el modelo de
+dominio: la implementación proyecta las columnas necesarias directamente a
+los DTOs de respuesta. Las escrituras (crear, cancelar, cambiar de estado)
+siguen cargando el agregado Order a través del repositorio.
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from src.core.pagination import Page
+from src.modules.pedidos.application.features.get_order.response import GetOrderResponse
+from src.modules.pedidos.application.features.place_order.response import PlaceOrderResponse
+
+
+class OrderQueries(ABC):
+    """
+    Consultas de solo lectura sobre órdenes que retornan DTOs.
+    Esta es una interfaz que será implementada en la capa de Infraestructura.
+    """
+
+    @abstractmethod
+    async def list_orders(self, cursor: Optional[str] = None, limit: int = 100) -> Page[PlaceOrderResponse]:
+        """
+        Obtiene una página de órdenes ordenada por (created_at, id).
+        `cursor` es el `next_cursor` de la página anterior (None = primera página).
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, order_id: UUID) -> Optional[GetOrderResponse]:
+        """
+        Busca una orden por su ID.
+        Retorna None si no existe.
+        """
+        pass
+
+    @abstractmethod
+    async def get_version(self, order_id: UUID) -> Optional[int]:
+        """
+        Retorna la versión de una orden sin leer el resto de la fila.
+        Retorna None si no existe.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_customer(
+        self, customer_id: str, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[GetOrderResponse]:
+        """
+        Obtiene una página de las órdenes de un cliente específico.
+        """
+        pass
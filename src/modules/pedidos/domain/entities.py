@@ -7,13 +7,14 @@ from typing import List, Any
 from uuid import UUID, uuid4
 
 from src.modules.pedidos.domain.value_objects import (
-    OrderStatus, Quantity, Address, CustomerInfo
+    OrderStatus, Quantity, Address, CustomerInfo, ORDER_STATUS_TRANSITIONS
 )
 from src.modules.pedidos.domain.events import OrderCreatedEvent
+from src.core.change_tracking import ChangeTracking
 from src.core.exceptions import BusinessRuleViolation
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderItem:
     """
     Item de una orden.
@@ -37,11 +38,12 @@ class OrderItem:
         return f"OrderItem(product={self.product_name}, qty={self.quantity.value}, price={self.unit_price})"
 
 
-@dataclass
-class Order:
+@dataclass(slots=True)
+class Order(ChangeTracking):
     """
     Agregado Raíz: Orden de compra.
     Representa un pedido completo de un cliente.
+    Registra qué campos cambian desde que se carga (ver ChangeTracking).
     """
     # Identidad
     order_id: UUID = field(default_factory=uuid4)
@@ -64,6 +66,7 @@ class Order:
     updated_at: datetime = field(default_factory=datetime.utcnow)
     confirmed_at: datetime = field(default=None)
     cancelled_at: datetime = field(default=None)
+    version: int = field(default=1)  # Versión leída (concurrencia optimista)
     
     # Eventos de dominio (no se persisten en DB directamente)
     domain_events: List[Any] = field(default_factory=list, repr=False)
@@ -108,14 +111,7 @@ class Order:
         Confirma la orden.
         Regla de negocio: Solo se puede confirmar una orden en estado PENDING.
         """
-        if self.status != OrderStatus.PENDING:
-            raise BusinessRuleViolation(
-                f"Solo se pueden confirmar órdenes en estado PENDING. Estado actual: {self.status}"
-            )
-        
-        self.status = OrderStatus.CONFIRMED
-        self.confirmed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self._transition_to(OrderStatus.CONFIRMED)
     
     def cancel(self, reason: str = None) -> None:
         """
@@ -136,27 +132,27 @@ class Order:
     
     def mark_as_processing(self) -> None:
         """Marca la orden como en proceso."""
-        if self.status != OrderStatus.CONFIRMED:
-            raise BusinessRuleViolation("Solo se pueden procesar órdenes confirmadas")
-        
-        self.status = OrderStatus.PROCESSING
-        self.updated_at = datetime.utcnow()
+        self._transition_to(OrderStatus.PROCESSING)
     
     def mark_as_shipped(self) -> None:
         """Marca la orden como enviada."""
-        if self.status != OrderStatus.PROCESSING:
-            raise BusinessRuleViolation("Solo se pueden enviar órdenes en proceso")
-        
-        self.status = OrderStatus.SHIPPED
-        self.updated_at = datetime.utcnow()
+        self._transition_to(OrderStatus.SHIPPED)
     
     def mark_as_delivered(self) -> None:
         """Marca la orden como entregada."""
-        if self.status != OrderStatus.SHIPPED:
-            raise BusinessRuleViolation("Solo se pueden entregar órdenes enviadas")
+        self._transition_to(OrderStatus.DELIVERED)
+    
+    def _transition_to(self, target: OrderStatus) -> None:
+        """Aplica una transición de ORDER_STATUS_TRANSITIONS validando el estado de origen."""
+        transition = ORDER_STATUS_TRANSITIONS[target]
+        if self.status not in transition.allowed_from:
+            raise BusinessRuleViolation(transition.rejection.format(current=self.status))
         
-        self.status = OrderStatus.DELIVERED
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.status = target
+        if transition.timestamp_field:
+            setattr(self, transition.timestamp_field, now)
+        self.updated_at = now
     
     def add_item(self, item: OrderItem) -> None:
         """Agrega un item a la orden (solo si está en PENDING)."""
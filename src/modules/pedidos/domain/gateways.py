@@ -54,6 +54,19 @@ class InventoryGateway(ABC):
         """
         pass
     
+    @abstractmethod
+    async def find_missing_products(self, product_ids: List[UUID]) -> List[UUID]:
+        """
+        Verifica en una sola operación qué productos no existen en el catálogo.
+        
+        Args:
+            product_ids: IDs de los productos a verificar
+            
+        Returns:
+            Lista con los IDs que no existen (vacía si todos existen)
+        """
+        pass
+    
     @abstractmethod
     async def verify_product_exists(self, product_id: UUID) -> bool:
         """
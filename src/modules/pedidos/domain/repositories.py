@@ -2,10 +2,12 @@
 Puertos de Repositorio para el dominio de Pedidos.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Collection, Optional, List, Tuple
 from uuid import UUID
 
+from src.core.pagination import Page
 from src.modules.pedidos.domain.entities import Order
+from src.modules.pedidos.domain.value_objects import OrderStatus, StatusTransition
 
 
 class OrderRepository(ABC):
@@ -30,6 +32,31 @@ class OrderRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def transition_status(
+        self,
+        order_id: UUID,
+        transition: StatusTransition,
+        expected_versions: Optional[Collection[int]] = None
+    ) -> Optional[int]:
+        """
+        Aplica una transición de estado sin cargar la orden (compare-and-set).
+        
+        Solo cambia la orden si su estado está en `transition.allowed_from` y,
+        con `expected_versions`, si su versión es una de ellas. Retorna la
+        nueva versión, o None si no se aplicó (orden inexistente o condición
+        no cumplida; ver `get_status`).
+        """
+        pass
+    
+    @abstractmethod
+    async def get_status(self, order_id: UUID) -> Optional[Tuple[OrderStatus, int]]:
+        """
+        Obtiene el estado y la versión actuales de una orden sin cargarla.
+        Retorna None si no existe.
+        """
+        pass
+    
     @abstractmethod
     async def get_by_id(self, order_id: UUID) -> Optional[Order]:
         """
@@ -39,15 +66,16 @@ class OrderRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Order]:
+    async def get_page(self, cursor: Optional[str] = None, limit: int = 100) -> Page[Order]:
         """
-        Obtiene todas las órdenes con paginación.
+        Obtiene una página de órdenes ordenada por (created_at, id).
+        `cursor` es el `next_cursor` de la página anterior (None = primera página).
         """
         pass
 
     @abstractmethod
-    async def get_by_customer(self, customer_id: str, skip: int = 0, limit: int = 100) -> List[Order]:
+    async def get_by_customer(self, customer_id: str, cursor: Optional[str] = None, limit: int = 100) -> Page[Order]:
         """
-        Obtiene las órdenes de un cliente específico.
+        Obtiene una página de las órdenes de un cliente específico.
         """
         pass
@@ -3,6 +3,7 @@ Value Objects del dominio de Pedidos.
 """
 from dataclasses import dataclass
 from enum import Enum
+from typing import Dict, FrozenSet, Optional
 import re
 from src.core.exceptions import ValidationError
 
@@ -23,7 +24,68 @@ class OrderStatus(str, Enum):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class StatusTransition:
+    """
+    Transición del ciclo de vida de una orden.
+    
+    Atributos:
+        target: Estado al que se llega
+        allowed_from: Estados desde los que se permite la transición
+        rejection: Mensaje si la orden no está en un estado de origen
+            (admite `{current}`, el estado actual)
+        timestamp_field: Campo de fecha que registra la transición (ej: confirmed_at)
+    """
+    target: OrderStatus
+    allowed_from: FrozenSet[OrderStatus]
+    rejection: str
+    timestamp_field: Optional[str] = None
+    
+    @property
+    def previous_status(self) -> OrderStatus:
+        """
+        Estado de origen de la transición.
+        
+        Las transiciones del ciclo de vida tienen un único origen; un
+        UPDATE ... RETURNING solo ve el estado nuevo, así que el anterior se
+        deduce de la tabla.
+        """
+        (status,) = self.allowed_from
+        return status
+
+
+# Tabla de transiciones por estado destino (reglas de Order.confirm, mark_as_processing,
+# mark_as_shipped y mark_as_delivered). La cancelación no está: libera stock y tiene su
+# propio caso de uso.
+ORDER_STATUS_TRANSITIONS: Dict[OrderStatus, StatusTransition] = {
+    transition.target: transition
+    for transition in (
+        StatusTransition(
+            target=OrderStatus.CONFIRMED,
+            allowed_from=frozenset({OrderStatus.PENDING}),
+            rejection="Solo se pueden confirmar órdenes en estado PENDING. Estado actual: {current}",
+            timestamp_field="confirmed_at"
+        ),
+        StatusTransition(
+            target=OrderStatus.PROCESSING,
+            allowed_from=frozenset({OrderStatus.CONFIRMED}),
+            rejection="Solo se pueden procesar órdenes confirmadas"
+        ),
+        StatusTransition(
+            target=OrderStatus.SHIPPED,
+            allowed_from=frozenset({OrderStatus.PROCESSING}),
+            rejection="Solo se pueden enviar órdenes en proceso"
+        ),
+        StatusTransition(
+            target=OrderStatus.DELIVERED,
+            allowed_from=frozenset({OrderStatus.SHIPPED}),
+            rejection="Solo se pueden entregar órdenes enviadas"
+        ),
+    )
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Quantity:
     """
     Cantidad de productos en un pedido.
@@ -53,7 +115,7 @@ class Quantity:
         return self.value * price
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Address:
     """
     Dirección de envío.
@@ -86,7 +148,7 @@ class Address:
         return f"{self.street}, {self.city}, {self.state} {self.postal_code}, {self.country}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CustomerInfo:
     """
     Información del cliente.
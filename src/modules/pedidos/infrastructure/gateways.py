@@ -19,7 +19,7 @@ from src.modules.catalogo.application.features.release_stock.command import (
     ReleaseStockCommand, ReleaseStockItemCommand
 )
 from src.modules.catalogo.application.features.release_stock.use_case import ReleaseStockUseCase
-from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
+from src.modules.catalogo.infrastructure.repository_manager import RepositoryManager
 from src.core.exceptions import BusinessRuleViolation, NotFoundError
 
 
@@ -45,8 +45,8 @@ class CatalogoInventoryGateway(InventoryGateway):
         """
         self.db_session = db_session
         
-        # Crear el repositorio de productos
-        self.product_repository = SQLAlchemyProductRepository(db_session)
+        # Repositorio de productos del request (compartido con el módulo de Catálogo)
+        self.product_repository = RepositoryManager().get_product_repository(db_session)
         
         # Crear los use cases de stock
         self.reserve_stock_use_case = ReserveStockUseCase(self.product_repository)
@@ -118,6 +118,13 @@ class CatalogoInventoryGateway(InventoryGateway):
             raise StockReservationError(f"Error inesperado al liberar stock: {str(e)}")
 
     
+    async def find_missing_products(self, product_ids: List[UUID]) -> List[UUID]:
+        """
+        Verifica la existencia de varios productos con una única consulta.
+        """
+        products = await self.product_repository.get_by_ids(product_ids)
+        return [product_id for product_id in product_ids if product_id not in products]
+    
     async def verify_product_exists(self, product_id: UUID) -> bool:
         """
         Verifica si un producto existe en el catálogo.
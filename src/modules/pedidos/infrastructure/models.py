@@ -1,7 +1,7 @@
 """
 Modelos de SQLAlchemy para el módulo de Pedidos.
 """
-from sqlalchemy import Column, String, Float, Integer, DateTime, ForeignKey, Enum as SQLEnum, Uuid
+from sqlalchemy import Column, String, Float, Integer, DateTime, ForeignKey, Index, Enum as SQLEnum, Uuid
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -60,6 +60,12 @@ class OrderModel(Base):
     # Relación con items
     items = relationship("OrderItemModel", back_populates="order", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        # Paginación keyset: ORDER BY / WHERE (created_at, order_id), global y por cliente
+        Index("ix_orders_created_at_order_id", "created_at", "order_id"),
+        Index("ix_orders_customer_created_at_order_id", "customer_id", "created_at", "order_id"),
+    )
+    
     def __repr__(self):
         return f"<OrderModel(order_id='{self.order_id}', customer='{self.customer_name}', status='{self.status}')>"
 
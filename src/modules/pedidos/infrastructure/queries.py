@@ -0,0 +1,134 @@
+"""
+Consultas de órdenes (lado de lectura de CQRS) con SQLAlchemy Core.
+
+Seleccionan solo las columnas de la respuesta y construyen los DTOs
+directamente desde las filas: sin identity map del ORM, sin hidratar el
+agregado Order y sin revalidar datos que ya se validaron al escribirlos.
+Los items de una página se leen con una sola consulta `order_id IN (...)`.
+"""
+from collections import defaultdict
+from typing import Dict, List, Optional, Type
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.pagination import Page, build_page, keyset_paginate
+from src.modules.pedidos.application.features.get_order import response as get_order_response
+from src.modules.pedidos.application.features.get_order.response import GetOrderResponse
+from src.modules.pedidos.application.features.place_order import response as place_order_response
+from src.modules.pedidos.application.features.place_order.response import PlaceOrderResponse
+from src.modules.pedidos.application.queries import OrderQueries
+from src.modules.pedidos.infrastructure.models import OrderItemModel, OrderModel
+
+
+# Columnas de la respuesta resumida (listado) y de la de detalle
+_SUMMARY_COLUMNS = (
+    OrderModel.order_id,
+    OrderModel.customer_id,
+    OrderModel.customer_name,
+    OrderModel.total_amount,
+    OrderModel.status,
+    OrderModel.created_at,
+)
+
+_DETAIL_COLUMNS = (
+    *_SUMMARY_COLUMNS,
+    OrderModel.customer_email,
+    OrderModel.customer_phone,
+    OrderModel.confirmed_at,
+    OrderModel.cancelled_at,
+    OrderModel.version,
+)
+
+_ITEM_COLUMNS = (
+    OrderItemModel.order_id,
+    OrderItemModel.product_id,
+    OrderItemModel.product_name,
+    OrderItemModel.quantity,
+    OrderItemModel.unit_price,
+)
+
+
+class SQLAlchemyOrderQueries(OrderQueries):
+    """
+    Implementación de OrderQueries sobre la sesión de lectura.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Args:
+            session: Sesión async de SQLAlchemy (réplica si está configurada)
+        """
+        self.session = session
+
+    async def list_orders(self, cursor: Optional[str] = None, limit: int = 100) -> Page[PlaceOrderResponse]:
+        """Obtiene una página de órdenes (keyset sobre created_at, order_id)."""
+        return await self._paginate(
+            select(*_SUMMARY_COLUMNS), PlaceOrderResponse, place_order_response.OrderItemResponse, cursor, limit
+        )
+
+    async def get_by_id(self, order_id: UUID) -> Optional[GetOrderResponse]:
+        """Busca una orden por su ID."""
+        stmt = select(*_DETAIL_COLUMNS).where(OrderModel.order_id == order_id)
+        rows = (await self.session.execute(stmt)).mappings().all()
+        orders = await self._build(rows, GetOrderResponse, get_order_response.OrderItemResponse)
+
+        return orders[0] if orders else None
+
+    async def get_version(self, order_id: UUID) -> Optional[int]:
+        """Lee solo la versión de una orden."""
+        stmt = select(OrderModel.version).where(OrderModel.order_id == order_id)
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def get_by_customer(
+        self, customer_id: str, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[GetOrderResponse]:
+        """Obtiene una página de las órdenes de un cliente (keyset sobre created_at, order_id)."""
+        return await self._paginate(
+            select(*_DETAIL_COLUMNS).where(OrderModel.customer_id == customer_id),
+            GetOrderResponse,
+            get_order_response.OrderItemResponse,
+            cursor,
+            limit
+        )
+
+    async def _paginate(
+        self, stmt, order_dto: Type[BaseModel], item_dto: Type[BaseModel], cursor: Optional[str], limit: int
+    ) -> Page:
+        """Aplica la paginación keyset y construye los DTOs de la página."""
+        stmt = keyset_paginate(stmt, OrderModel.created_at, OrderModel.order_id, cursor, limit)
+        rows = (await self.session.execute(stmt)).mappings().all()
+        orders = await self._build(rows, order_dto, item_dto)
+
+        return build_page(orders, limit, key=lambda o: (o.created_at, o.order_id))
+
+    async def _build(self, rows, order_dto: Type[BaseModel], item_dto: Type[BaseModel]) -> List[BaseModel]:
+        """Construye los DTOs de las órdenes con sus items."""
+        items = await self._items_by_order([row["order_id"] for row in rows], item_dto)
+        return [
+            order_dto.model_construct(**{**row, "status": row["status"].value, "items": items.get(row["order_id"], [])})
+            for row in rows
+        ]
+
+    async def _items_by_order(self, order_ids: List[UUID], item_dto: Type[BaseModel]) -> Dict[UUID, List[BaseModel]]:
+        """Lee los items de varias órdenes con una única consulta y los agrupa por orden."""
+        if not order_ids:
+            return {}
+
+        stmt = (
+            select(*_ITEM_COLUMNS)
+            .where(OrderItemModel.order_id.in_(order_ids))
+            .order_by(OrderItemModel.item_id)
+        )
+        items: Dict[UUID, List[BaseModel]] = defaultdict(list)
+        for order_id, product_id, product_name, quantity, unit_price in await self.session.execute(stmt):
+            items[order_id].append(item_dto.model_construct(
+                product_id=product_id,
+                product_name=product_name,
+                quantity=quantity,
+                unit_price=unit_price,
+                subtotal=round(quantity * unit_price, 2)
+            ))
+        return items
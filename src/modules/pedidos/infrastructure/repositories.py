@@ -1,18 +1,44 @@
 """
 Adaptador del Repositorio de Órdenes usando SQLAlchemy.
 """
-from typing import Optional, List
+from datetime import datetime
+from typing import Collection, Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.modules.pedidos.domain.entities import Order, OrderItem
 from src.modules.pedidos.domain.value_objects import (
-    OrderStatus, Quantity, Address, CustomerInfo
+    OrderStatus, Quantity, Address, CustomerInfo, StatusTransition
 )
 from src.modules.pedidos.domain.repositories import OrderRepository
 from src.modules.pedidos.infrastructure.models import OrderModel, OrderItemModel, OrderStatusEnum
+from src.core.change_tracking import changed_values, mark_clean
+from src.core.exceptions import ConcurrencyError
+from src.core.hydration import hydrator
+from src.core.pagination import Page, build_page, keyset_paginate
+
+
+# Hidratadores de confianza (sin validación ni __post_init__) para datos leídos de la base de datos
+_hydrate_order = hydrator(Order)
+_hydrate_order_item = hydrator(OrderItem)
+_hydrate_quantity = hydrator(Quantity)
+_hydrate_customer_info = hydrator(CustomerInfo)
+_hydrate_address = hydrator(Address)
+
+# Columnas de la cabecera en las que se guarda cada campo de Order
+_COLUMNS_BY_FIELD = {
+    "customer_info": ("customer_id", "customer_name", "customer_email", "customer_phone"),
+    "shipping_address": (
+        "shipping_street", "shipping_city", "shipping_state", "shipping_postal_code", "shipping_country"
+    ),
+    "status": ("status",),
+    "total_amount": ("total_amount",),
+    "updated_at": ("updated_at",),
+    "confirmed_at": ("confirmed_at",),
+    "cancelled_at": ("cancelled_at",),
+}
 
 
 class SQLAlchemyOrderRepository(OrderRepository):
@@ -32,29 +58,34 @@ class SQLAlchemyOrderRepository(OrderRepository):
     # Métodos de mapeo (Domain <-> ORM)
     
     def _to_domain(self, model: OrderModel) -> Order:
-        """Convierte un OrderModel (ORM) a Order (Dominio)."""
+        """
+        Convierte un OrderModel (ORM) a Order (Dominio).
+        
+        Hidrata sin validar ni ejecutar `__post_init__`: una orden cargada no
+        recalcula su total ni registra un OrderCreatedEvent.
+        """
         # Mapear items
         items = [
-            OrderItem(
+            _hydrate_order_item(
                 product_id=item.product_id,
                 product_name=item.product_name,
-                quantity=Quantity(value=item.quantity),
+                quantity=_hydrate_quantity(value=item.quantity),
                 unit_price=item.unit_price
             )
             for item in model.items
         ]
         
         # Mapear orden
-        return Order(
+        return _hydrate_order(
             order_id=model.order_id,
-            customer_info=CustomerInfo(
+            customer_info=_hydrate_customer_info(
                 customer_id=model.customer_id,
                 name=model.customer_name,
                 email=model.customer_email,
                 phone=model.customer_phone
             ),
             items=items,
-            shipping_address=Address(
+            shipping_address=_hydrate_address(
                 street=model.shipping_street,
                 city=model.shipping_city,
                 state=model.shipping_state,
@@ -66,9 +97,29 @@ class SQLAlchemyOrderRepository(OrderRepository):
             created_at=model.created_at,
             updated_at=model.updated_at,
             confirmed_at=model.confirmed_at,
-            cancelled_at=model.cancelled_at
+            cancelled_at=model.cancelled_at,
+            version=model.version
         )
     
+    def _to_values(self, order: Order) -> dict:
+        """Convierte un Order en el diccionario de columnas editables de la cabecera."""
+        return {
+            "customer_id": order.customer_info.customer_id,
+            "customer_name": order.customer_info.name,
+            "customer_email": order.customer_info.email,
+            "customer_phone": order.customer_info.phone,
+            "shipping_street": order.shipping_address.street,
+            "shipping_city": order.shipping_address.city,
+            "shipping_state": order.shipping_address.state,
+            "shipping_postal_code": order.shipping_address.postal_code,
+            "shipping_country": order.shipping_address.country,
+            "status": OrderStatusEnum(order.status.value),
+            "total_amount": order.total_amount,
+            "updated_at": order.updated_at,
+            "confirmed_at": order.confirmed_at,
+            "cancelled_at": order.cancelled_at,
+        }
+    
     def _to_model(self, order: Order) -> OrderModel:
         """Convierte un Order (Dominio) a OrderModel (ORM)."""
         # Crear modelo de orden
@@ -87,7 +138,8 @@ class SQLAlchemyOrderRepository(OrderRepository):
             total_amount=order.total_amount,
             created_at=order.created_at,
             updated_at=order.updated_at,
-            confirmed_at=order.confirmed_at
+            confirmed_at=order.confirmed_at,
+            version=order.version
         )
         
         # Crear modelos de items
@@ -113,62 +165,114 @@ class SQLAlchemyOrderRepository(OrderRepository):
         return self._to_domain(model)
     
     async def update(self, order: Order) -> Order:
-        """Actualiza una orden existente."""
-        stmt = select(OrderModel).where(OrderModel.order_id == order.order_id).options(selectinload(OrderModel.items))
+        """
+        Actualiza una orden existente con control de concurrencia optimista.
+        
+        Los items de una orden no cambian tras su creación, por lo que solo se
+        actualiza la cabecera con un UPDATE condicionado a la versión leída.
+        Solo se escriben las columnas de los campos modificados desde la carga
+        (un cambio de estado no reescribe cliente ni dirección); si no cambió
+        nada, no se emite ninguna sentencia.
+        """
+        values = changed_values(order, self._to_values(order), _COLUMNS_BY_FIELD)
+        if not values:
+            return order
+        
+        stmt = (
+            update(OrderModel)
+            .where(
+                OrderModel.order_id == order.order_id,
+                OrderModel.version == order.version
+            )
+            .values(**values, version=OrderModel.version + 1)
+            .returning(OrderModel.version)
+            .execution_options(synchronize_session="fetch")
+        )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        new_version = result.scalar_one_or_none()
         
-        if not model:
+        if new_version is None:
+            await self._raise_update_conflict(order)
+        
+        order.version = new_version
+        mark_clean(order)
+        return order
+    
+    async def _raise_update_conflict(self, order: Order) -> None:
+        """Distingue entre orden inexistente y conflicto de versión."""
+        stmt = select(OrderModel.version).where(OrderModel.order_id == order.order_id)
+        actual_version = (await self.session.execute(stmt)).scalar_one_or_none()
+        
+        if actual_version is None:
             raise ValueError(f"Orden con ID {order.order_id} no encontrada")
         
-        # Actualizar campos
-        model.customer_id = order.customer_info.customer_id
-        model.customer_name = order.customer_info.name
-        model.customer_email = order.customer_info.email
-        model.customer_phone = order.customer_info.phone
-        model.shipping_street = order.shipping_address.street
-        model.shipping_city = order.shipping_address.city
-        model.shipping_state = order.shipping_address.state
-        model.shipping_postal_code = order.shipping_address.postal_code
-        model.shipping_country = order.shipping_address.country
-        model.status = OrderStatusEnum(order.status.value)
-        model.total_amount = order.total_amount
-        model.updated_at = order.updated_at
-        model.confirmed_at = order.confirmed_at
-        model.cancelled_at = order.cancelled_at
-        
-        # Incrementar versión para concurrencia optimista
-        model.version = model.version + 1
-
+        raise ConcurrencyError(
+            entity_name="Order",
+            entity_id=str(order.order_id),
+            expected_version=order.version,
+            actual_version=actual_version
+        )
+    
+    async def transition_status(
+        self,
+        order_id: UUID,
+        transition: StatusTransition,
+        expected_versions: Optional[Collection[int]] = None
+    ) -> Optional[int]:
+        """
+        Aplica una transición de estado en una sola sentencia.
         
-        await self.session.flush()
-        await self.session.refresh(model, ["items"])
-        return self._to_domain(model)
-
+        UPDATE orders SET status = :to, ... WHERE order_id = :id AND status IN (:allowed_from)
+        RETURNING version. La condición sobre el estado hace de compare-and-set:
+        de dos transiciones concurrentes desde el mismo estado solo una
+        encuentra la fila en su estado de origen.
+        """
+        now = datetime.utcnow()
+        values = {"status": OrderStatusEnum(transition.target.value), "updated_at": now}
+        if transition.timestamp_field:
+            for column in _COLUMNS_BY_FIELD[transition.timestamp_field]:
+                values[column] = now
+        
+        stmt = (
+            update(OrderModel)
+            .where(
+                OrderModel.order_id == order_id,
+                OrderModel.status.in_([OrderStatusEnum(status.value) for status in transition.allowed_from])
+            )
+            .values(**values, version=OrderModel.version + 1)
+            .returning(OrderModel.version)
+            .execution_options(synchronize_session="fetch")
+        )
+        if expected_versions is not None:
+            stmt = stmt.where(OrderModel.version.in_(list(expected_versions)))
+        
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+    
+    async def get_status(self, order_id: UUID) -> Optional[Tuple[OrderStatus, int]]:
+        """Lee solo el estado y la versión de una orden."""
+        stmt = select(OrderModel.status, OrderModel.version).where(OrderModel.order_id == order_id)
+        row = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return OrderStatus(row.status.value), row.version
     
     async def get_by_id(self, order_id: UUID) -> Optional[Order]:
         """Busca una orden por su ID."""
-        stmt = select(OrderModel).where(OrderModel.order_id == order_id).options(selectinload(OrderModel.items))
+        stmt = (
+            select(OrderModel)
+            .where(OrderModel.order_id == order_id)
+            .options(selectinload(OrderModel.items))
+            .execution_options(populate_existing=True)
+        )
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
         
         return self._to_domain(model) if model else None
     
-    async def get_by_customer(self, customer_id: str, skip: int = 0, limit: int = 100) -> List[Order]:
-        """Obtiene todas las órdenes de un cliente."""
-        stmt = select(OrderModel).where(OrderModel.customer_id == customer_id).options(selectinload(OrderModel.items)).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        
-        return [self._to_domain(model) for model in models]
-    
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Order]:
-        """Obtiene todas las órdenes con paginación."""
-        stmt = select(OrderModel).options(selectinload(OrderModel.items)).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        
-        return [self._to_domain(model) for model in models]
+    async def get_page(self, cursor: Optional[str] = None, limit: int = 100) -> Page[Order]:
+        """Obtiene una página de órdenes (keyset sobre created_at, order_id)."""
+        return await self._paginate(select(OrderModel), cursor, limit)
     
     async def delete(self, order_id: UUID) -> bool:
         """Elimina una orden por su ID."""
@@ -183,16 +287,22 @@ class SQLAlchemyOrderRepository(OrderRepository):
         await self.session.flush()
         return True
 
-    async def get_by_customer(self, customer_id: str, skip: int = 0, limit: int = 100) -> List[Order]:
-        """Obtiene las órdenes de un cliente con paginación."""
-        stmt = (
-            select(OrderModel)
-            .where(OrderModel.customer_id == customer_id)
-            .options(selectinload(OrderModel.items))
-            .offset(skip)
-            .limit(limit)
+    async def get_by_customer(self, customer_id: str, cursor: Optional[str] = None, limit: int = 100) -> Page[Order]:
+        """Obtiene una página de las órdenes de un cliente (keyset sobre created_at, order_id)."""
+        return await self._paginate(
+            select(OrderModel).where(OrderModel.customer_id == customer_id), cursor, limit
+        )
+
+    async def _paginate(self, stmt, cursor: Optional[str], limit: int) -> Page[Order]:
+        """Aplica la paginación keyset y carga los items de la página en una consulta."""
+        stmt = keyset_paginate(
+            stmt.options(selectinload(OrderModel.items)),
+            OrderModel.created_at,
+            OrderModel.order_id,
+            cursor,
+            limit
         )
         result = await self.session.execute(stmt)
-        models = result.scalars().all()
+        orders = [self._to_domain(model) for model in result.scalars().all()]
         
-        return [self._to_domain(model) for model in models]
+        return build_page(orders, limit, key=lambda o: (o.created_at, o.order_id))
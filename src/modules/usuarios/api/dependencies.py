@@ -6,7 +6,7 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError, jwt
 
-from src.core.database import get_db_session
+from src.core.database import get_db_session, get_read_session
 from src.core.config import settings
 from src.modules.usuarios.infrastructure.repositories import SQLAlchemyUserRepository
 from src.modules.usuarios.application.features.register_user.use_case import RegisterUserUseCase
@@ -19,6 +19,9 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/usuarios/login")
 def get_user_repository(session: AsyncSession = Depends(get_db_session)) -> SQLAlchemyUserRepository:
     return SQLAlchemyUserRepository(session)
 
+def get_read_user_repository(session: AsyncSession = Depends(get_read_session)) -> SQLAlchemyUserRepository:
+    return SQLAlchemyUserRepository(session)
+
 def get_register_use_case(repo: SQLAlchemyUserRepository = Depends(get_user_repository)) -> RegisterUserUseCase:
     return RegisterUserUseCase(repo)
 
@@ -27,7 +30,7 @@ def get_login_use_case(repo: SQLAlchemyUserRepository = Depends(get_user_reposit
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    repo: SQLAlchemyUserRepository = Depends(get_user_repository)
+    repo: SQLAlchemyUserRepository = Depends(get_read_user_repository)
 ) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
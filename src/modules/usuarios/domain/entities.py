@@ -7,7 +7,7 @@ from typing import List, Optional
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class Permission:
     """Entidad que representa un permiso en el sistema."""
     name: str
@@ -15,7 +15,7 @@ class Permission:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Role:
     """Entidad que representa un rol de usuario."""
     name: str
@@ -28,7 +28,7 @@ class Role:
         return any(p.name == permission_name for p in self.permissions)
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Entidad que representa un usuario del sistema."""
     username: str
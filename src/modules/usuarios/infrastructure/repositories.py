@@ -7,11 +7,18 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.core.hydration import hydrator
 from src.modules.usuarios.domain.entities import User, Role, Permission
 from src.modules.usuarios.domain.repositories import UserRepository
 from src.modules.usuarios.infrastructure.models import UserModel, RoleModel, PermissionModel
 
 
+# Hidratadores de confianza (sin validación ni __post_init__) para datos leídos de la base de datos
+_hydrate_user = hydrator(User)
+_hydrate_role = hydrator(Role)
+_hydrate_permission = hydrator(Permission)
+
+
 class SQLAlchemyUserRepository(UserRepository):
     """
     Adaptador de repositorio para Usuarios usando SQLAlchemy.
@@ -21,7 +28,7 @@ class SQLAlchemyUserRepository(UserRepository):
         self.session = session
 
     def _to_domain(self, model: UserModel) -> User:
-        """Mapea de modelo ORM a entidad de dominio."""
+        """Mapea de modelo ORM a entidad de dominio (hidratación sin __init__)."""
         roles = []
         
         # Acceder a relaciones solo si están cargadas para evitar MissingGreenlet
@@ -30,7 +37,7 @@ class SQLAlchemyUserRepository(UserRepository):
                 permissions = []
                 if "permissions" in role_model.__dict__:
                     permissions = [
-                        Permission(
+                        _hydrate_permission(
                             permission_id=perm.permission_id,
                             name=perm.name,
                             description=perm.description
@@ -39,7 +46,7 @@ class SQLAlchemyUserRepository(UserRepository):
                     ]
                 
                 roles.append(
-                    Role(
+                    _hydrate_role(
                         role_id=role_model.role_id,
                         name=role_model.name,
                         description=role_model.description,
@@ -47,7 +54,7 @@ class SQLAlchemyUserRepository(UserRepository):
                     )
                 )
             
-        return User(
+        return _hydrate_user(
             user_id=model.user_id,
             username=model.username,
             email=model.email,
@@ -1,13 +1,18 @@
 import pytest
 import asyncio
-from typing import AsyncGenerator, Generator
+import uuid
+from typing import AsyncGenerator, Callable, Generator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from httpx import AsyncClient
 from sqlalchemy.pool import StaticPool
 
 from src.main import app
-from src.core.database import Base, get_db_session
+from src.core.database import Base, get_db_session, get_read_session
 from src.core.config import settings
+from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.domain.value_objects import SKU, Price, Stock
+from src.modules.pedidos.domain.entities import Order, OrderItem
+from src.modules.pedidos.domain.value_objects import Address, CustomerInfo, Quantity
 
 # Usar SQLite en memoria para tests rápidos y aislados
 # NOTA: En producción real con postgres-specifics, se usaría una DB de test en Postgres
@@ -57,8 +62,50 @@ async def client(session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield session
 
     app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_read_session] = override_get_db_session
     
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
     
     del app.dependency_overrides[get_db_session]
+    del app.dependency_overrides[get_read_session]
+
+
+# ==================== Fábricas de entidades de dominio ====================
+
+@pytest.fixture
+def make_product() -> Callable[..., Product]:
+    """Fábrica de productos válidos; cada test solo indica lo que le importa."""
+
+    def make(
+        sku: str = "TEST-0001",
+        name: str = "Producto",
+        description: str = "",
+        price: float = 10.0,
+        stock: int = 5,
+        currency: str = "USD"
+    ) -> Product:
+        return Product(
+            sku=SKU(sku), name=name, description=description, price=Price(price, currency), stock=Stock(stock)
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_order() -> Callable[..., Order]:
+    """Fábrica de órdenes válidas con un item por cantidad indicada (por defecto, uno de 1 unidad)."""
+
+    def make(*quantities: int, customer_id: str = "C-TEST", unit_price: float = 10.0) -> Order:
+        return Order(
+            customer_info=CustomerInfo(customer_id=customer_id, name="Cliente", email="c@c.com", phone="3001234567"),
+            items=[
+                OrderItem(product_id=uuid.uuid4(), product_name=f"Item {i}", quantity=Quantity(q), unit_price=unit_price)
+                for i, q in enumerate(quantities or (1,))
+            ],
+            shipping_address=Address(
+                street="Calle 1 # 2-3", city="Cali", state="Valle", postal_code="760001", country="Colombia"
+            )
+        )
+
+    return make
@@ -0,0 +1,125 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.database import Base, create_session_factory
+from src.modules.catalogo.infrastructure.autocomplete_index import AutocompleteIndex, load_autocomplete_index
+from src.modules.catalogo.infrastructure.indexed_repository import IndexedProductRepository
+from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
+
+
+def _skus(suggestions):
+    return [s.sku for s in suggestions]
+
+
+class TestAutocompleteIndex:
+    """Tests del índice de prefijos."""
+
+    def test_matches_sku_and_any_word_of_the_name(self, make_product):
+        """El prefijo se busca en el SKU y al inicio de cada palabra del nombre, sin tildes."""
+        index = AutocompleteIndex()
+        index.add(make_product("LAMP-001", "Lámpara de pie"))
+        index.add(make_product("MESA-002", "Mesa auxiliar"))
+
+        assert _skus(index.suggest("lamp")) == ["LAMP-001"]
+        assert _skus(index.suggest("PIE")) == ["LAMP-001"]
+        assert _skus(index.suggest("mesa-0")) == ["MESA-002"]
+        assert index.suggest("xyz") == []
+
+    def test_orders_by_popularity(self):
+        """Los productos más vendidos aparecen primero; a igualdad, por nombre."""
+        index = AutocompleteIndex()
+        index.rebuild([
+            (uuid.uuid4(), "CAFE-001", "Café molido", 3),
+            (uuid.uuid4(), "CAFE-002", "Café en grano", 40),
+            (uuid.uuid4(), "CAFE-003", "Cafetera", 3),
+        ])
+
+        assert _skus(index.suggest("caf", limit=2)) == ["CAFE-002", "CAFE-001"]
+
+    def test_incremental_changes(self, make_product):
+        """Renombrar reindexa las claves; desactivar retira el producto; las ventas suben el ranking."""
+        index = AutocompleteIndex()
+        first, second = make_product("SILLA-01", "Silla"), make_product("SILLA-02", "Silla plegable")
+        index.add_many([first, second])
+
+        index.add_popularity({second.product_id: 5})
+        assert _skus(index.suggest("silla")) == ["SILLA-02", "SILLA-01"]
+
+        first.update_details(name="Taburete")
+        index.add(first)
+        assert _skus(index.suggest("tab")) == ["SILLA-01"]
+        assert _skus(index.suggest("silla p")) == ["SILLA-02"]
+
+        second.deactivate()
+        index.add(second)
+        assert index.suggest("plegable") == []
+
+
+@pytest.mark.asyncio
+class TestAutocompleteRepository:
+    """Tests del autocompletado a través del repositorio."""
+
+    @pytest.fixture
+    async def session_factory(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'autocomplete.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield create_session_factory(engine)
+        await engine.dispose()
+
+    async def test_reservations_update_popularity(self, session_factory, make_product):
+        """Las reservas confirmadas suman unidades vendidas en la base de datos y en el índice."""
+        popular, other = make_product("TAZA-001", "Taza"), make_product("TAZA-002", "Taza grande")
+        async with session_factory() as session:
+            repository = SQLAlchemyProductRepository(session)
+            await repository.save(popular)
+            await repository.save(other)
+            await session.commit()
+
+        index = AutocompleteIndex()
+        await load_autocomplete_index(session_factory, index)
+        assert _skus(index.suggest("taza")) == ["TAZA-001", "TAZA-002"]
+
+        async with session_factory() as session:
+            repository = IndexedProductRepository(SQLAlchemyProductRepository(session), None, index)
+            await repository.reserve_stock({other.product_id: 3})
+            await session.commit()
+
+            assert _skus(await repository.suggest("taza")) == ["TAZA-002", "TAZA-001"]
+            assert (await SQLAlchemyProductRepository(session).suggest("taza"))[0].popularity == 3
+
+    async def test_falls_back_to_database_until_loaded(self, session_factory, make_product):
+        """Sin índice cargado, las sugerencias salen de la base de datos."""
+        async with session_factory() as session:
+            await SQLAlchemyProductRepository(session).save(make_product("VELA-001", "Vela aromática"))
+            await session.commit()
+
+            repository = IndexedProductRepository(SQLAlchemyProductRepository(session), None, AutocompleteIndex())
+            assert _skus(await repository.suggest("vela")) == ["VELA-001"]
+
+
+@pytest.mark.asyncio
+class TestAutocompleteAPI:
+    """Tests del endpoint de autocompletado."""
+
+    async def test_autocomplete_endpoint(self, client: AsyncClient):
+        """Sugiere por prefijo y trata los comodines de LIKE como texto."""
+        await client.post("/api/v1/catalogo/products", json={
+            "sku": "AUTO-001", "name": "Autocompletar demo", "price": 1.0, "initial_stock": 1
+        })
+
+        response = await client.get("/api/v1/catalogo/products/autocomplete", params={"prefix": "autocomp"})
+        wildcard = await client.get("/api/v1/catalogo/products/autocomplete", params={"prefix": "%"})
+
+        assert response.status_code == 200
+        assert [s["sku"] for s in response.json()] == ["AUTO-001"]
+        assert wildcard.json() == []
+
+    async def test_prefix_is_required(self, client: AsyncClient):
+        """Sin prefijo la petición es inválida."""
+        response = await client.get("/api/v1/catalogo/products/autocomplete")
+
+        assert response.status_code == 422
@@ -0,0 +1,115 @@
+import copy
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.change_tracking import changed_fields, mark_clean
+from src.modules.catalogo.domain.value_objects import Price
+from src.modules.catalogo.infrastructure.mappers import ProductMapper
+from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
+from src.modules.pedidos.domain.value_objects import OrderStatus
+from src.modules.pedidos.infrastructure.repositories import SQLAlchemyOrderRepository
+
+
+@contextmanager
+def capture_updates(session: AsyncSession):
+    """Registra las sentencias UPDATE que llegan al driver mientras dura el bloque."""
+    statements = []
+    engine = session.bind.sync_engine
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+
+def _set_columns(statement: str) -> str:
+    return statement.upper().split(" SET ", 1)[1].split(" WHERE ", 1)[0]
+
+
+class TestChangeTracking:
+    """Tests del registro de campos modificados."""
+
+    def test_new_entities_are_not_tracked(self, make_product):
+        """Una entidad recién construida no sabe qué cambió: se escriben todas sus columnas."""
+        product = make_product("DIRTY-001")
+        product.deactivate()
+
+        assert changed_fields(product) is None
+        assert ProductMapper.to_changed_values(product) == ProductMapper.to_values(product)
+
+    def test_hydrated_entities_record_assignments(self, make_product):
+        """Tras hidratarse, solo se registran los campos asignados."""
+        product = ProductMapper.to_domain(ProductMapper.to_model(make_product("DIRTY-002")))
+        assert changed_fields(product) == frozenset()
+
+        product.update_price(Price(12.0))
+
+        assert changed_fields(product) == {"price", "updated_at"}
+        assert set(ProductMapper.to_changed_values(product)) == {"price_amount", "price_currency", "updated_at"}
+
+    def test_copies_do_not_share_changes(self, make_product):
+        """Las copias (caché, índice) conservan el estado de su original y registran por separado."""
+        product = ProductMapper.to_domain(ProductMapper.to_model(make_product("DIRTY-003")))
+        clone = copy.copy(product)
+
+        clone.deactivate()
+
+        assert clone == copy.copy(clone)
+        assert changed_fields(product) == frozenset()
+        assert changed_fields(copy.copy(clone)) == {"is_active", "updated_at"}
+        mark_clean(clone)
+        assert changed_fields(clone) == frozenset()
+
+
+@pytest.mark.asyncio
+class TestPartialUpdates:
+    """Tests de los UPDATE que solo escriben las columnas modificadas."""
+
+    async def test_product_update_writes_changed_columns(self, session: AsyncSession, make_product):
+        """Desactivar un producto no reescribe nombre, descripción, precio ni stock."""
+        repository = SQLAlchemyProductRepository(session)
+        product = await repository.save(make_product("DIRTY-010"))
+
+        product.deactivate()
+        with capture_updates(session) as statements:
+            updated = await repository.update(product)
+
+        columns = _set_columns(statements[0])
+        assert "IS_ACTIVE" in columns and "VERSION" in columns
+        assert not any(name in columns for name in ("NAME", "DESCRIPTION", "PRICE_AMOUNT", "STOCK_QUANTITY"))
+        assert (updated.is_active, updated.name, updated.version) == (False, "Producto", 2)
+
+    async def test_unchanged_product_is_not_written(self, session: AsyncSession, make_product):
+        """Sin cambios no se emite ningún UPDATE ni cambia la versión."""
+        repository = SQLAlchemyProductRepository(session)
+        product = await repository.save(make_product("DIRTY-011"))
+
+        with capture_updates(session) as statements:
+            updated = await repository.update(product)
+
+        assert statements == []
+        assert updated.version == 1
+
+    async def test_order_status_change_skips_customer_and_address(self, session: AsyncSession, make_order):
+        """Un cambio de estado solo escribe el estado (y la versión)."""
+        repository = SQLAlchemyOrderRepository(session)
+        order = await repository.get_by_id((await repository.save(make_order())).order_id)
+
+        order.status = OrderStatus.PROCESSING
+        with capture_updates(session) as statements:
+            updated = await repository.update(order)
+
+        columns = _set_columns(statements[0])
+        assert "STATUS" in columns
+        assert "CUSTOMER" not in columns and "SHIPPING" not in columns
+        assert (updated.version, changed_fields(updated)) == (2, frozenset())
+        reloaded = await repository.get_by_id(order.order_id)
+        assert (reloaded.status, reloaded.customer_info.name) == (OrderStatus.PROCESSING, "Cliente")
@@ -0,0 +1,99 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.exceptions import ConcurrencyError
+from src.core.retry import RetryPolicy, retry_on_conflict
+from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
+from src.modules.pedidos.domain.value_objects import OrderStatus
+from src.modules.pedidos.infrastructure.repositories import SQLAlchemyOrderRepository
+
+
+FAST_POLICY = RetryPolicy(max_attempts=3, base_delay=0.0, max_delay=0.0)
+
+
+@pytest.mark.asyncio
+class TestOptimisticConcurrency:
+    """Tests del control de concurrencia optimista por versión."""
+    
+    async def test_product_update_increments_version(self, session: AsyncSession, make_product):
+        """Prueba que cada actualización incrementa la versión del producto."""
+        repository = SQLAlchemyProductRepository(session)
+        product = await repository.save(make_product("CONC-001"))
+        
+        product.name = "Producto renombrado"
+        updated = await repository.update(product)
+        
+        assert updated.version == product.version + 1
+    
+    async def test_product_update_with_stale_version(self, session: AsyncSession, make_product):
+        """Debe lanzar ConcurrencyError si otra petición actualizó antes."""
+        repository = SQLAlchemyProductRepository(session)
+        created = await repository.save(make_product("CONC-002"))
+        first_reader = await repository.get_by_id(created.product_id)
+        second_reader = await repository.get_by_id(created.product_id)
+        
+        first_reader.name = "Primera edición"
+        await repository.update(first_reader)
+        
+        second_reader.name = "Segunda edición"
+        with pytest.raises(ConcurrencyError) as exc_info:
+            await repository.update(second_reader)
+        
+        assert exc_info.value.expected_version == 1
+        assert exc_info.value.actual_version == 2
+    
+    async def test_order_update_with_stale_version(self, session: AsyncSession, make_order):
+        """Debe lanzar ConcurrencyError al actualizar una orden con versión vieja."""
+        repository = SQLAlchemyOrderRepository(session)
+        saved = await repository.save(make_order())
+        first_reader = await repository.get_by_id(saved.order_id)
+        second_reader = await repository.get_by_id(saved.order_id)
+        
+        first_reader.confirm()
+        await repository.update(first_reader)
+        
+        second_reader.status = OrderStatus.CANCELLED
+        with pytest.raises(ConcurrencyError):
+            await repository.update(second_reader)
+
+
+@pytest.mark.asyncio
+class TestRetryOnConflict:
+    """Tests de la política de reintentos."""
+    
+    async def test_retries_until_success(self):
+        """Debe re-ejecutar la operación hasta que no haya conflicto."""
+        calls = []
+        
+        @retry_on_conflict(FAST_POLICY)
+        async def operation():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConcurrencyError("Product", "1", 1, 2)
+            return "ok"
+        
+        assert await operation() == "ok"
+        assert len(calls) == 3
+    
+    async def test_gives_up_after_max_attempts(self):
+        """Debe propagar el error al agotar los intentos."""
+        calls = []
+        
+        @retry_on_conflict(FAST_POLICY)
+        async def operation():
+            calls.append(1)
+            raise ConcurrencyError("Product", "1", 1, 2)
+        
+        with pytest.raises(ConcurrencyError):
+            await operation()
+        assert len(calls) == FAST_POLICY.max_attempts
+
+
+class TestRetryPolicy:
+    """Tests del cálculo de esperas de la política de reintentos."""
+    
+    def test_delay_is_bounded_by_max_delay(self):
+        """Prueba que el backoff con jitter nunca supera el tope configurado."""
+        policy = RetryPolicy(max_attempts=10, base_delay=0.05, max_delay=0.1)
+        
+        assert all(0 <= policy.compute_delay(attempt) <= 0.1 for attempt in range(1, 10))
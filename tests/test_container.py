@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from src.core.container import DIContainer, Lifetime, container
+
+
+class Service:
+    """Servicio de prueba."""
+
+    def __init__(self, dependency=None):
+        self.dependency = dependency
+
+
+class TestLifetimes:
+    """Tests de los ciclos de vida del contenedor DI."""
+
+    def test_transient_creates_new_instances(self):
+        """TRANSIENT crea una instancia en cada resolve."""
+        di = DIContainer()
+        di.register("service", Service)
+
+        assert di.resolve("service") is not di.resolve("service")
+
+    def test_singleton_is_shared(self):
+        """SINGLETON se construye una única vez."""
+        di = DIContainer()
+        di.register("service", Service, Lifetime.SINGLETON)
+
+        assert di.resolve("service") is di.resolve("service")
+
+    def test_scoped_is_shared_within_scope_only(self):
+        """SCOPED se comparte dentro del scope y se recrea en el siguiente."""
+        di = DIContainer()
+        di.register("service", Service, Lifetime.SCOPED)
+
+        with di.scope():
+            first = di.resolve("service")
+            assert di.resolve("service") is first
+        with di.scope():
+            assert di.resolve("service") is not first
+
+    def test_scoped_requires_scope(self):
+        """Resolver un SCOPED fuera de un request es un error."""
+        di = DIContainer()
+        di.register("service", Service, Lifetime.SCOPED)
+
+        with pytest.raises(RuntimeError):
+            di.resolve("service")
+
+    def test_build_resolves_singletons(self):
+        """build construye el grafo de singletons por adelantado."""
+        di = DIContainer()
+        built = []
+        di.register("service", lambda: built.append(1) or Service(), Lifetime.SINGLETON)
+
+        di.build()
+        di.resolve("service")
+
+        assert built == [1]
+
+    def test_unknown_service(self):
+        """Un servicio no registrado no se puede resolver."""
+        with pytest.raises(ValueError):
+            DIContainer().resolve("missing")
+
+
+class TestScopedProxy:
+    """Tests de singletons que dependen de servicios por request."""
+
+    def test_singleton_uses_current_scope_instance(self):
+        """El proxy delega en la instancia del scope activo."""
+        di = DIContainer()
+        di.register("service", lambda: Service(di.proxy("session")), Lifetime.SINGLETON)
+        service = di.resolve("service")
+
+        with di.scope(session=Service("request-1")):
+            assert service.dependency.dependency == "request-1"
+        with di.scope(session=Service("request-2")):
+            assert service.dependency.dependency == "request-2"
+
+    def test_application_graph_is_built_once(self):
+        """Los casos de uso de la aplicación se construyen al arrancar."""
+        assert container.resolve("catalogo_facade") is container.resolve("catalogo_facade")
+        assert container.resolve("place_order_use_case") is container.resolve("place_order_use_case")
+
+
+@pytest.mark.asyncio
+class TestConcurrentScopes:
+    """Tests del aislamiento de scopes entre tareas concurrentes."""
+
+    async def test_tasks_do_not_share_scope(self):
+        """Cada tarea ve únicamente las instancias de su propio scope."""
+        di = DIContainer()
+        di.register("service", lambda: Service(di.proxy("session")), Lifetime.SINGLETON)
+        service = di.resolve("service")
+
+        async def request(number: int):
+            with di.scope(session=Service(number)):
+                await asyncio.sleep(0)
+                return service.dependency.dependency
+
+        results = await asyncio.gather(*(request(i) for i in range(100)))
+
+        assert results == list(range(100))
@@ -0,0 +1,130 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.etag import etag_matches, make_etag
+from src.modules.catalogo.infrastructure.queries import SQLAlchemyProductQueries
+
+
+PRODUCTS = "/api/v1/catalogo/products"
+ORDERS = "/api/v1/pedidos/orders"
+
+
+async def _create_product(client: AsyncClient, sku: str) -> dict:
+    response = await client.post(PRODUCTS, json={"sku": sku, "name": "Producto ETag", "price": 5.0, "initial_stock": 10})
+    return response.json()
+
+
+class TestETagHelpers:
+    """Tests de la generación y comparación de ETags."""
+
+    def test_make_etag_is_strong_and_versioned(self):
+        """El ETag es fuerte (sin W/) y cambia con la versión."""
+        entity_id = uuid.uuid4()
+
+        assert make_etag(entity_id, 1) == f'"{entity_id}-1"'
+        assert make_etag(entity_id, 1) != make_etag(entity_id, 2)
+
+    def test_matching_rules(self):
+        """Listas, comodín y ETags débiles según la comparación débil o fuerte."""
+        etag = make_etag(uuid.uuid4(), 3)
+
+        assert etag_matches(f'"otro", {etag}', etag)
+        assert etag_matches("*", etag, weak=False)
+        assert etag_matches(f"W/{etag}", etag)
+        assert not etag_matches(f"W/{etag}", etag, weak=False)
+        assert not etag_matches('"otro"', etag)
+
+
+@pytest.mark.asyncio
+class TestProductConditionalRequests:
+    """Tests de GET condicional y PUT con If-Match en productos."""
+
+    async def test_not_modified_reads_only_the_version(self, client: AsyncClient, monkeypatch):
+        """Con el ETag vigente responde 304 sin cuerpo y sin leer la fila completa."""
+        product = await _create_product(client, "ETAG-0001")
+        first = await client.get(f"{PRODUCTS}/{product['product_id']}")
+        etag = first.headers["ETag"]
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("No debe leer la fila completa")
+        monkeypatch.setattr(SQLAlchemyProductQueries, "get_by_id", fail)
+        monkeypatch.setattr(SQLAlchemyProductQueries, "get_by_sku", fail)
+
+        by_id = await client.get(f"{PRODUCTS}/{product['product_id']}", headers={"If-None-Match": etag})
+        by_sku = await client.get(f"{PRODUCTS}/sku/ETAG-0001", headers={"If-None-Match": etag})
+
+        assert first.json()["version"] == 1
+        assert by_id.status_code == by_sku.status_code == 304
+        assert by_id.content == b""
+        assert by_id.headers["ETag"] == by_sku.headers["ETag"] == etag
+
+    async def test_update_changes_etag(self, client: AsyncClient):
+        """Tras una escritura el ETag anterior deja de valer y el GET vuelve a retornar 200."""
+        product = await _create_product(client, "ETAG-0002")
+        etag = (await client.get(f"{PRODUCTS}/{product['product_id']}")).headers["ETag"]
+
+        updated = await client.put(f"{PRODUCTS}/{product['product_id']}", json={
+            "product_id": product["product_id"], "name": "Renombrado"
+        })
+        response = await client.get(f"{PRODUCTS}/{product['product_id']}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == updated.headers["ETag"] != etag
+        assert response.json()["name"] == "Renombrado"
+
+    async def test_if_match(self, client: AsyncClient):
+        """PUT con un ETag desactualizado responde 412 y no modifica el producto."""
+        product = await _create_product(client, "ETAG-0003")
+        url = f"{PRODUCTS}/{product['product_id']}"
+        etag = (await client.get(url)).headers["ETag"]
+
+        ok = await client.put(url, json={"product_id": product["product_id"], "price": 6.0}, headers={"If-Match": etag})
+        stale = await client.put(url, json={"product_id": product["product_id"], "price": 7.0}, headers={"If-Match": etag})
+
+        assert ok.status_code == 200
+        assert ok.json()["version"] == 2
+        assert stale.status_code == 412
+        assert stale.json()["error"]["type"] == "PreconditionFailedError"
+        assert (await client.get(url)).json()["price"] == 6.0
+
+
+@pytest.mark.asyncio
+class TestOrderConditionalRequests:
+    """Tests de GET condicional y PATCH con If-Match en órdenes."""
+
+    async def _place_order(self, client: AsyncClient) -> str:
+        product = await _create_product(client, f"ETAG-ORD-{uuid.uuid4().hex[:6]}")
+        response = await client.post(ORDERS, json={
+            "customer_info": {"customer_id": "ETAG-CUST", "name": "Cliente", "email": "c@c.com", "phone": "3001234567"},
+            "items": [{"product_id": product["product_id"], "quantity": 1}],
+            "shipping_address": {
+                "street": "Calle 1 # 2-3", "city": "Cali", "state": "Valle", "postal_code": "760001", "country": "Colombia"
+            }
+        })
+        return response.json()["order_id"]
+
+    async def test_get_order_not_modified(self, client: AsyncClient):
+        """Con el ETag vigente la orden responde 304."""
+        order_id = await self._place_order(client)
+        etag = (await client.get(f"{ORDERS}/{order_id}")).headers["ETag"]
+
+        response = await client.get(f"{ORDERS}/{order_id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+    async def test_patch_status_if_match(self, client: AsyncClient):
+        """PATCH con el ETag vigente aplica el cambio; repetido con el mismo ETag responde 412."""
+        order_id = await self._place_order(client)
+        etag = (await client.get(f"{ORDERS}/{order_id}")).headers["ETag"]
+        body = {"order_id": order_id, "new_status": "processing"}
+
+        ok = await client.patch(f"{ORDERS}/{order_id}/status", json=body, headers={"If-Match": etag})
+        stale = await client.patch(f"{ORDERS}/{order_id}/status", json=body, headers={"If-Match": etag})
+
+        assert ok.status_code == 200
+        assert ok.headers["ETag"] != etag
+        assert stale.status_code == 412
+        assert stale.json()["error"]["type"] == "PreconditionFailedError"
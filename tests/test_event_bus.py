@@ -0,0 +1,180 @@
+import asyncio
+import uuid
+
+import pytest
+
+from src.core.config import settings
+from src.core.events.event_bus import DomainEvent, EventBus
+from src.modules.pedidos.domain.events import OrderCreatedEvent
+
+
+@pytest.fixture
+def bus(monkeypatch, tmp_path):
+    """EventBus aislado: sin suscriptores globales y con contadores a cero."""
+    monkeypatch.setattr(EventBus, "_subscribers", {})
+    monkeypatch.setattr(EventBus, "_stats", dict.fromkeys(EventBus._stats, 0))
+    monkeypatch.setattr(settings, "event_bus_handler_timeout", 1.0)
+    monkeypatch.setattr(settings, "event_bus_spill_path", str(tmp_path / "spill.jsonl"))
+    return EventBus
+
+
+def _event() -> OrderCreatedEvent:
+    return OrderCreatedEvent(order_id=uuid.uuid4(), customer_id="CUST-1", total_amount=10.0, items_count=1)
+
+
+@pytest.mark.asyncio
+class TestEventBusInline:
+    """Tests del despacho inline."""
+
+    async def test_handler_errors_are_isolated(self, bus, monkeypatch):
+        """El fallo de un handler no impide que se ejecuten los demás."""
+        monkeypatch.setattr(settings, "event_bus_mode", EventBus.INLINE)
+        received = []
+
+        async def failing(event):
+            raise RuntimeError("boom")
+
+        async def recording(event):
+            received.append(event)
+
+        bus.subscribe(OrderCreatedEvent, failing)
+        bus.subscribe(OrderCreatedEvent, recording)
+
+        await bus.publish([_event()])
+
+        assert len(received) == 1
+        assert bus.stats()["handler_errors"] == 1
+
+    async def test_slow_handler_times_out(self, bus, monkeypatch):
+        """Un handler que excede el timeout se cancela y se contabiliza."""
+        monkeypatch.setattr(settings, "event_bus_mode", EventBus.INLINE)
+        monkeypatch.setattr(settings, "event_bus_handler_timeout", 0.01)
+
+        async def slow(event):
+            await asyncio.sleep(1)
+
+        bus.subscribe(OrderCreatedEvent, slow)
+
+        await bus.publish([_event()])
+
+        assert bus.stats()["handler_timeouts"] == 1
+
+
+@pytest.mark.asyncio
+class TestEventBusBackground:
+    """Tests del despacho en segundo plano con cola acotada."""
+
+    async def test_publish_does_not_wait_for_handlers(self, bus, monkeypatch):
+        """publish retorna antes de que terminen los suscriptores."""
+        monkeypatch.setattr(settings, "event_bus_mode", EventBus.BACKGROUND)
+        release = asyncio.Event()
+        received = []
+
+        async def blocked(event):
+            await release.wait()
+            received.append(event)
+
+        bus.subscribe(OrderCreatedEvent, blocked)
+        await bus.start(workers=2, queue_size=10)
+
+        await bus.publish([_event()])
+        assert received == []
+
+        release.set()
+        await bus.stop()
+        assert len(received) == 1
+
+    async def test_full_queue_drops_events(self, bus, monkeypatch):
+        """Con política drop, los eventos que no caben se descartan."""
+        monkeypatch.setattr(settings, "event_bus_mode", EventBus.BACKGROUND)
+        monkeypatch.setattr(settings, "event_bus_overflow", EventBus.DROP)
+        release = asyncio.Event()
+
+        async def blocked(event):
+            await release.wait()
+
+        bus.subscribe(OrderCreatedEvent, blocked)
+        await bus.start(workers=1, queue_size=1)
+
+        await bus.publish([_event()])
+        await asyncio.sleep(0)  # el worker toma el primer evento
+        await bus.publish([_event(), _event()])
+
+        assert bus.stats()["dropped"] == 1
+        release.set()
+        await bus.stop()
+
+    async def test_full_queue_spills_and_replays(self, bus, monkeypatch, tmp_path):
+        """Con política spill, el desborde se persiste y se reencola al arrancar."""
+        monkeypatch.setattr(settings, "event_bus_mode", EventBus.BACKGROUND)
+        monkeypatch.setattr(settings, "event_bus_overflow", EventBus.SPILL)
+        release = asyncio.Event()
+        received = []
+
+        async def blocked(event):
+            await release.wait()
+            received.append(event.event_id)
+
+        bus.subscribe(OrderCreatedEvent, blocked)
+        await bus.start(workers=1, queue_size=1)
+
+        spilled = _event()
+        await bus.publish([_event()])
+        await asyncio.sleep(0)
+        await bus.publish([_event(), spilled])
+
+        assert bus.stats()["spilled"] == 1
+        assert (tmp_path / "spill.jsonl").exists()
+
+        release.set()
+        await bus.stop()
+        await bus.start(workers=1, queue_size=10)
+        await bus.stop()
+
+        assert spilled.event_id in received
+        assert not (tmp_path / "spill.jsonl").exists()
+
+    async def test_interrupted_replay_is_resumed(self, bus, monkeypatch, tmp_path):
+        """El `.replay` se conserva si el reencolado se interrumpe y se retoma al arrancar."""
+        monkeypatch.setattr(settings, "event_bus_mode", EventBus.BACKGROUND)
+        received = []
+
+        async def recording(event):
+            received.append(event.event_id)
+
+        bus.subscribe(OrderCreatedEvent, recording)
+        spilled = [_event(), _event()]
+        for event in spilled:
+            bus._spill(event)
+
+        async def interrupted(event):
+            raise asyncio.CancelledError()
+
+        with monkeypatch.context() as patch, pytest.raises(asyncio.CancelledError):
+            patch.setattr(EventBus, "_enqueue", interrupted)
+            await bus._replay_spilled()
+
+        assert (tmp_path / "spill.jsonl.replay").exists()
+
+        await bus.start(workers=1, queue_size=10)
+        await bus.stop()
+
+        assert received == [event.event_id for event in spilled]
+        assert not (tmp_path / "spill.jsonl.replay").exists()
+
+
+class TestDomainEventSerialization:
+    """Tests de la serialización usada para desbordar eventos a disco."""
+
+    def test_round_trip(self):
+        """Un evento serializado se reconstruye con sus tipos originales."""
+        event = _event()
+
+        restored = DomainEvent.from_dict(event.to_dict())
+
+        assert restored == event
+
+    def test_unknown_type(self):
+        """Un tipo no registrado no se puede reconstruir."""
+        with pytest.raises(ValueError):
+            DomainEvent.from_dict({"type": "Desconocido", "data": {}})
@@ -0,0 +1,95 @@
+import uuid
+from datetime import datetime
+from typing import List
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, Response, status
+from fastapi.responses import PlainTextResponse
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+from pydantic import BaseModel
+
+from src.core.responses import FastResponseRoute
+
+
+class ItemDTO(BaseModel):
+    item_id: uuid.UUID
+    name: str
+    price: float
+    created_at: datetime
+    note: str = "ñandú"
+
+
+ITEMS = [
+    ItemDTO.model_construct(item_id=uuid.uuid4(), name=f"Item {i}", price=i + 0.5, created_at=datetime(2024, 1, 1, 12))
+    for i in range(3)
+]
+
+
+def set_header(response: Response) -> None:
+    response.headers["X-From-Dependency"] = "1"
+
+
+def build_app(route_class) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+
+    @router.get("/items", response_model=List[ItemDTO])
+    async def list_items(response: Response, _=Depends(set_header)) -> List[ItemDTO]:
+        response.headers["X-Next-Cursor"] = "abc"
+        return ITEMS
+
+    @router.post("/items", response_model=ItemDTO, status_code=status.HTTP_201_CREATED)
+    async def create_item() -> ItemDTO:
+        return ITEMS[0]
+
+    @router.get("/items/first", response_model=ItemDTO, response_model_exclude={"note"})
+    async def first_item() -> ItemDTO:
+        return ITEMS[0]
+
+    @router.get("/raw", response_model=ItemDTO)
+    async def raw() -> Response:
+        return PlainTextResponse("raw")
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest.mark.asyncio
+class TestFastResponseRoute:
+    """Tests de la serialización directa con Pydantic."""
+
+    @pytest.fixture
+    async def clients(self):
+        async with AsyncClient(app=build_app(APIRoute), base_url="http://test") as default, \
+                AsyncClient(app=build_app(FastResponseRoute), base_url="http://test") as fast:
+            yield default, fast
+
+    @pytest.mark.parametrize("method,path", [
+        ("GET", "/items"), ("POST", "/items"), ("GET", "/items/first"), ("GET", "/raw")
+    ])
+    async def test_same_response_as_default_route(self, clients, method, path):
+        """Cuerpo, código de estado y cabeceras coinciden con los de APIRoute."""
+        default, fast = clients
+
+        expected = await default.request(method, path)
+        response = await fast.request(method, path)
+
+        assert response.status_code == expected.status_code
+        assert response.headers["content-type"] == expected.headers["content-type"]
+        assert response.content == expected.content if path == "/raw" else response.json() == expected.json()
+        for header in ("X-Next-Cursor", "X-From-Dependency"):
+            assert response.headers.get(header) == expected.headers.get(header)
+
+    async def test_module_routers_use_fast_route(self, client: AsyncClient):
+        """Los routers de Catálogo y Pedidos usan la ruta rápida y conservan el cursor."""
+        for i in range(2):
+            await client.post("/api/v1/catalogo/products", json={
+                "sku": f"FAST-{i:03d}", "name": f"Rápido {i}", "price": 1.0, "initial_stock": 1
+            })
+
+        response = await client.get("/api/v1/catalogo/products", params={"limit": 1})
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert "X-Next-Cursor" in response.headers
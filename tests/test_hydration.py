@@ -0,0 +1,82 @@
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List
+
+from src.core.hydration import hydrate, hydrator
+from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.domain.value_objects import SKU, Price, Stock
+from src.modules.catalogo.infrastructure.mappers import ProductMapper
+from src.modules.catalogo.infrastructure.models import ProductModel
+from src.modules.pedidos.infrastructure.models import OrderItemModel, OrderModel, OrderStatusEnum
+from src.modules.pedidos.infrastructure.repositories import SQLAlchemyOrderRepository
+
+
+@dataclass(slots=True)
+class SlottedEntity:
+    name: str
+    tags: List[str] = field(default_factory=list)
+    active: bool = True
+
+
+class TestHydrator:
+    """Tests de la hidratación de confianza."""
+
+    def test_skips_validation(self):
+        """Los VOs se reconstruyen sin repetir sus validaciones."""
+        sku = hydrate(SKU, value="X")  # SKU("X") lanzaría ValidationError
+
+        assert sku.value == "X"
+
+    def test_equals_validated_instance(self):
+        """Con datos válidos, el resultado es igual al del constructor."""
+        assert hydrate(Price, amount=10.5, currency="EUR") == Price(10.5, "EUR")
+        assert hydrate(Price, amount=10.5) == Price(10.5)
+
+    def test_defaults_and_factories(self):
+        """Aplica los valores por defecto y una factory nueva por instancia (también con slots)."""
+        build = hydrator(SlottedEntity)
+        first, second = build(name="a"), build(name="b")
+
+        first.tags.append("x")
+
+        assert second.tags == [] and second.active is True
+        assert first == SlottedEntity(name="a", tags=["x"])
+
+
+class TestTrustedMappers:
+    """Tests de los mappers de infraestructura con hidratación de confianza."""
+
+    def test_product_mapper(self):
+        """El producto hidratado es igual al construido con validación."""
+        now = datetime.utcnow()
+        model = ProductModel(
+            product_id=uuid.uuid4(), sku="HYD-0001", name="Producto", description="", price_amount=9.99,
+            price_currency="USD", stock_quantity=3, is_active=True, created_at=now, updated_at=now, version=2
+        )
+
+        product = ProductMapper.to_domain(model)
+
+        assert product == Product(
+            product_id=model.product_id, sku=SKU("HYD-0001"), name="Producto", description="",
+            price=Price(9.99), stock=Stock(3), created_at=now, updated_at=now, version=2
+        )
+
+    def test_loaded_order_has_no_creation_side_effects(self):
+        """Cargar una orden no registra un OrderCreatedEvent ni recalcula el total."""
+        now = datetime.utcnow()
+        model = OrderModel(
+            order_id=uuid.uuid4(), customer_id="CUST-1", customer_name="Cliente", customer_email="c@c.com",
+            customer_phone="3001234567", shipping_street="Calle 1 # 2-3", shipping_city="Cali",
+            shipping_state="Valle", shipping_postal_code="760001", shipping_country="Colombia",
+            status=OrderStatusEnum.confirmed, total_amount=42.0, created_at=now, updated_at=now,
+            confirmed_at=now, cancelled_at=None, version=3
+        )
+        model.items = [OrderItemModel(product_id=uuid.uuid4(), product_name="Item", quantity=2, unit_price=10.0)]
+
+        order = SQLAlchemyOrderRepository(session=None)._to_domain(model)
+
+        assert order.domain_events == []
+        assert order.total_amount == 42.0
+        assert order.items[0].calculate_subtotal() == 20.0
+        assert order.version == 3
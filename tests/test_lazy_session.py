@@ -0,0 +1,101 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.database import Base, LazySession, create_session_factory
+from src.modules.catalogo.domain.value_objects import SKU
+from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
+
+
+@pytest.fixture
+async def file_engine(tmp_path):
+    """Motor SQLite en archivo para observar los checkouts reales del pool."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'lazy.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+def track_connections(engine) -> dict:
+    """Cuenta checkouts y conexiones prestadas en este momento."""
+    state = {"checkouts": 0, "in_use": 0}
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        state["checkouts"] += 1
+        state["in_use"] += 1
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        state["in_use"] -= 1
+
+    return state
+
+
+@pytest.mark.asyncio
+class TestLazySession:
+    """Tests de la sesión perezosa por request."""
+
+    async def test_unused_session_never_checks_out(self, file_engine):
+        """Un request que no usa la sesión no toma conexión del pool."""
+        connections = track_connections(file_engine)
+        session = LazySession(create_session_factory(file_engine))
+
+        await session.finalize()
+
+        assert session.started is False
+        assert connections["checkouts"] == 0
+
+    async def test_commits_only_when_there_are_writes(self, file_engine, make_product):
+        """Las escrituras se confirman al finalizar."""
+        factory = create_session_factory(file_engine)
+        session = LazySession(factory)
+        await SQLAlchemyProductRepository(session).save(make_product("LAZY-001"))
+
+        await session.finalize()
+
+        async with factory() as check:
+            found = await SQLAlchemyProductRepository(check).get_by_sku(SKU("LAZY-001"))
+        assert found is not None
+
+    async def test_read_only_session_skips_commit(self, file_engine):
+        """Sin escrituras no se emite COMMIT."""
+        statements = []
+        event.listen(file_engine.sync_engine, "commit", lambda conn: statements.append("COMMIT"))
+        session = LazySession(create_session_factory(file_engine))
+
+        await SQLAlchemyProductRepository(session).get_by_sku(SKU("LAZY-404"))
+        await session.finalize()
+
+        assert statements == []
+
+    async def test_error_rolls_back_writes(self, file_engine, make_product):
+        """Con error las escrituras se descartan."""
+        factory = create_session_factory(file_engine)
+        session = LazySession(factory)
+        await SQLAlchemyProductRepository(session).save(make_product("LAZY-002"))
+
+        await session.finalize(error=True)
+
+        async with factory() as check:
+            found = await SQLAlchemyProductRepository(check).get_by_sku(SKU("LAZY-002"))
+        assert found is None
+
+    async def test_release_after_read_returns_connection(self, file_engine):
+        """En modo lectura la conexión vuelve al pool tras cada consulta."""
+        connections = track_connections(file_engine)
+        session = LazySession(create_session_factory(file_engine), release_after_read=True)
+
+        await SQLAlchemyProductRepository(session).get_by_sku(SKU("LAZY-404"))
+
+        assert connections["checkouts"] == 1
+        assert connections["in_use"] == 0
+        await session.finalize()
+
+    async def test_info_is_applied_on_creation(self, file_engine):
+        """La información del request se copia a la sesión real."""
+        session = LazySession(create_session_factory(file_engine), info={"client_key": "client-a"})
+
+        assert session.info["client_key"] == "client-a"
+        await session.finalize()
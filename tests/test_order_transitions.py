@@ -0,0 +1,157 @@
+import uuid
+from contextlib import contextmanager
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.etag import if_match_versions, make_etag
+from src.core.exceptions import BusinessRuleViolation
+from src.modules.pedidos.domain.value_objects import OrderStatus, ORDER_STATUS_TRANSITIONS
+from src.modules.pedidos.infrastructure.repositories import SQLAlchemyOrderRepository
+
+
+PRODUCTS = "/api/v1/catalogo/products"
+ORDERS = "/api/v1/pedidos/orders"
+
+
+@contextmanager
+def count_statements(session: AsyncSession):
+    """Registra las sentencias SQL que llegan al driver mientras dura el bloque."""
+    statements = []
+    engine = session.bind.sync_engine
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+
+async def _place_order(client: AsyncClient) -> str:
+    """Crea una orden (queda confirmada) y retorna su ID."""
+    product = (await client.post(PRODUCTS, json={
+        "sku": f"CAS-{uuid.uuid4().hex[:6]}", "name": "Producto", "price": 5.0, "initial_stock": 10
+    })).json()
+    response = await client.post(ORDERS, json={
+        "customer_info": {"customer_id": "CAS-CUST", "name": "Cliente", "email": "c@c.com", "phone": "3001234567"},
+        "items": [{"product_id": product["product_id"], "quantity": 1}],
+        "shipping_address": {
+            "street": "Calle 1 # 2-3", "city": "Cali", "state": "Valle", "postal_code": "760001", "country": "Colombia"
+        }
+    })
+    return response.json()["order_id"]
+
+
+async def _patch_status(client: AsyncClient, order_id: str, new_status: str, **kwargs):
+    return await client.patch(
+        f"{ORDERS}/{order_id}/status", json={"order_id": order_id, "new_status": new_status}, **kwargs
+    )
+
+
+class TestStatusTransitionTable:
+    """Tests de la tabla de transiciones y su uso desde la entidad."""
+
+    def test_entity_follows_the_table(self, make_order):
+        """Los métodos de Order aplican las mismas reglas que la tabla."""
+        order = make_order()
+        assert ORDER_STATUS_TRANSITIONS[OrderStatus.CONFIRMED].timestamp_field == "confirmed_at"
+
+        order.confirm()
+        order.mark_as_processing()
+        with pytest.raises(BusinessRuleViolation, match="Solo se pueden entregar órdenes enviadas"):
+            order.mark_as_delivered()
+
+        assert order.status == OrderStatus.PROCESSING
+        assert order.confirmed_at is not None
+        assert OrderStatus.CANCELLED not in ORDER_STATUS_TRANSITIONS
+
+    def test_if_match_versions(self):
+        """Las versiones salen de los ETags fuertes de la propia entidad; "*" admite cualquiera."""
+        order_id = uuid.uuid4()
+        header = f'{make_etag(order_id, 3)}, W/{make_etag(order_id, 4)}, {make_etag(uuid.uuid4(), 5)}'
+
+        assert if_match_versions(header, order_id) == [3]
+        assert if_match_versions("*", order_id) is None
+        assert if_match_versions('"otro"', order_id) == []
+
+
+@pytest.mark.asyncio
+class TestCompareAndSetRepository:
+    """Tests de la transición de estado en una sola sentencia."""
+
+    async def test_transition_is_one_update(self, session: AsyncSession, make_order):
+        """Sin SELECT previo: un UPDATE condicionado al estado de origen con RETURNING."""
+        repository = SQLAlchemyOrderRepository(session)
+        order = await repository.save(make_order())
+
+        with count_statements(session) as statements:
+            version = await repository.transition_status(
+                order.order_id, ORDER_STATUS_TRANSITIONS[OrderStatus.CONFIRMED]
+            )
+
+        assert statements == ["UPDATE"]
+        assert version == 2
+        reloaded = await repository.get_by_id(order.order_id)
+        assert (reloaded.status, reloaded.version) == (OrderStatus.CONFIRMED, 2)
+        assert reloaded.confirmed_at is not None
+
+    async def test_transition_from_other_status_is_not_applied(self, session: AsyncSession, make_order):
+        """Si la orden no está en el estado de origen (o en la versión esperada) no cambia nada."""
+        repository = SQLAlchemyOrderRepository(session)
+        order = await repository.save(make_order())
+        shipped = ORDER_STATUS_TRANSITIONS[OrderStatus.SHIPPED]
+        confirmed = ORDER_STATUS_TRANSITIONS[OrderStatus.CONFIRMED]
+
+        assert await repository.transition_status(order.order_id, shipped) is None
+        assert await repository.transition_status(order.order_id, confirmed, expected_versions=[7]) is None
+        assert await repository.get_status(order.order_id) == (OrderStatus.PENDING, 1)
+        assert await repository.get_status(uuid.uuid4()) is None
+
+
+@pytest.mark.asyncio
+class TestUpdateStatusEndpoint:
+    """Tests del PATCH de estado sobre la tabla de transiciones."""
+
+    async def test_lifecycle(self, client: AsyncClient):
+        """La orden recorre el ciclo de vida; cada paso incrementa la versión."""
+        order_id = await _place_order(client)
+
+        for expected_old, new_status in [("confirmed", "processing"), ("processing", "shipped"), ("shipped", "delivered")]:
+            response = await _patch_status(client, order_id, new_status)
+            assert response.status_code == 200
+            assert (response.json()["old_status"], response.json()["new_status"]) == (expected_old, new_status)
+
+        order = (await client.get(f"{ORDERS}/{order_id}")).json()
+        assert order["status"] == "delivered"
+        assert response.headers["ETag"] == make_etag(order_id, response.json()["version"])
+
+    async def test_conflicting_transition_returns_409(self, client: AsyncClient):
+        """La segunda de dos transiciones iguales ya no encuentra el estado de origen."""
+        order_id = await _place_order(client)
+
+        first = await _patch_status(client, order_id, "processing")
+        second = await _patch_status(client, order_id, "processing")
+        skipped = await _patch_status(client, order_id, "delivered")
+
+        assert first.status_code == 200
+        assert second.status_code == 409
+        error = second.json()["error"]
+        assert (error["type"], error["context"]["current_state"]) == ("InvalidStateTransitionError", "processing")
+        assert error["context"]["allowed_from"] == ["confirmed"]
+        assert skipped.status_code == 409
+
+    async def test_statuses_without_transition(self, client: AsyncClient):
+        """La cancelación tiene su propio endpoint; los estados desconocidos se rechazan."""
+        order_id = await _place_order(client)
+
+        cancelled = await _patch_status(client, order_id, "cancelled")
+        unknown = await _patch_status(client, order_id, "lost")
+        missing = await _patch_status(client, str(uuid.uuid4()), "processing")
+
+        assert (cancelled.status_code, unknown.status_code, missing.status_code) == (400, 400, 400)
+        assert (await client.get(f"{ORDERS}/{order_id}")).json()["status"] == "confirmed"
@@ -0,0 +1,153 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.core.database import Base, create_session_factory
+from src.core.events.event_bus import EventBus
+from src.core.events.outbox import OutboxEventModel, OutboxRelay, SQLAlchemyEventOutbox
+from src.modules.pedidos.domain.events import OrderCreatedEvent
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    """Base SQLite en archivo: el relay usa sus propias sesiones y transacciones."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield create_session_factory(engine)
+    await engine.dispose()
+
+
+@pytest.fixture
+def received(monkeypatch):
+    """Suscriptor de prueba que registra los eventos entregados."""
+    monkeypatch.setattr(EventBus, "_subscribers", {})
+    events = []
+
+    async def handler(event):
+        events.append(event)
+
+    EventBus.subscribe(OrderCreatedEvent, handler)
+    return events
+
+
+def _event() -> OrderCreatedEvent:
+    return OrderCreatedEvent(order_id=uuid.uuid4(), customer_id="CUST-1", total_amount=25.0, items_count=2)
+
+
+async def _store(session_factory, events, commit=True):
+    async with session_factory() as session:
+        await SQLAlchemyEventOutbox(session).add(events)
+        if commit:
+            await session.commit()
+        else:
+            await session.rollback()
+
+
+@pytest.mark.asyncio
+class TestOutboxRelay:
+    """Tests del outbox transaccional y su relay."""
+
+    async def test_rolled_back_events_are_never_delivered(self, session_factory, received):
+        """Un evento de una transacción revertida no llega al outbox."""
+        await _store(session_factory, [_event()], commit=False)
+
+        delivered = await OutboxRelay(session_factory).poll_once()
+
+        assert delivered == 0
+        assert received == []
+
+    async def test_relay_delivers_and_marks_events(self, session_factory, received):
+        """El relay entrega el evento reconstruido y lo marca como entregado."""
+        event = _event()
+        await _store(session_factory, [event])
+        relay = OutboxRelay(session_factory)
+
+        assert await relay.poll_once() == 1
+        assert received == [event]
+        assert await relay.poll_once() == 0
+        assert relay.high_water_mark > 0
+
+    async def test_relay_claims_in_batches(self, session_factory, received):
+        """Cada ciclo reclama como máximo batch_size eventos, en orden."""
+        events = [_event() for _ in range(3)]
+        await _store(session_factory, events)
+        relay = OutboxRelay(session_factory, batch_size=2)
+
+        assert await relay.poll_once() == 2
+        assert await relay.poll_once() == 1
+        assert [e.event_id for e in received] == [e.event_id for e in events]
+
+    async def test_failed_handler_leaves_event_pending(self, session_factory, received):
+        """Si un handler falla, el evento no se marca como entregado y se reintenta tras el backoff."""
+        failing = {"remaining": 1}
+
+        async def flaky(event):
+            if failing["remaining"]:
+                failing["remaining"] -= 1
+                raise RuntimeError("servicio caído")
+
+        EventBus.subscribe(OrderCreatedEvent, flaky)
+        event = _event()
+        await _store(session_factory, [event])
+        relay = OutboxRelay(session_factory)
+
+        assert await relay.poll_once() == 0
+        async with session_factory() as session:
+            row = await session.scalar(select(OutboxEventModel))
+        assert (row.delivered_at, row.attempts) == (None, 1)
+        assert row.next_attempt_at is not None
+        assert await relay.poll_once() == 0  # aún en backoff
+
+        async with session_factory() as session:
+            await session.execute(update(OutboxEventModel).values(next_attempt_at=None))
+            await session.commit()
+
+        assert await relay.poll_once() == 1
+        assert received == [event, event]
+        assert relay.retried == 1
+
+    async def test_snapshot_reports_lag(self, session_factory, received):
+        """Las métricas reflejan los pendientes y la marca de agua."""
+        await _store(session_factory, [_event(), _event()])
+        relay = OutboxRelay(session_factory, batch_size=1)
+        await relay.poll_once()
+
+        async with session_factory() as session:
+            snapshot = await relay.snapshot(session)
+
+        assert snapshot["pending"] == 1
+        assert snapshot["latest_id"] - snapshot["high_water_mark"] == 1
+
+
+@pytest.mark.asyncio
+class TestPlaceOrderOutbox:
+    """Tests de la escritura del outbox al crear una orden."""
+
+    async def test_place_order_writes_outbox(self, client: AsyncClient, session: AsyncSession):
+        """Crear una orden registra OrderCreatedEvent en la misma transacción."""
+        product = await client.post("/api/v1/catalogo/products", json={
+            "sku": "OUTBOX-001", "name": "Producto outbox", "price": 10.0, "initial_stock": 5
+        })
+        response = await client.post("/api/v1/pedidos/orders", json={
+            "customer_info": {
+                "customer_id": "OUTBOX-CUST", "name": "Test User", "email": "test@user.com", "phone": "12345678"
+            },
+            "items": [{"product_id": product.json()["product_id"], "quantity": 1}],
+            "shipping_address": {
+                "street": "123 Test St", "city": "Test City", "state": "TS",
+                "postal_code": "12345", "country": "TestCountry"
+            }
+        })
+        assert response.status_code == 201
+
+        count = await session.scalar(
+            select(func.count(OutboxEventModel.id)).where(
+                OutboxEventModel.event_type == "OrderCreatedEvent",
+                OutboxEventModel.payload["order_id"].as_string() == response.json()["order_id"]
+            )
+        )
+        assert count == 1
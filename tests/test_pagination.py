@@ -0,0 +1,84 @@
+import uuid
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.exceptions import ValidationError
+from src.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+
+
+class TestCursor:
+    """Tests de la codificación del cursor."""
+
+    def test_round_trip(self):
+        """El cursor conserva la posición (created_at, id)."""
+        created_at, entity_id = datetime(2024, 5, 1, 12, 30, 15, 123456), uuid.uuid4()
+
+        assert decode_cursor(encode_cursor(created_at, entity_id)) == (created_at, entity_id)
+
+    def test_invalid_cursor(self):
+        """Un cursor mal formado es un error de validación."""
+        with pytest.raises(ValidationError):
+            decode_cursor("no-es-un-cursor")
+
+
+@pytest.mark.asyncio
+class TestKeysetPaginationApi:
+    """Tests de la paginación por cursor de los listados."""
+
+    async def test_products_walk_all_pages(self, client: AsyncClient):
+        """Seguir X-Next-Cursor recorre todos los productos sin repetir ninguno."""
+        created = []
+        for i in range(5):
+            response = await client.post("/api/v1/catalogo/products", json={
+                "sku": f"PAGE-{i}", "name": f"Producto paginado {i}", "price": 1.0, "initial_stock": 1
+            })
+            created.append(response.json()["product_id"])
+
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get("/api/v1/catalogo/products", params=params)
+            assert response.status_code == 200
+            assert len(response.json()) <= 2
+            seen += [p["product_id"] for p in response.json()]
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if not cursor:
+                break
+
+        assert len(seen) == len(set(seen))
+        assert [pid for pid in seen if pid in created] == created
+
+    async def test_invalid_cursor_is_bad_request(self, client: AsyncClient):
+        """Un cursor mal formado responde 400."""
+        response = await client.get("/api/v1/catalogo/products", params={"cursor": "%%%"})
+
+        assert response.status_code == 400
+
+    async def test_orders_by_customer_next_cursor(self, client: AsyncClient):
+        """Las órdenes del cliente se paginan con next_cursor en el cuerpo."""
+        customer_id = "CUST-PAGE"
+        product = await client.post("/api/v1/catalogo/products", json={
+            "sku": "PAGE-ORDER", "name": "Producto pedidos", "price": 1.0, "initial_stock": 10
+        })
+        for _ in range(3):
+            await client.post("/api/v1/pedidos/orders", json={
+                "customer_info": {"customer_id": customer_id, "name": "Page User", "email": "p@p.com", "phone": "123123123"},
+                "items": [{"product_id": product.json()["product_id"], "quantity": 1}],
+                "shipping_address": {"street": "123 Test St", "city": "Test City", "state": "Test State", "postal_code": "12345", "country": "Test Country"}
+            })
+
+        first = (await client.get(f"/api/v1/pedidos/orders/customer/{customer_id}", params={"limit": 2})).json()
+        second = (await client.get(
+            f"/api/v1/pedidos/orders/customer/{customer_id}",
+            params={"limit": 2, "cursor": first["next_cursor"]}
+        )).json()
+
+        assert len(first["orders"]) == 2
+        assert len(second["orders"]) == 1
+        assert second["next_cursor"] is None
+        first_ids = {o["order_id"] for o in first["orders"]}
+        assert second["orders"][0]["order_id"] not in first_ids
@@ -145,3 +145,23 @@ class TestPedidosAPI:
         assert data["customer_id"] == customer_id
         assert len(data["orders"]) >= 2
         assert data["total"] >= 2
+
+    async def test_place_order_unknown_product(self, client: AsyncClient):
+        """Debe responder 404 si algún producto del pedido no existe."""
+        prod_res = await client.post("/api/v1/catalogo/products", json={
+            "sku": "MISSING-001", "name": "Existing Product", "price": 5.0, "initial_stock": 10
+        })
+        product_id = prod_res.json()["product_id"]
+        
+        response = await client.post("/api/v1/pedidos/orders", json={
+            "customer_info": {"customer_id": "C-MISSING", "name": "User Name", "email": "e@e.com", "phone": "1342345"},
+            "items": [
+                {"product_id": product_id, "quantity": 1},
+                {"product_id": "123e4567-e89b-12d3-a456-426614174999", "quantity": 1}
+            ],
+            "shipping_address": {"street": "Street 123", "city": "City Name", "state": "State", "postal_code": "12345", "country": "Country"}
+        })
+        
+        assert response.status_code == 404
+        stock = (await client.get(f"/api/v1/catalogo/products/{product_id}")).json()["stock"]
+        assert stock == 10
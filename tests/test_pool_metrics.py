@@ -0,0 +1,51 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core import pool_metrics
+from src.core.pool_metrics import InstrumentedAsyncQueuePool, instrument_engine
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch):
+    """Registro de pools propio del test: los pools de prueba no quedan en /metrics/db-pool."""
+    monkeypatch.setattr(pool_metrics, "_registry", dict(pool_metrics._registry))
+
+
+@pytest.mark.asyncio
+class TestPoolMetrics:
+    """Tests de las métricas del pool de conexiones."""
+    
+    async def test_tracks_checked_out_and_idle_connections(self, isolated_registry):
+        """Prueba que las métricas reflejan conexiones prestadas y ociosas."""
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_logging_name="test-pool",
+            pool_size=2,
+            max_overflow=1
+        )
+        metrics = instrument_engine(engine, "test-pool")
+        
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            during = metrics.snapshot()
+        after = metrics.snapshot()
+        await engine.dispose()
+        
+        assert during["checked_out"] == 1
+        assert during["pool_size"] == 2
+        assert during["max_overflow"] == 1
+        assert after["checked_out"] == 0
+        assert after["idle"] == 1
+        assert after["checkouts"] == 1
+        assert after["checkout_wait_ms"]["count"] == 1
+    
+    async def test_metrics_endpoint(self, client: AsyncClient):
+        """Prueba que el endpoint expone el pool principal."""
+        response = await client.get("/metrics/db-pool")
+        
+        assert response.status_code == 200
+        assert "primary" in response.json()
+        assert "test-pool" not in response.json()
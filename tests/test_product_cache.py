@@ -0,0 +1,303 @@
+import copy
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.cache import MISSING, TTLCache, invalidate_on_commit
+from src.core.database import create_session_factory
+from src.core.etag import make_etag
+from src.core.exceptions import PreconditionFailedError
+from src.modules.catalogo.application.features.get_product.response import GetProductResponse
+from src.modules.catalogo.application.features.update_product.command import UpdateProductCommand
+from src.modules.catalogo.application.features.update_product.use_case import UpdateProductUseCase
+from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.domain.value_objects import SKU
+from src.modules.catalogo.infrastructure.cached_queries import CachedProductQueries
+from src.modules.catalogo.infrastructure.cached_repository import CachedProductRepository
+
+
+class FakeSession:
+    """Sesión mínima: solo se usa su diccionario info."""
+
+    def __init__(self):
+        self.info = {}
+
+
+class CountingRepository:
+    """Repositorio en memoria que cuenta las consultas a la base de datos."""
+
+    def __init__(self, *products: Product):
+        self.session = FakeSession()
+        self.products = {p.product_id: p for p in products}
+        self.queries = 0
+
+    async def get_by_id(self, product_id):
+        self.queries += 1
+        return self.products.get(product_id)
+
+    async def get_version(self, product_id):
+        self.queries += 1
+        product = self.products.get(product_id)
+        return product.version if product else None
+
+    async def get_by_ids(self, product_ids):
+        self.queries += 1
+        return {pid: self.products[pid] for pid in product_ids if pid in self.products}
+
+    async def get_by_sku(self, sku):
+        self.queries += 1
+        return next((p for p in self.products.values() if str(p.sku) == str(sku)), None)
+
+    async def update(self, product):
+        self.products[product.product_id] = product
+        return product
+
+
+class CountingQueries:
+    """Consultas en memoria que cuentan los accesos a la base de datos."""
+
+    def __init__(self, *products: Product):
+        self.session = FakeSession()
+        self.details = {p.product_id: _detail(p) for p in products}
+        self.queries = 0
+
+    async def get_by_id(self, product_id, version=None):
+        self.queries += 1
+        return self.details.get(product_id)
+
+    async def get_by_sku(self, sku):
+        self.queries += 1
+        return next((d for d in self.details.values() if d.sku == sku), None)
+
+
+def _detail(product: Product) -> GetProductResponse:
+    return GetProductResponse(
+        product_id=product.product_id, sku=str(product.sku), name=product.name, description="",
+        price=product.price.amount, currency=product.price.currency, stock=product.stock.quantity,
+        is_active=product.is_active, created_at=datetime.utcnow(), updated_at=datetime.utcnow(), version=1
+    )
+
+
+def _cache(**overrides) -> TTLCache:
+    options = {"max_size": 100, "ttl_seconds": 60, "negative_ttl_seconds": 60}
+    options.update(overrides)
+    return TTLCache("test", **options)
+
+
+class TestTTLCache:
+    """Tests de la caché LRU con TTL."""
+
+    def test_lru_eviction(self):
+        """Al superar el tamaño se desaloja la entrada menos usada."""
+        cache = _cache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.evictions == 1
+
+    def test_ttl_expiration(self, monkeypatch):
+        """Las entradas caducan al cumplirse el TTL."""
+        now = [1000.0]
+        monkeypatch.setattr("src.core.cache.time.monotonic", lambda: now[0])
+        cache = _cache(ttl_seconds=10)
+        cache.set("a", 1)
+
+        now[0] += 11
+
+        assert cache.get("a") == (False, None)
+        assert cache.expirations == 1
+
+    def test_negative_entries(self):
+        """Las búsquedas sin resultado se cachean con su propio TTL."""
+        cache = _cache(negative_ttl_seconds=0)
+        cache.set("missing", MISSING)
+
+        assert cache.get("missing") == (False, None)
+
+
+@pytest.mark.asyncio
+class TestCachedProductRepository:
+    """Tests del repositorio de productos con caché de lectura."""
+
+    async def test_get_by_id_is_served_from_cache(self, make_product):
+        """La segunda lectura no consulta la base de datos."""
+        product = make_product("CACHE-001")
+        inner = CountingRepository(product)
+        repository = CachedProductRepository(inner, _cache())
+
+        await repository.get_by_id(product.product_id)
+        cached = await repository.get_by_id(product.product_id)
+
+        assert cached == product
+        assert inner.queries == 1
+
+    async def test_returns_copies(self, make_product):
+        """Mutar la entidad devuelta no altera la caché."""
+        product = make_product("CACHE-001")
+        repository = CachedProductRepository(CountingRepository(product), _cache())
+
+        first = await repository.get_by_id(product.product_id)
+        first.name = "Modificado"
+
+        assert (await repository.get_by_id(product.product_id)).name == "Producto"
+
+    async def test_misses_are_cached(self):
+        """Un producto inexistente no se vuelve a consultar."""
+        inner = CountingRepository()
+        repository = CachedProductRepository(inner, _cache())
+        missing_id = uuid.uuid4()
+
+        assert await repository.get_by_id(missing_id) is None
+        assert await repository.get_by_id(missing_id) is None
+        assert inner.queries == 1
+
+    async def test_sku_lookup_reuses_id_entry(self, make_product):
+        """get_by_sku aprovecha los productos cacheados por ID."""
+        product = make_product("CACHE-SKU")
+        inner = CountingRepository(product)
+        repository = CachedProductRepository(inner, _cache())
+
+        await repository.get_by_id(product.product_id)
+        found = await repository.get_by_sku(SKU("CACHE-SKU"))
+
+        assert found.product_id == product.product_id
+        assert inner.queries == 1
+
+    async def test_get_by_ids_queries_only_missing(self, make_product):
+        """get_by_ids consulta solo los productos que no están en caché."""
+        first, second = make_product("CACHE-A"), make_product("CACHE-B")
+        inner = CountingRepository(first, second)
+        repository = CachedProductRepository(inner, _cache())
+        await repository.get_by_id(first.product_id)
+
+        products = await repository.get_by_ids([first.product_id, second.product_id])
+
+        assert set(products) == {first.product_id, second.product_id}
+        assert inner.queries == 2
+        await repository.get_by_ids([first.product_id, second.product_id])
+        assert inner.queries == 2
+
+    async def test_update_invalidates_entry(self, make_product):
+        """Una escritura invalida la entrada del producto."""
+        product = make_product("CACHE-001")
+        inner = CountingRepository(product)
+        repository = CachedProductRepository(inner, _cache())
+        await repository.get_by_id(product.product_id)
+
+        await repository.update(product)
+
+        assert repository.cache.get(("id", product.product_id)) == (False, None)
+
+    async def test_session_with_writes_bypasses_cache(self, make_product):
+        """Tras escribir, la sesión lee de la base de datos (ve sus propios cambios)."""
+        product = make_product("CACHE-001")
+        inner = CountingRepository(product)
+        repository = CachedProductRepository(inner, _cache())
+        await repository.get_by_id(product.product_id)
+
+        inner.session.info["has_writes"] = True
+        await repository.get_by_id(product.product_id)
+
+        assert inner.queries == 2
+
+    async def test_if_match_ignores_stale_cache(self, make_product):
+        """La precondición If-Match usa la versión de la base de datos, no la cacheada."""
+        product = make_product("CACHE-001")
+        inner = CountingRepository(product)
+        repository = CachedProductRepository(inner, _cache())
+        await repository.get_by_id(product.product_id)
+        # Otro worker actualiza el producto: la caché de este proceso sigue en la versión 1
+        written = copy.copy(product)
+        written.version = 2
+        inner.products[product.product_id] = written
+        use_case = UpdateProductUseCase(repository)
+        command = UpdateProductCommand(product_id=product.product_id, name="Renombrado")
+
+        with pytest.raises(PreconditionFailedError):
+            await use_case.execute(command, if_match=make_etag(product.product_id, 1))
+        updated = await use_case.execute(command, if_match=make_etag(product.product_id, 2))
+
+        assert updated.name == "Renombrado"
+
+
+@pytest.mark.asyncio
+class TestCachedProductQueries:
+    """Tests de la caché del detalle de producto (lado de consultas)."""
+
+    async def test_detail_is_served_from_cache(self, make_product):
+        """Por ID y por SKU, la segunda lectura no consulta la base de datos."""
+        product = make_product("CACHE-DETAIL")
+        inner = CountingQueries(product)
+        queries = CachedProductQueries(inner, _cache())
+
+        await queries.get_by_id(product.product_id)
+        by_id = await queries.get_by_id(product.product_id)
+        by_sku = await queries.get_by_sku("CACHE-DETAIL")
+
+        assert by_id == by_sku == inner.details[product.product_id]
+        assert inner.queries == 1
+
+    async def test_repository_writes_invalidate_details(self, make_product):
+        """Una escritura del repositorio invalida el detalle con las mismas claves."""
+        product = make_product("CACHE-001")
+        detail_cache = _cache()
+        queries = CachedProductQueries(CountingQueries(product), detail_cache)
+        repository = CachedProductRepository(CountingRepository(product), _cache(), detail_cache)
+        await queries.get_by_id(product.product_id)
+
+        await repository.update(product)
+
+        assert detail_cache.get(("id", product.product_id)) == (False, None)
+        assert detail_cache.get(("sku", str(product.sku))) == (False, None)
+
+    async def test_session_with_writes_bypasses_cache(self, make_product):
+        """Tras escribir, la sesión lee de la base de datos."""
+        product = make_product("CACHE-001")
+        inner = CountingQueries(product)
+        queries = CachedProductQueries(inner, _cache())
+        await queries.get_by_id(product.product_id)
+
+        inner.session.info["has_writes"] = True
+        await queries.get_by_id(product.product_id)
+
+        assert inner.queries == 2
+
+    async def test_stale_detail_is_revalidated_against_version(self, make_product):
+        """Con la versión actual, una copia cacheada anterior (escrita por otro worker) se relee."""
+        product = make_product("CACHE-001")
+        inner = CountingQueries(product)
+        queries = CachedProductQueries(inner, _cache())
+        await queries.get_by_id(product.product_id, 1)
+        inner.details[product.product_id] = inner.details[product.product_id].model_copy(update={"version": 2})
+
+        assert (await queries.get_by_id(product.product_id, 1)).version == 1
+        assert (await queries.get_by_id(product.product_id, 2)).version == 2
+        assert (await queries.get_by_id(product.product_id, 2)).version == 2
+        assert inner.queries == 2
+
+
+@pytest.mark.asyncio
+class TestInvalidateOnCommit:
+    """Tests de la invalidación al confirmar la transacción."""
+
+    async def test_commit_invalidates_again(self, tmp_path):
+        """Lo cacheado durante la transacción se descarta al hacer commit."""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'cache.db'}")
+        cache = _cache()
+        try:
+            async with create_session_factory(engine)() as session:
+                await session.connection()
+                invalidate_on_commit(session, cache, ["key"])
+                cache.set("key", "valor anterior")  # otro request recachea antes del commit
+
+                await session.commit()
+
+            assert cache.get("key") == (False, None)
+        finally:
+            await engine.dispose()
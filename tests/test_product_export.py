@@ -0,0 +1,79 @@
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.catalogo.application.features.export_products.command import ExportProductsCommand
+from src.modules.catalogo.application.features.export_products.formatters import EXPORT_COLUMNS
+from src.modules.catalogo.application.features.export_products.use_case import ExportProductsUseCase
+from src.modules.catalogo.infrastructure.queries import SQLAlchemyProductQueries
+
+
+PRODUCTS = "/api/v1/catalogo/products"
+EXPORT = "/api/v1/catalogo/products/export"
+
+
+async def _create_products(client: AsyncClient, prefix: str, count: int) -> list:
+    created = []
+    for i in range(count):
+        response = await client.post(
+            PRODUCTS, json={"sku": f"{prefix}-{i:04d}", "name": f"Exportado {i}", "price": 2.5, "initial_stock": i}
+        )
+        created.append(response.json())
+    return created
+
+
+@pytest.mark.asyncio
+class TestExportProductsUseCase:
+    """Tests de la exportación por lotes desde el cursor del servidor."""
+
+    async def test_reads_the_cursor_in_batches(self, client: AsyncClient, session: AsyncSession):
+        """Cada lote del cursor se codifica en un bloque; la cabecera CSV va primero."""
+        await _create_products(client, "BATCHX", 5)
+        use_case = ExportProductsUseCase(SQLAlchemyProductQueries(session), batch_size=2)
+
+        chunks = [chunk async for chunk in use_case.execute(ExportProductsCommand(format="csv"))]
+
+        assert chunks[0] == (",".join(EXPORT_COLUMNS) + "\n").encode()
+        assert [chunk.count(b"\n") for chunk in chunks[1:]] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+class TestExportProductsEndpoint:
+    """Tests del endpoint de exportación del catálogo."""
+
+    async def test_ndjson_excludes_deleted_products(self, client: AsyncClient):
+        """Exporta los no borrados (también los desactivados), en orden de creación."""
+        created = await _create_products(client, "EXPND", 4)
+        await client.delete(f"{PRODUCTS}/{created[1]['product_id']}", params={"logical": False})
+        await client.delete(f"{PRODUCTS}/{created[3]['product_id']}")
+
+        response = await client.get(EXPORT)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["sku"] for row in rows] == ["EXPND-0000", "EXPND-0002", "EXPND-0003"]
+        assert set(rows[0]) == set(EXPORT_COLUMNS)
+        assert (rows[1]["stock"], rows[2]["is_active"]) == (2, False)
+
+    async def test_csv_export(self, client: AsyncClient):
+        """El CSV lleva cabecera y fechas en ISO 8601."""
+        created = await _create_products(client, "EXPCSV", 2)
+
+        response = await client.get(EXPORT, params={"format": "csv"})
+
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="products.csv"' in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["product_id"] for row in rows] == [product["product_id"] for product in created]
+        assert rows[0]["price"] == "2.5" and "T" in rows[0]["created_at"]
+
+    async def test_rejects_unknown_format(self, client: AsyncClient):
+        """Solo se aceptan ndjson y csv."""
+        response = await client.get(EXPORT, params={"format": "xml"})
+
+        assert response.status_code == 422
@@ -0,0 +1,196 @@
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.exceptions import ValidationError
+from src.core.unit_of_work import SQLAlchemyUnitOfWork
+from src.modules.catalogo.application.features.import_products.command import ImportProductsCommand
+from src.modules.catalogo.application.features.import_products.parsers import parse_csv, parse_ndjson
+from src.modules.catalogo.application.features.import_products.use_case import ImportProductsUseCase
+from src.modules.catalogo.domain.factories import ProductFactory
+from src.modules.catalogo.domain.value_objects import SKU
+from src.modules.catalogo.infrastructure.autocomplete_index import AutocompleteIndex
+from src.modules.catalogo.infrastructure.indexed_repository import IndexedProductRepository
+from src.modules.catalogo.infrastructure.models import ProductModel
+from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
+from src.modules.catalogo.infrastructure.search_index import ProductSearchIndex
+
+
+IMPORT = "/api/v1/catalogo/products/import"
+PRODUCTS = "/api/v1/catalogo/products"
+
+
+@pytest.fixture
+async def delete_imported(session: AsyncSession):
+    """La importación confirma cada lote: el rollback del test no basta para limpiar."""
+    yield
+    await session.rollback()
+    await session.execute(
+        delete(ProductModel).where(or_(*(ProductModel.sku.like(f"{prefix}%") for prefix in ("BATCH-", "CSV-", "ND-"))))
+    )
+    await session.commit()
+
+
+async def _chunks(data: bytes, size: int = 7):
+    """Cuerpo partido en bloques pequeños (cortan líneas y caracteres multibyte)."""
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def _rows(parser, data: bytes):
+    return [row async for row in parser(_chunks(data))]
+
+
+@pytest.mark.asyncio
+class TestImportParsers:
+    """Tests de la lectura incremental de CSV y NDJSON."""
+
+    async def test_csv_with_bom_crlf_and_multiline_fields(self):
+        """Los registros conservan su línea inicial aunque un campo ocupe varias líneas."""
+        data = (
+            "\ufeffsku,name,price,description\r\n"
+            "IMP-0001,Lámpara,10.5,\"Luz cálida,\r\nregulable\"\r\n"
+            "\r\n"
+            "IMP-0002,Mesa,20\r\n"
+        ).encode()
+
+        rows = await _rows(parse_csv, data)
+
+        assert [row.line for row in rows] == [2, 5]
+        assert rows[0].data == {"sku": "IMP-0001", "name": "Lámpara", "price": "10.5", "description": "Luz cálida,\nregulable"}
+        assert rows[1].error == "Se esperaban 4 columnas y hay 3"
+
+    async def test_csv_requires_columns(self):
+        """Sin las columnas obligatorias el archivo completo se rechaza."""
+        with pytest.raises(ValidationError):
+            await _rows(parse_csv, b"sku,name\nIMP-0001,Mesa\n")
+
+    async def test_ndjson_reports_invalid_lines(self):
+        """Las líneas que no son objetos JSON se reportan sin detener la lectura."""
+        data = b'{"sku": "IMP-0001"}\n{roto\n\n[1, 2]\n{"sku": "IMP-0002"}'
+
+        rows = await _rows(parse_ndjson, data)
+
+        assert [(row.line, row.error is None) for row in rows] == [(1, True), (2, False), (4, False), (5, True)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("delete_imported")
+class TestImportProductsUseCase:
+    """Tests del caso de uso de importación por lotes."""
+
+    async def test_one_write_and_one_commit_per_batch(self, session: AsyncSession, monkeypatch):
+        """Cada lote se escribe con una sola operación y se confirma: lo pendiente no crece con el archivo."""
+        repository = IndexedProductRepository(SQLAlchemyProductRepository(session), index=ProductSearchIndex())
+        unit_of_work = SQLAlchemyUnitOfWork(session)
+        writes, pending = [], []
+        save_many, commit = repository.save_many, unit_of_work.commit
+
+        async def spy_save_many(products):
+            writes.append(len(products))
+            return await save_many(products)
+
+        async def spy_commit():
+            pending.append(sum(len(upserts) for _, upserts, _, _ in session.info["product_index_changes"]))
+            await commit()
+
+        monkeypatch.setattr(repository, "save_many", spy_save_many)
+        monkeypatch.setattr(unit_of_work, "commit", spy_commit)
+
+        lines = "\n".join(f'{{"sku": "BATCH-{i:04d}", "name": "Producto {i}", "price": 3}}' for i in range(5))
+        use_case = ImportProductsUseCase(repository, batch_size=2, unit_of_work=unit_of_work)
+
+        result = await use_case.execute(ImportProductsCommand(format="ndjson", content=_chunks(lines.encode())))
+
+        assert result.imported == 5
+        assert writes == [2, 2, 1]
+        assert pending == [2, 2, 1]
+        assert "product_index_changes" not in session.info
+
+    async def test_existing_skus_are_skipped_not_failed(self, session: AsyncSession):
+        """Un SKU ya en uso se omite en la misma escritura (ON CONFLICT) en lugar de abortar el lote."""
+        repository = SQLAlchemyProductRepository(session)
+        await repository.save(ProductFactory.create_from_primitives("BATCH-TAKEN", "Existente", "", 1.0, "USD", 1))
+        products = [
+            ProductFactory.create_from_primitives(sku, "Nuevo", "", 2.0, "USD", 1) for sku in ("BATCH-TAKEN", "BATCH-FREE")
+        ]
+
+        assert await repository.save_many(products) == {"BATCH-FREE"}
+        assert (await repository.get_by_sku(SKU("BATCH-TAKEN"))).name == "Existente"
+        assert await repository.save_many([]) == set()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("delete_imported")
+class TestImportProductsEndpoint:
+    """Tests del endpoint de importación masiva."""
+
+    async def test_csv_import_reports_rejections_by_line(self, client: AsyncClient):
+        """Los válidos se guardan; los inválidos, repetidos o existentes se reportan por línea."""
+        await client.post(PRODUCTS, json={"sku": "CSV-EXIST", "name": "Existente", "price": 1.0})
+        body = (
+            "sku,name,price,initial_stock\n"
+            "csv-0001,Silla,15.90,4\n"
+            "CSV-0002,Mesa,-3,1\n"
+            "CSV-0001,Silla repetida,15.90,1\n"
+            "CSV-EXIST,Existente,1,1\n"
+            "CSV-0003,Sofá,300,\n"
+        )
+
+        response = await client.post(IMPORT, content=body.encode(), headers={"Content-Type": "text/csv"})
+
+        assert response.status_code == 200
+        result = response.json()
+        assert (result["received"], result["imported"]) == (5, 2)
+        assert [(r["line"], r["sku"]) for r in result["rejected"]] == [
+            (3, "CSV-0002"), (4, "CSV-0001"), (5, "CSV-EXIST")
+        ]
+        assert result["rejected"][0]["error"].startswith("price:")
+
+        imported = (await client.get(f"{PRODUCTS}/sku/CSV-0001")).json()
+        assert (imported["name"], imported["stock"], imported["version"]) == ("Silla", 4, 1)
+        assert (await client.get(f"{PRODUCTS}/sku/CSV-0003")).json()["stock"] == 0
+
+    async def test_ndjson_import(self, client: AsyncClient, session: AsyncSession):
+        """NDJSON con Content-Type application/x-ndjson; el lote queda confirmado."""
+        body = b'{"sku": "ND-0001", "name": "Cojin", "price": 9.99, "currency": "EUR"}\nno es json\n'
+
+        response = await client.post(IMPORT, content=body, headers={"Content-Type": "application/x-ndjson"})
+        await session.rollback()
+
+        result = response.json()
+        assert (result["imported"], [r["line"] for r in result["rejected"]]) == (1, [2])
+        assert (await client.get(f"{PRODUCTS}/sku/ND-0001")).json()["currency"] == "EUR"
+
+    async def test_unsupported_media_type(self, client: AsyncClient):
+        """Otros formatos responden 415; un CSV sin cabecera válida, 400."""
+        unsupported = await client.post(IMPORT, content=b"{}", headers={"Content-Type": "application/json"})
+        no_header = await client.post(IMPORT, content=b"a,b\n1,2\n", headers={"Content-Type": "text/csv"})
+
+        assert unsupported.status_code == 415
+        assert no_header.status_code == 400
+
+
+class TestAutocompleteBulkAdd:
+    """Tests de la indexación en bloque del autocompletado."""
+
+    def test_bulk_add_matches_one_by_one(self):
+        """Ordenar una vez da el mismo índice que insertar producto a producto."""
+        products = [
+            ProductFactory.create_from_primitives(f"BULK-{i:04d}", f"Producto {i % 7}", "", 1.0, "USD", 1)
+            for i in range(AutocompleteIndex.BULK_THRESHOLD + 10)
+        ]
+        bulk, single = AutocompleteIndex(), AutocompleteIndex()
+        single.add_entry(products[0].product_id, "VIEJO-1", "Viejo", popularity=5)
+        bulk.add_entry(products[0].product_id, "VIEJO-1", "Viejo", popularity=5)
+
+        bulk.add_many(products)
+        for product in products:
+            single.add(product)
+
+        assert bulk._entries == single._entries
+        assert bulk.suggest("producto", 3) == single.suggest("producto", 3)
+        assert bulk.suggest("bulk-0000")[0].popularity == 5
+        assert not bulk.suggest("viejo")
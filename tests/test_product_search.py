@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.dialects import postgresql
+
+from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
+
+
+class RecordingSession:
+    """Sesión falsa con dialecto PostgreSQL que captura la sentencia ejecutada."""
+
+    def __init__(self):
+        self.bind = SimpleNamespace(dialect=postgresql.dialect())
+        self.statement = None
+
+    async def execute(self, statement):
+        self.statement = statement
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: []))
+
+
+@pytest.mark.asyncio
+class TestFullTextSearchQuery:
+    """Tests de la consulta de texto completo en PostgreSQL."""
+
+    async def test_uses_search_vector_and_rank(self):
+        """La búsqueda filtra con el índice GIN, ordena por relevancia y respeta el precio."""
+        session = RecordingSession()
+
+        await SQLAlchemyProductRepository(session).search(query="zapato rojo", min_price=10, limit=5)
+
+        sql = str(session.statement.compile(dialect=postgresql.dialect()))
+        assert "products.search_vector @@ websearch_to_tsquery" in sql
+        assert "ORDER BY ts_rank(products.search_vector" in sql
+        assert "ILIKE" not in sql
+        assert "products.price_amount >=" in sql
+
+
+@pytest.mark.asyncio
+class TestProductSearchAPI:
+    """Tests del endpoint de búsqueda (fallback ILIKE en SQLite)."""
+
+    async def _create(self, client: AsyncClient, sku: str, name: str, price: float):
+        await client.post("/api/v1/catalogo/products", json={
+            "sku": sku, "name": name, "description": "Artículo de búsqueda", "price": price, "initial_stock": 1
+        })
+
+    async def test_search_by_text_and_price(self, client: AsyncClient):
+        """Combina el texto con el rango de precios."""
+        await self._create(client, "SRCH-1", "Lámpara Halógena", 10.0)
+        await self._create(client, "SRCH-2", "Lámpara Halógena XL", 50.0)
+        await self._create(client, "SRCH-3", "Mesa de noche", 10.0)
+
+        response = await client.get("/api/v1/catalogo/products/search", params={"q": "halógena", "max_price": 20})
+
+        assert response.status_code == 200
+        assert [p["sku"] for p in response.json()] == ["SRCH-1"]
+
+    async def test_search_by_sku(self, client: AsyncClient):
+        """El SKU también es buscable."""
+        await self._create(client, "SRCH-SKU-9", "Producto por SKU", 5.0)
+
+        response = await client.get("/api/v1/catalogo/products/search", params={"q": "SRCH-SKU"})
+
+        assert [p["sku"] for p in response.json()] == ["SRCH-SKU-9"]
+
+    async def test_invalid_price_range(self, client: AsyncClient):
+        """Un rango de precios invertido responde 400."""
+        response = await client.get("/api/v1/catalogo/products/search", params={"min_price": 20, "max_price": 10})
+
+        assert response.status_code == 400
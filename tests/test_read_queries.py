@@ -0,0 +1,92 @@
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.catalogo.api.mappers import ProductDTOMapper
+from src.modules.catalogo.infrastructure.queries import SQLAlchemyProductQueries
+from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
+from src.modules.pedidos.infrastructure.queries import SQLAlchemyOrderQueries
+from src.modules.pedidos.infrastructure.repositories import SQLAlchemyOrderRepository
+
+
+@pytest.mark.asyncio
+class TestProductQueries:
+    """Tests de las proyecciones de productos (lado de lectura)."""
+
+    async def test_projection_matches_domain_mapping(self, session: AsyncSession, make_product):
+        """El DTO proyectado desde la fila es igual al construido desde la entidad."""
+        repository = SQLAlchemyProductRepository(session)
+        product = await repository.save(make_product("QRY-0001", "Consulta", price=12.5, stock=4, currency="EUR"))
+        queries = SQLAlchemyProductQueries(session)
+
+        by_id = await queries.get_by_id(product.product_id)
+        by_sku = await queries.get_by_sku("QRY-0001")
+
+        assert by_id == ProductDTOMapper.domain_to_get_response(product)
+        assert by_sku == by_id
+        assert await queries.get_by_id(uuid.uuid4()) is None
+
+    async def test_list_skips_deleted_products(self, session: AsyncSession, make_product):
+        """El listado excluye los productos borrados y pagina por cursor."""
+        repository = SQLAlchemyProductRepository(session)
+        kept = await repository.save(make_product("QRY-0002", "Visible"))
+        deleted = await repository.save(make_product("QRY-0003", "Borrado"))
+        await repository.delete(deleted.product_id)
+        queries = SQLAlchemyProductQueries(session)
+
+        ids, cursor = [], None
+        while True:
+            page = await queries.list_products(cursor, limit=1)
+            ids.extend(p.product_id for p in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert kept.product_id in ids
+        assert deleted.product_id not in ids
+
+
+@pytest.mark.asyncio
+class TestOrderQueries:
+    """Tests de las proyecciones de órdenes (lado de lectura)."""
+
+    async def test_get_by_id_with_items(self, session: AsyncSession, make_order):
+        """La orden proyectada incluye sus items en orden, con subtotal y estado."""
+        order = await SQLAlchemyOrderRepository(session).save(make_order(2, 3, customer_id="QRY-CUST-1", unit_price=3.33))
+
+        dto = await SQLAlchemyOrderQueries(session).get_by_id(order.order_id)
+
+        assert dto.customer_id == "QRY-CUST-1"
+        assert dto.status == "pending"
+        assert dto.total_amount == order.total_amount
+        assert [(i.product_name, i.quantity, i.subtotal) for i in dto.items] == [
+            ("Item 0", 2, 6.66), ("Item 1", 3, 9.99)
+        ]
+        assert await SQLAlchemyOrderQueries(session).get_by_id(uuid.uuid4()) is None
+
+    async def test_customer_pages_load_items_per_order(self, session: AsyncSession, make_order):
+        """Cada orden de la página recibe solo sus propios items."""
+        repository = SQLAlchemyOrderRepository(session)
+        first = await repository.save(make_order(1, customer_id="QRY-CUST-2"))
+        second = await repository.save(make_order(4, 5, customer_id="QRY-CUST-2"))
+        await repository.save(make_order(customer_id="QRY-OTHER"))
+        queries = SQLAlchemyOrderQueries(session)
+
+        page = await queries.get_by_customer("QRY-CUST-2", limit=1)
+        rest = await queries.get_by_customer("QRY-CUST-2", page.next_cursor, limit=10)
+
+        orders = {o.order_id: o for o in page.items + rest.items}
+        assert set(orders) == {first.order_id, second.order_id}
+        assert [i.quantity for i in orders[second.order_id].items] == [4, 5]
+        assert rest.next_cursor is None
+
+    async def test_list_orders_summary(self, session: AsyncSession, make_order):
+        """El listado proyecta la respuesta resumida de las órdenes."""
+        order = await SQLAlchemyOrderRepository(session).save(make_order(customer_id="QRY-CUST-3", unit_price=3.33))
+
+        page = await SQLAlchemyOrderQueries(session).list_orders(limit=1000)
+
+        summary = next(o for o in page.items if o.order_id == order.order_id)
+        assert summary.customer_name == "Cliente"
+        assert summary.items[0].subtotal == 3.33
@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.core.database import ReplicaRouter, ReadYourWritesTracker, session_has_writes
+from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.domain.value_objects import SKU, Price, Stock
+from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
+
+
+@pytest.fixture
+async def replica_engines(tmp_path):
+    """Dos archivos SQLite que hacen de réplicas de lectura."""
+    engines = [
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path / f'replica{i}.db'}")
+        for i in range(2)
+    ]
+    yield engines
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+class TestReplicaRouter:
+    """Tests de la selección de réplicas de lectura."""
+    
+    async def test_round_robin_alternates_replicas(self, replica_engines):
+        """Prueba que round-robin reparte las sesiones de forma cíclica."""
+        router = ReplicaRouter(replica_engines, ReplicaRouter.ROUND_ROBIN)
+        
+        binds = [router.select()().bind for _ in range(4)]
+        
+        assert binds == [replica_engines[0], replica_engines[1], replica_engines[0], replica_engines[1]]
+    
+    async def test_least_connections_avoids_busy_replica(self, replica_engines):
+        """Prueba que least-connections elige la réplica con menos conexiones prestadas."""
+        router = ReplicaRouter(replica_engines, ReplicaRouter.LEAST_CONNECTIONS)
+        
+        async with replica_engines[0].connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            chosen = router.select()().bind
+        
+        assert chosen is replica_engines[1]
+
+
+class TestReplicaRouterConfiguration:
+    """Tests de la configuración del enrutador de réplicas."""
+    
+    def test_unknown_strategy(self):
+        """Debe rechazar estrategias desconocidas."""
+        with pytest.raises(ValueError):
+            ReplicaRouter([], "random")
+
+
+class TestReadYourWrites:
+    """Tests de la ventana de read-your-writes."""
+    
+    def test_recent_writer_reads_from_primary(self):
+        """Prueba que un cliente que acaba de escribir queda marcado."""
+        tracker = ReadYourWritesTracker(window_seconds=5)
+        tracker.mark("client-a")
+        
+        assert tracker.is_recent("client-a") is True
+        assert tracker.is_recent("client-b") is False
+    
+    def test_disabled_window(self):
+        """Con ventana 0 nunca se fuerza la lectura en el primario."""
+        tracker = ReadYourWritesTracker(window_seconds=0)
+        tracker.mark("client-a")
+        
+        assert tracker.is_recent("client-a") is False
+
+
+@pytest.mark.asyncio
+class TestWriteDetection:
+    """Tests de la detección de escrituras en la sesión."""
+    
+    async def test_session_marks_writes(self, session: AsyncSession):
+        """Prueba que una escritura marca la sesión."""
+        repository = SQLAlchemyProductRepository(session)
+        await repository.get_by_sku(SKU("RR-WRITE-001"))
+        assert session_has_writes(session) is False
+        
+        await repository.save(Product(sku=SKU("RR-WRITE-001"), name="Producto", price=Price(1.0), stock=Stock(1)))
+        
+        assert session_has_writes(session) is True
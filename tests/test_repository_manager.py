@@ -0,0 +1,74 @@
+import asyncio
+import random
+
+import pytest
+
+from src.core.container import container, request_scope
+from src.modules.catalogo.infrastructure.repository_manager import RepositoryManager
+
+
+class FakeSession:
+    """Sesión de prueba: solo importa su identidad."""
+
+    def __init__(self, request_number: int):
+        self.request_number = request_number
+
+
+@pytest.mark.asyncio
+class TestRepositoryManagerScope:
+    """Tests del registro de repositorios con alcance de request."""
+
+    async def test_same_session_reuses_repository(self):
+        """Dentro de una tarea, la misma sesión obtiene el mismo repositorio."""
+        manager = RepositoryManager()
+        session = FakeSession(0)
+
+        assert manager.get_product_repository(session) is manager.get_product_repository(session)
+
+    async def test_no_cross_talk_under_1k_parallel_requests(self):
+        """1000 requests concurrentes nunca ven la sesión ni el repositorio de otro."""
+
+        async def request(number: int):
+            session = FakeSession(number)
+            first = RepositoryManager().get_product_repository(session)
+            # Intercalar con el resto de requests antes de volver a resolver
+            for _ in range(3):
+                await asyncio.sleep(random.random() / 1000)
+                again = RepositoryManager().get_product_repository(session)
+                assert again is first
+                assert again.session is session
+            return first.session.request_number
+
+        tasks = [asyncio.create_task(request(i)) for i in range(1000)]
+        results = await asyncio.gather(*tasks)
+
+        assert results == list(range(1000))
+
+    async def test_no_cross_talk_through_request_scope(self):
+        """
+        Mismo escenario por el camino de la aplicación: la dependencia
+        request_scope abre el scope y la Facade (singleton) y el gateway de
+        inventario resuelven el repositorio de su propio request.
+        """
+        facade = container.resolve("catalogo_facade")
+
+        async def request(number: int):
+            session = FakeSession(number)
+            scope = request_scope(session=session, read_session=session)
+            await scope.__anext__()
+            try:
+                for _ in range(3):
+                    await asyncio.sleep(random.random() / 1000)
+                    # Proxy del caso de uso singleton hacia el repositorio del request
+                    assert facade._update_product.product_repository.session is session
+                    gateway = container.resolve("inventory_gateway")
+                    assert gateway.product_repository is container.resolve("product_repository")
+                    assert gateway.product_repository.session is session
+            finally:
+                await scope.aclose()
+            return number
+
+        tasks = [asyncio.create_task(request(i)) for i in range(1000)]
+        results = await asyncio.gather(*tasks)
+
+        assert results == list(range(1000))
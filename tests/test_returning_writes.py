@@ -0,0 +1,77 @@
+from contextlib import contextmanager
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.catalogo.domain.value_objects import SKU
+from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
+
+
+PRODUCTS = "/api/v1/catalogo/products"
+
+
+@contextmanager
+def count_statements(session: AsyncSession):
+    """Registra las sentencias SQL que llegan al driver mientras dura el bloque."""
+    statements = []
+    engine = session.bind.sync_engine
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+
+@pytest.mark.asyncio
+class TestSingleRoundTripWrites:
+    """Tests de las escrituras del catálogo en una sola sentencia (RETURNING)."""
+
+    async def test_save_is_one_insert_returning(self, session: AsyncSession, make_product):
+        """save retorna el producto persistido sin flush ni refresh adicionales."""
+        repository = SQLAlchemyProductRepository(session)
+        product = make_product("RET-0001")
+
+        with count_statements(session) as statements:
+            saved = await repository.save(product)
+
+        assert statements == ["INSERT"]
+        assert saved == product
+
+    async def test_save_if_sku_available(self, session: AsyncSession, make_product):
+        """Un SKU en uso no inserta nada y retorna None, en la misma sentencia."""
+        repository = SQLAlchemyProductRepository(session)
+        await repository.save(make_product("RET-0002"))
+
+        with count_statements(session) as statements:
+            duplicate = await repository.save_if_sku_available(make_product("RET-0002"))
+
+        assert duplicate is None
+        assert statements == ["INSERT"]
+        assert (await repository.save_if_sku_available(make_product("RET-0003"))).sku == SKU("RET-0003")
+
+    async def test_create_product_uses_a_single_statement(self, client: AsyncClient, session: AsyncSession):
+        """POST /products sin comprobación previa del SKU."""
+        with count_statements(session) as statements:
+            response = await client.post(PRODUCTS, json={"sku": "RET-0004", "name": "Producto", "price": 1.0})
+
+        assert response.status_code == 201
+        assert statements == ["INSERT"]
+
+    async def test_sku_of_deleted_product_is_a_business_error(self, client: AsyncClient, session: AsyncSession, make_product):
+        """El índice único cubre también los borrados: se responde 422, no un error de integridad."""
+        repository = SQLAlchemyProductRepository(session)
+        product = await repository.save(make_product("RET-0005"))
+        with count_statements(session) as statements:
+            assert await repository.delete(product.product_id)
+
+        response = await client.post(PRODUCTS, json={"sku": "RET-0005", "name": "Producto", "price": 1.0})
+
+        assert statements == ["UPDATE"]
+        assert response.status_code == 422
+        assert not await repository.delete(product.product_id)
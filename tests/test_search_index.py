@@ -0,0 +1,121 @@
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.database import Base, create_session_factory
+from src.modules.catalogo.infrastructure.indexed_repository import IndexedProductRepository, load_search_index
+from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
+from src.modules.catalogo.infrastructure.search_index import ProductSearchIndex, tokenize
+
+
+def _skus(products):
+    return [str(p.sku) for p in products]
+
+
+class TestProductSearchIndex:
+    """Tests del índice invertido en memoria."""
+
+    def test_tokenize_normalizes_spanish_text(self):
+        """Sin tildes, en minúsculas y sin palabras vacías."""
+        assert tokenize("Canción de la Montaña, AÑO 2024") == ["cancion", "montana", "ano", "2024"]
+
+    def test_ranks_name_above_description(self, make_product):
+        """Una coincidencia en el nombre pesa más que en la descripción."""
+        index = ProductSearchIndex()
+        index.add_many([
+            make_product("IDX-1", "Mesa", "Acompaña a la silla plegable"),
+            make_product("IDX-2", "Silla plegable", "Para exteriores"),
+        ])
+
+        assert _skus(index.search("silla")) == ["IDX-2", "IDX-1"]
+
+    def test_all_terms_required(self, make_product):
+        """Cada término de la consulta debe aparecer en el producto."""
+        index = ProductSearchIndex()
+        index.add_many([make_product("IDX-1", "Lámpara roja"), make_product("IDX-2", "Lámpara azul")])
+
+        assert _skus(index.search("lampara ROJA")) == ["IDX-1"]
+        assert index.search("lámpara verde") == []
+
+    def test_price_range_is_inclusive(self, make_product):
+        """El rango de precio incluye sus extremos."""
+        index = ProductSearchIndex()
+        index.add_many([
+            make_product("IDX-1", "Taza", price=5.0),
+            make_product("IDX-2", "Taza grande", price=10.0),
+            make_product("IDX-3", "Taza enorme", price=20.0),
+        ])
+
+        assert sorted(_skus(index.search("taza", min_price=5, max_price=10))) == ["IDX-1", "IDX-2"]
+        assert _skus(index.search(max_price=5)) == ["IDX-1"]
+
+    def test_incremental_update_and_remove(self, make_product):
+        """Reindexar reemplaza los términos anteriores; remove quita el producto."""
+        index = ProductSearchIndex()
+        product = make_product("IDX-1", "Teclado mecánico")
+        index.add(product)
+
+        product.update_details(name="Ratón inalámbrico")
+        index.add(product)
+        assert index.search("teclado") == []
+        assert _skus(index.search("raton")) == ["IDX-1"]
+
+        index.remove(product.product_id)
+        assert index.search("raton") == [] and len(index) == 0
+
+    def test_bulk_add_keeps_price_order(self, make_product):
+        """Un lote grande se ordena una sola vez y admite reindexar productos existentes."""
+        index = ProductSearchIndex()
+        products = [make_product(f"BULK-{i:03d}", f"Vaso {i}", price=float(200 - i)) for i in range(100)]
+        index.add(products[0])
+
+        index.add_many(products)
+
+        assert len(index) == 100
+        assert index._prices == sorted(index._prices)
+        assert _skus(index.search("vaso", max_price=101)) == ["BULK-099"]
+
+
+@pytest.mark.asyncio
+class TestIndexedProductRepository:
+    """Tests del repositorio que enruta la búsqueda al índice."""
+
+    @pytest.fixture
+    async def session_factory(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'index.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield create_session_factory(engine)
+        await engine.dispose()
+
+    async def test_writes_reach_index_on_commit_only(self, session_factory, make_product):
+        """El índice solo refleja transacciones confirmadas."""
+        index = ProductSearchIndex()
+        index.ready = True
+
+        async with session_factory() as session:
+            repository = IndexedProductRepository(SQLAlchemyProductRepository(session), index)
+            await repository.save(make_product("IDX-RB", "Producto descartado"))
+            await session.rollback()
+
+            await repository.save(make_product("IDX-OK", "Producto confirmado"))
+            assert len(index) == 0
+            await session.commit()
+
+        assert _skus(index.search("producto")) == ["IDX-OK"]
+
+    async def test_load_and_route_search(self, session_factory, make_product):
+        """Tras la carga, la búsqueda se resuelve en memoria."""
+        async with session_factory() as session:
+            await SQLAlchemyProductRepository(session).save(make_product("IDX-LOAD", "Cafetera italiana"))
+            await session.commit()
+
+        index = ProductSearchIndex()
+        await load_search_index(session_factory, index, batch_size=1)
+
+        async with session_factory() as session:
+            repository = IndexedProductRepository(SQLAlchemyProductRepository(session), index)
+            found = await repository.search("cafetera")
+
+        assert index.ready
+        assert _skus(found) == ["IDX-LOAD"]
+        assert index.searches == 1
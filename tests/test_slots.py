@@ -0,0 +1,65 @@
+import copy
+import dataclasses
+
+import pytest
+
+from src.core.hydration import hydrate
+from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.domain.value_objects import SKU, Price, Stock, ProductSuggestion
+from src.modules.pedidos.domain.entities import Order, OrderItem
+from src.modules.pedidos.domain.value_objects import Address, CustomerInfo, Quantity
+from src.modules.usuarios.domain.entities import Permission, Role, User
+
+
+DOMAIN_CLASSES = [
+    Product, SKU, Price, Stock, ProductSuggestion,
+    Order, OrderItem, Quantity, Address, CustomerInfo,
+    User, Role, Permission,
+]
+
+
+class TestSlottedDomain:
+    """Tests de las entidades y value objects con __slots__."""
+
+    @pytest.mark.parametrize("cls", DOMAIN_CLASSES, ids=lambda cls: cls.__name__)
+    def test_declares_slots_for_every_field(self, cls):
+        """Cada clase declara un slot por campo y sus instancias no tienen __dict__."""
+        assert set(cls.__slots__) == {f.name for f in dataclasses.fields(cls)}
+        assert "__dict__" not in dir(cls)
+
+    def test_rejects_unknown_attributes(self, make_product):
+        """Asignar un atributo que no es un campo falla en lugar de crearlo."""
+        product = make_product("SLOT-001")
+
+        with pytest.raises(AttributeError):
+            product.colour = "rojo"
+
+    def test_value_objects_stay_immutable_and_comparable(self):
+        """Los VOs siguen siendo congelados, comparables por valor y hashables."""
+        price = Price(10.0)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            price.amount = 20.0
+        assert price == Price(10.0)
+        assert len({Quantity(2), Quantity(2)}) == 1
+
+    def test_entities_keep_behaviour(self, make_product):
+        """Los métodos de dominio, la copia y la igualdad funcionan igual."""
+        product = make_product("SLOT-001")
+        clone = copy.deepcopy(product)
+
+        product.reserve_stock(2)
+
+        assert product.stock.quantity == 3
+        assert clone.stock.quantity == 5
+        assert clone == copy.copy(clone)
+        assert dataclasses.replace(product, name="Otro").name == "Otro"
+
+    def test_hydrate_slotted_entity(self):
+        """La hidratación de confianza escribe en los slots."""
+        product = hydrate(
+            Product, sku=hydrate(SKU, value="SLOT-002"), name="Hidratado", price=hydrate(Price, amount=1.0)
+        )
+
+        assert product.sku.value == "SLOT-002"
+        assert product.stock == Stock(0)
@@ -0,0 +1,83 @@
+import pytest
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.exceptions import BusinessRuleViolation, NotFoundError
+from src.modules.catalogo.domain.entities import Product
+from src.modules.catalogo.domain.value_objects import SKU, Price, Stock
+from src.modules.catalogo.infrastructure.repositories import SQLAlchemyProductRepository
+from src.modules.catalogo.application.features.reserve_stock.command import (
+    ReserveStockCommand, ReserveStockItemCommand
+)
+from src.modules.catalogo.application.features.reserve_stock.use_case import ReserveStockUseCase
+
+
+async def _create_product(repository: SQLAlchemyProductRepository, sku: str, stock: int) -> Product:
+    return await repository.save(Product(
+        product_id=uuid4(),
+        sku=SKU(sku),
+        name=f"Producto {sku}",
+        description="",
+        price=Price(10.0),
+        stock=Stock(stock)
+    ))
+
+
+def _command(*items) -> ReserveStockCommand:
+    return ReserveStockCommand(items=[
+        ReserveStockItemCommand(product_id=product_id, quantity=quantity)
+        for product_id, quantity in items
+    ])
+
+
+@pytest.mark.asyncio
+class TestReserveStockUseCase:
+    """Tests de la reserva atómica de stock."""
+    
+    async def test_reserve_stock_decrements_in_single_statement(self, session: AsyncSession):
+        """Prueba que la reserva descuenta stock e incrementa la versión."""
+        repository = SQLAlchemyProductRepository(session)
+        product = await _create_product(repository, "RSV-ATOM-001", 10)
+        
+        response = await ReserveStockUseCase(repository).execute(_command((product.product_id, 3)))
+        
+        assert response.success is True
+        assert response.products[0].remaining_stock == 7
+        stored = await repository.get_by_id(product.product_id)
+        assert stored.stock.quantity == 7
+    
+    async def test_reserve_stock_is_all_or_nothing(self, session: AsyncSession):
+        """El error revierte la transacción y con ella la reserva parcial (sin UPDATE compensatorio)."""
+        repository = SQLAlchemyProductRepository(session)
+        first = await _create_product(repository, "RSV-ATOM-002", 10)
+        second = await _create_product(repository, "RSV-ATOM-003", 1)
+        
+        # El savepoint hace de transacción de la petición, que se revierte con el error
+        with pytest.raises(BusinessRuleViolation, match="Stock insuficiente"):
+            async with session.begin_nested():
+                await ReserveStockUseCase(repository).execute(
+                    _command((first.product_id, 2), (second.product_id, 5))
+                )
+        
+        assert (await repository.get_by_id(first.product_id)).stock.quantity == 10
+        assert (await repository.get_by_id(second.product_id)).stock.quantity == 1
+    
+    async def test_reserve_stock_unknown_product(self, session: AsyncSession):
+        """Debe lanzar NotFoundError si el producto no existe."""
+        repository = SQLAlchemyProductRepository(session)
+        
+        with pytest.raises(NotFoundError):
+            await ReserveStockUseCase(repository).execute(_command((uuid4(), 1)))
+
+    
+    async def test_get_by_ids_returns_only_existing(self, session: AsyncSession):
+        """Prueba que get_by_ids resuelve varios productos en una sola llamada."""
+        repository = SQLAlchemyProductRepository(session)
+        first = await _create_product(repository, "RSV-MULTI-001", 1)
+        second = await _create_product(repository, "RSV-MULTI-002", 1)
+        missing = uuid4()
+        
+        products = await repository.get_by_ids([first.product_id, second.product_id, missing])
+        
+        assert set(products) == {first.product_id, second.product_id}
+        assert products[first.product_id].sku.value == "RSV-MULTI-001"